@@ -8,6 +8,7 @@ import discord
 from aiohttp import web
 from discord.ext import commands
 
+from core.performance.n_plus_one import n_plus_one_detector
 from utils.permissions import is_zagadka_owner
 
 logger = logging.getLogger(__name__)
@@ -257,7 +258,9 @@ class CommandTesterCog(commands.Cog):
                     ctx.send = wrapped_channel.send
 
                     logger.info(f"Invoking command: {ctx.command}")
-                    await self.bot.invoke(ctx)
+                    # Always audit test runs so the test framework can fail on N+1 regressions
+                    with n_plus_one_detector.scope(f"test:{ctx.command.qualified_name}", force=True) as query_scope:
+                        await self.bot.invoke(ctx)
                     logger.info(f"Command completed, captured {len(responses)} responses")
 
                     # Restore original send
@@ -270,7 +273,12 @@ class CommandTesterCog(commands.Cog):
                 logger.error(f"Error during command execution: {e}")
                 return {"success": False, "error": str(e)}
 
-            return {"success": True, "command": command_string, "responses": responses}
+            return {
+                "success": True,
+                "command": command_string,
+                "responses": responses,
+                "queries": query_scope.summary(),
+            }
 
         except Exception as e:
             logger.error(f"Error executing command '{command_string}': {e}")
@@ -49,7 +49,7 @@ class InviteCommands(commands.Cog):
         """
         logger.info(f"Admin {ctx.author} requested invite list (sort_by={sort_by}, order={order}, target={target})")
 
-        async with self.bot.get_db() as session:
+        async with self.bot.get_read_db() as session:
             # Pobierz wszystkie zaproszenia z bazy
             invite_repo = InviteRepository(session)
             all_invites = await invite_repo.get_all_invites()
@@ -6,6 +6,7 @@ from datetime import datetime, timezone
 import discord
 from discord.ext import commands
 
+from core.services.premium_cache import get_premium_cache
 from datasources.queries import RoleQueries
 from utils.message_sender import MessageSender
 from utils.permissions import is_admin
@@ -26,7 +27,7 @@ class RoleCommands(commands.Cog):
     @is_admin()
     async def check_roles(self, ctx: commands.Context, user: discord.Member):
         """Sprawdza role użytkownika w logach."""
-        async with self.bot.get_db() as session:
+        async with self.bot.get_read_db() as session:
             # Pobierz wszystkie role użytkownika z bazy
             db_roles = await RoleQueries.get_member_roles(session, user.id)
 
@@ -146,6 +147,7 @@ class RoleCommands(commands.Cog):
                         logger.error(f"Error removing role {role_data['role_name']} from user {user.id}: {e}")
 
                 await session.commit()
+                await get_premium_cache(self.bot).invalidate_member(user.id)
 
                 if removed_roles:
                     embed.add_field(
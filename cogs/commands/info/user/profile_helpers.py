@@ -6,8 +6,7 @@ from typing import List, Tuple
 import discord
 from discord.ext import commands
 
-from core.interfaces.member_interfaces import IActivityService, IMemberService
-from core.interfaces.premium_interfaces import IPremiumService
+from core.containers.request_scope import RequestScope
 from core.repositories import InviteRepository
 from core.services.team_management_service import TeamManagementService
 from datasources.queries import MemberQueries
@@ -25,17 +24,13 @@ async def get_profile_data(member: discord.Member, session, ctx: commands.Contex
         )
         logger.info(f"Got db_member: {db_member.id if db_member else None}")
 
-        # Get services
-        logger.info("Getting services")
-        _member_service = await bot.get_service(IMemberService, session)
-        activity_service = await bot.get_service(IActivityService, session)
-        premium_service = await bot.get_service(IPremiumService, session)
-        logger.info(
-            f"Services retrieved: member={bool(_member_service)}, activity={bool(activity_service)}, premium={bool(premium_service)}"
-        )
+        # Services and repositories shared with the rest of this request
+        scope = RequestScope.for_session(bot, session)
+        activity_service = scope.activity
+        premium_service = scope.premium
 
         # Get basic data
-        invite_repo = InviteRepository(session)
+        invite_repo = scope.repository(InviteRepository)
         invites = await invite_repo.get_member_invite_count(member.id)
         teams = TeamManagementService.count_member_teams(ctx.guild, member, team_symbol)
 
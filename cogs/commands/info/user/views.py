@@ -8,6 +8,7 @@ import discord
 
 from core.interfaces.premium_interfaces import IPremiumService
 from core.services.currency_service import CurrencyService
+from core.services.premium_cache import get_premium_cache
 from datasources.queries import MemberQueries, RoleQueries
 from utils.refund import calculate_refund
 
@@ -64,7 +65,7 @@ class SellRoleButton(discord.ui.Button):
 
     async def callback(self, interaction: discord.Interaction):
         """Show sell role interface."""
-        async with self.bot.get_db() as session:
+        async with self.bot.get_read_db() as session:
             # Get user's premium roles
             premium_service = await self.bot.get_service(IPremiumService, session)
             if not premium_service:
@@ -161,6 +162,8 @@ class ConfirmSaleView(discord.ui.View):
                 await remove_premium_role_mod_permissions(session, self.bot, interaction.user.id)
 
                 await session.commit()
+                # The sold role must not be offered for sale again from the cache
+                await get_premium_cache(self.bot).invalidate_member(interaction.user.id)
 
                 # Send success message
                 success_embed = create_sale_success_embed(role_name, self.selected_info["refund"])
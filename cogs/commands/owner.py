@@ -9,6 +9,7 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
+from core.performance.query_monitor import query_monitor
 from datasources.queries import HandledPaymentQueries
 from utils.message_sender import MessageSender
 from utils.permissions import is_zagadka_owner
@@ -204,6 +205,47 @@ class OwnerCog(commands.Cog):
                 logger.error(f"Error manually assigning payment {id_wplaty} by {ctx.author.display_name}: {e}")
                 await ctx.send(f"Wystąpił błąd podczas przypisywania wpłaty: {e}", ephemeral=True)
 
+    @commands.hybrid_command(name="query_stats", description="Pokazuje najkosztowniejsze zapytania do bazy.")
+    @is_zagadka_owner()
+    @app_commands.describe(
+        sortuj="Kolejność: łączny czas, p95 lub liczba wywołań",
+        limit="Ile zapytań pokazać (domyślnie 10)",
+        reset="Wyczyść statystyki po wyświetleniu",
+    )
+    async def query_stats(
+        self,
+        ctx: commands.Context,
+        sortuj: Literal["total_ms", "p95_ms", "count"] = "total_ms",
+        limit: int = 10,
+        reset: bool = False,
+    ):
+        """Show timing of the most expensive query fingerprints."""
+        stats = query_monitor.get_stats(limit=max(1, min(limit, 20)), sort_by=sortuj)
+
+        embed = discord.Embed(
+            title="📊 Statystyki zapytań",
+            description=f"Zapytań: **{stats['total_queries']}**, łącznie **{stats['total_ms'] / 1000:.1f} s**, "
+            f"wzorców: **{stats['fingerprints']}**, cache kompilacji: **{stats['compiled_cache_hit_ratio']:.0%}**",
+            color=discord.Color.blue(),
+        )
+        for statement in stats["statements"]:
+            origin = next(iter(statement["origins"]), "?")
+            sql = statement["fingerprint"]
+            embed.add_field(
+                name=f"{origin} ×{statement['count']}",
+                value=f"```sql\n{sql[:300]}{'…' if len(sql) > 300 else ''}\n```"
+                f"p50 {statement['p50_ms']:.1f} ms · p95 {statement['p95_ms']:.1f} ms · "
+                f"p99 {statement['p99_ms']:.1f} ms · łącznie {statement['total_ms']:.0f} ms · "
+                f"wiersze {statement['rows']} · cache {statement['compiled_cache_hit_ratio']:.0%}",
+                inline=False,
+            )
+
+        if reset:
+            query_monitor.reset()
+            embed.set_footer(text="Statystyki wyczyszczone")
+
+        await ctx.send(embed=embed, ephemeral=True)
+
 
 async def setup(bot: commands.Bot):
     """
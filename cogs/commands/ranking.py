@@ -44,7 +44,7 @@ class RankingCommands(ServiceCog):
         try:
             logger.info(f"Getting leaderboard for {days} days, limit {limit}")
 
-            async with self.bot.get_db() as session:
+            async with self.bot.get_read_db() as session:
                 # Get activity service with session
                 activity_service = await self.bot.get_service(IActivityTrackingService, session)
 
@@ -95,7 +95,7 @@ class RankingCommands(ServiceCog):
             return
 
         try:
-            async with self.bot.get_db() as session:
+            async with self.bot.get_read_db() as session:
                 # Get activity service with session
                 activity_service = await self.bot.get_service(IActivityTrackingService, session)
 
@@ -153,7 +153,7 @@ class RankingCommands(ServiceCog):
             return
 
         try:
-            async with self.bot.get_db() as session:
+            async with self.bot.get_read_db() as session:
                 # Get activity service with session
                 activity_service = await self.bot.get_service(IActivityTrackingService, session)
 
@@ -162,7 +162,7 @@ class RankingCommands(ServiceCog):
                     await ctx.send("❌ Usługa aktywności nie jest dostępna.", ephemeral=True)
                     return
 
-                stats = await activity_service.get_member_stats(session, ctx.author.id, days)
+                stats = await activity_service.get_member_rank(session, ctx.author.id, days)
 
             # Use member's color if available, otherwise blue
             _color = ctx.author.color if ctx.author.color.value != 0 else discord.Color.blue()
@@ -211,7 +211,7 @@ class RankingCommands(ServiceCog):
         limit = limits.get(category, 100)
 
         try:
-            async with self.bot.get_db() as session:
+            async with self.bot.get_read_db() as session:
                 # Get activity service with session
                 activity_service = await self.bot.get_service(IActivityTrackingService, session)
 
@@ -324,10 +324,16 @@ class RankingCommands(ServiceCog):
         try:
             from datasources.queries import reset_daily_activity_points
 
+            # Write buffered points first so the reset covers them too
+            await self.bot.activity_buffer.flush()
+
             async with self.bot.get_db() as session:
                 await reset_daily_activity_points(session, activity_type)
                 await session.commit()
 
+            await self.bot.activity_buffer.rebuild_summary()
+            await self.bot.ranking_index.load(self.bot.SessionLocal, buffer=self.bot.activity_buffer)
+
             type_text = f" for {activity_type}" if activity_type else ""
             await ctx.send(f"✅ Reset daily points{type_text}.", ephemeral=True)
 
@@ -356,6 +362,9 @@ class RankingCommands(ServiceCog):
                 deleted_count = await cleanup_old_activity_data(session, days_to_keep)
                 await session.commit()
 
+            await self.bot.activity_buffer.rebuild_summary()
+            await self.bot.ranking_index.load(self.bot.SessionLocal, buffer=self.bot.activity_buffer)
+
             await ctx.send(f"✅ Deleted {deleted_count} old activity records.", ephemeral=True)
 
         except Exception as e:
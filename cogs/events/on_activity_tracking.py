@@ -1,14 +1,17 @@
 """Activity tracking event handlers for the ranking system."""
 
 import logging
-from datetime import datetime, timezone
+from datetime import datetime, time, timezone
 from typing import Dict, Set
 
 import discord
 from discord.ext import commands, tasks
 
 from core.interfaces.activity_interfaces import IActivityTrackingService
+from core.services.activity_tracking_service import ANTIPROMO_MARKER, PROMOTION_KEYWORDS
+from utils.keyword_matcher import shared_matcher
 from utils.permissions import is_zagadka_owner
+from utils.voice.event_pipeline import VoiceUpdate
 
 logger = logging.getLogger(__name__)
 
@@ -22,55 +25,49 @@ class OnActivityTracking(commands.Cog):
         # Track voice members for point calculation
         self.voice_members: Dict[int, Set[int]] = {}  # channel_id -> set of member_ids
         self.promotion_members: Set[int] = set()  # members with promotion in status
+        self._promoters_seeded = False  # set after the initial guild scan
+        # Presence changes seen before the scan finished, re-checked right after it (member_id -> member)
+        self._presence_backlog: Dict[int, discord.Member] = {}
+        # Same compiled matcher the activity service uses
+        self.status_matcher = shared_matcher(*PROMOTION_KEYWORDS, ANTIPROMO_MARKER)
+
+        # Voice events arrive through the shared per-member pipeline
+        self.bot.voice_events.subscribe(self.on_voice_update)
 
         # Start background tasks (use same pattern as other cogs)
         self.voice_point_tracker.start()
         self.promotion_checker.start()
+        self.activity_rollup.start()
 
     def _has_points_off_role(self, member: discord.Member) -> bool:
         """Check if member has the 'points_off' role based on config."""
-        mute_roles = self.bot.config.get("mute_roles", [])
-        points_off_role = None
-
-        # Find the points_off role from config
-        for role_config in mute_roles:
-            if role_config.get("description") == "points_off":
-                points_off_role = role_config.get("name")
-                break
-
-        if not points_off_role:
-            # Fallback to hardcoded if not found in config
-            points_off_role = "♺"
-
-        return any(role.name == points_off_role for role in member.roles)
+        return self.bot.role_ids.has_points_off(member)
 
     def cog_unload(self):
         """Clean up when cog is unloaded."""
+        self.bot.voice_events.unsubscribe(self.on_voice_update)
         self.voice_point_tracker.cancel()
         self.promotion_checker.cancel()
+        self.activity_rollup.cancel()
 
-    @commands.Cog.listener()
-    async def on_voice_state_update(
-        self,
-        member: discord.Member,
-        before: discord.VoiceState,
-        after: discord.VoiceState,
-    ):
+    async def on_voice_update(self, update: VoiceUpdate):
         """Track voice channel activity."""
+        member = update.member
         if member.bot:
             return
 
-        # Handle member leaving voice
-        if before.channel and before.channel.id in self.voice_members:
-            self.voice_members[before.channel.id].discard(member.id)
-            if not self.voice_members[before.channel.id]:
-                del self.voice_members[before.channel.id]
+        # Handle member leaving voice (every channel left during the burst)
+        for channel in update.channels_left:
+            if channel.id in self.voice_members:
+                self.voice_members[channel.id].discard(member.id)
+                if not self.voice_members[channel.id]:
+                    del self.voice_members[channel.id]
 
         # Handle member joining voice
-        if after.channel:
-            if after.channel.id not in self.voice_members:
-                self.voice_members[after.channel.id] = set()
-            self.voice_members[after.channel.id].add(member.id)
+        if update.after.channel:
+            if update.after.channel.id not in self.voice_members:
+                self.voice_members[update.after.channel.id] = set()
+            self.voice_members[update.after.channel.id].add(member.id)
 
         logger.debug(f"Voice update: {member.display_name} - {len(self.voice_members)} channels active")
 
@@ -99,118 +96,178 @@ class OnActivityTracking(commands.Cog):
             return
 
         try:
-            async with self.bot.get_db() as session:
-                # Create a copy of the dictionary to avoid "dictionary changed size during iteration"
-                voice_members_copy = dict(self.voice_members)
+            # Create a copy of the dictionary to avoid "dictionary changed size during iteration"
+            voice_members_copy = dict(self.voice_members)
+            awards = []
+
+            for channel_id, member_ids in voice_members_copy.items():
+                channel = self.bot.guild.get_channel(channel_id)
+                if not channel:
+                    continue
+
+                # Create a copy of member_ids set to avoid modification during iteration
+                member_ids_copy = set(member_ids)
+
+                # Filter out muted/deafened members
+                active_members = []
+                members_to_remove = set()
+
+                for member_id in member_ids_copy:
+                    member = self.bot.guild.get_member(member_id)
+                    if not member:
+                        members_to_remove.add(member_id)
+                        continue
 
-                for channel_id, member_ids in voice_members_copy.items():
-                    channel = self.bot.guild.get_channel(channel_id)
-                    if not channel:
+                    # Skip if member has "points_off" role
+                    if self._has_points_off_role(member):
                         continue
 
-                    # Create a copy of member_ids set to avoid modification during iteration
-                    member_ids_copy = set(member_ids)
+                    # Skip if muted or deafened
+                    if member.voice and (member.voice.self_mute or member.voice.self_deaf):
+                        continue
 
-                    # Filter out muted/deafened members
-                    active_members = []
-                    members_to_remove = set()
+                    active_members.append(member_id)
 
-                    for member_id in member_ids_copy:
-                        member = self.bot.guild.get_member(member_id)
-                        if not member:
-                            members_to_remove.add(member_id)
-                            continue
+                # Remove non-existent members from the original set after iteration
+                if members_to_remove:
+                    self.voice_members[channel_id].difference_update(members_to_remove)
+                    # Remove empty channel entries
+                    if not self.voice_members[channel_id]:
+                        del self.voice_members[channel_id]
 
-                        # Skip if member has "points_off" role
-                        if self._has_points_off_role(member):
-                            continue
+                # Award points based on whether they're alone or with others
+                is_with_others = len(active_members) > 1
+                awards.extend((member_id, channel_id, is_with_others) for member_id in active_members)
 
-                        # Skip if muted or deafened
-                        if member.voice and (member.voice.self_mute or member.voice.self_deaf):
-                            continue
+                if active_members:
+                    points_type = "with others" if is_with_others else "alone"
+                    logger.debug(
+                        f"Awarding voice points to {len(active_members)} members in {channel.name} ({points_type})"
+                    )
 
-                        active_members.append(member_id)
+            if not awards:
+                return
 
-                    # Remove non-existent members from the original set after iteration
-                    if members_to_remove:
-                        self.voice_members[channel_id].difference_update(members_to_remove)
-                        # Remove empty channel entries
-                        if not self.voice_members[channel_id]:
-                            del self.voice_members[channel_id]
+            # One service and one write for the whole tick
+            async with self.bot.get_db() as session:
+                activity_service = await self.bot.get_service(IActivityTrackingService, session)
+                await activity_service.track_voice_activity_bulk(awards)
+        except Exception as e:
+            logger.error(f"Error in voice point tracker: {e}")
 
-                    # Award points based on whether they're alone or with others
-                    is_with_others = len(active_members) > 1
+    async def _update_promotion_state(self, activity_service, member: discord.Member) -> None:
+        """Re-evaluate a single member's promotion status and update the promoter set."""
+        if await activity_service.check_member_promotion_status(member):
+            if member.id not in self.promotion_members:
+                self.promotion_members.add(member.id)
+                logger.debug(f"Member {member.display_name} ({member.id}) started promoting")
+        elif member.id in self.promotion_members:
+            self.promotion_members.discard(member.id)
+            logger.debug(f"Member {member.display_name} ({member.id}) stopped promoting")
+
+        # Check for anti-promotion (promoting other servers)
+        if await activity_service.check_member_antipromo_status(member):
+            # Log but don't reset points automatically (as per user request)
+            logger.debug(f"Member {member.display_name} ({member.id}) is promoting other servers")
+
+    async def _seed_promoters(self) -> None:
+        """Build the promoter set with one full scan; presence updates keep it current afterwards."""
+        async with self.bot.get_db() as session:
+            activity_service = await self.bot.get_service(IActivityTrackingService, session)
+            self.promotion_members = set()
+            for member in self.bot.guild.members:
+                if not member.bot and self.status_matcher.scan_activities(member.activities):
+                    await self._update_promotion_state(activity_service, member)
+
+        self._promoters_seeded = True
+        logger.info(f"Promotion tracking seeded: {len(self.promotion_members)} promoters")
+
+        # The scan may have read these members before their presence changed
+        backlog, self._presence_backlog = self._presence_backlog, {}
+        for member in backlog.values():
+            await self._refresh_promotion(member)
+
+    async def _refresh_promotion(self, member: discord.Member) -> None:
+        """Re-check one member; a session is only opened when their status mentions a tracked keyword."""
+        if not self.status_matcher.scan_activities(member.activities):
+            if member.id in self.promotion_members:
+                self.promotion_members.discard(member.id)
+                logger.debug(f"Member {member.display_name} ({member.id}) stopped promoting")
+            return
 
-                    # Use the new activity service
-                    activity_service = await self.bot.get_service(IActivityTrackingService, session)
+        try:
+            async with self.bot.get_db() as session:
+                activity_service = await self.bot.get_service(IActivityTrackingService, session)
+                await self._update_promotion_state(activity_service, member)
+        except Exception as e:
+            logger.error(f"Failed to update promotion status for {member.id}: {e}")
 
-                    for member_id in active_members:
-                        await activity_service.track_voice_activity(member_id, channel_id, is_with_others)
+    @commands.Cog.listener()
+    async def on_presence_update(self, before: discord.Member, after: discord.Member):
+        """Track promotion status changes instead of rescanning the whole guild."""
+        if after.bot or after.guild != self.bot.guild:
+            return
 
-                    if active_members:
-                        points_type = "with others" if is_with_others else "alone"
-                        logger.debug(
-                            f"Awarded voice points to {len(active_members)} members in {channel.name} ({points_type})"
-                        )
+        # Status-only changes (online/idle/dnd) don't affect promotion
+        if before.activities == after.activities:
+            return
 
-                await session.commit()
-        except Exception as e:
-            logger.error(f"Error in voice point tracker: {e}")
+        if not self._promoters_seeded:
+            self._presence_backlog[after.id] = after
+            return
+
+        await self._refresh_promotion(after)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        """Forget promoters who left the server."""
+        self.promotion_members.discard(member.id)
+        self._presence_backlog.pop(member.id, None)
 
     @tasks.loop(minutes=1)
     async def promotion_checker(self):
-        """Check for members promoting the server and award points."""
+        """Award points to current promoters."""
         if not self.bot.guild:
             return
 
-        # Only award promotion points every 5 minutes (optimal balance)
-        current_time = datetime.now(timezone.utc)
-        should_award_points = current_time.minute % 5 == 0
-
         try:
+            if not self._promoters_seeded:
+                await self._seed_promoters()
+
+            # Only award promotion points every 5 minutes (optimal balance)
+            current_time = datetime.now(timezone.utc)
+            if current_time.minute % 5 != 0 or not self.promotion_members:
+                return
+
             async with self.bot.get_db() as session:
-                current_promoters = set()
+                activity_service = await self.bot.get_service(IActivityTrackingService, session)
+                awarded = 0
 
-                for member in self.bot.guild.members:
-                    if member.bot:
+                for member_id in list(self.promotion_members):
+                    member = self.bot.guild.get_member(member_id)
+                    if not member:
+                        self.promotion_members.discard(member_id)
                         continue
 
                     # Skip if member has "points_off" role
                     if self._has_points_off_role(member):
                         continue
 
-                    # Get activity service
-                    activity_service = await self.bot.get_service(IActivityTrackingService, session)
-                    if not activity_service:
-                        continue
-
-                    # Check for promotion
-                    if await activity_service.check_member_promotion_status(member):
-                        current_promoters.add(member.id)
-                        # Only award points every 3 minutes
-                        if should_award_points:
-                            await activity_service.track_promotion_activity(member.id)
-
-                    # Check for anti-promotion (promoting other servers)
-                    if await activity_service.check_member_antipromo_status(member):
-                        # Log but don't reset points automatically (as per user request)
-                        logger.debug(f"Member {member.display_name} ({member.id}) is promoting other servers")
+                    await activity_service.track_promotion_activity(member_id)
+                    awarded += 1
 
-                # Log promotion activity
-                new_promoters = current_promoters - self.promotion_members
-                stopped_promoters = self.promotion_members - current_promoters
-
-                if new_promoters:
-                    logger.info(f"New promoters: {len(new_promoters)} members")
-                if stopped_promoters:
-                    logger.info(f"Stopped promoting: {len(stopped_promoters)} members")
-
-                self.promotion_members = current_promoters
-
-                await session.commit()
+                logger.info(f"Awarded promotion points to {awarded} members")
         except Exception as e:
             logger.error(f"Error in promotion checker: {e}")
 
+    @tasks.loop(time=time(hour=0, minute=1, tzinfo=timezone.utc))
+    async def activity_rollup(self):
+        """Roll the 7/30 day activity summary forward after midnight UTC."""
+        try:
+            await self.bot.activity_buffer.rebuild_summary()
+        except Exception as e:
+            logger.error(f"Error in activity rollup: {e}")
+
     @voice_point_tracker.before_loop
     async def before_voice_tracker(self):
         """Wait for bot to be ready before starting voice tracker."""
@@ -255,10 +312,20 @@ class OnActivityTracking(commands.Cog):
             inline=True,
         )
 
+        buffer_stats = self.bot.activity_buffer.get_stats()
+        embed.add_field(
+            name="💾 Points Buffer",
+            value=f"Pending: {buffer_stats['pending']}\n"
+            f"Flushes: {buffer_stats['flushes']} ({buffer_stats['failed_flushes']} failed)\n"
+            f"Rows written: {buffer_stats['rows_written']}",
+            inline=True,
+        )
+
         embed.add_field(
             name="🔄 Tasks Status",
             value=f"Voice: {'Running' if self.voice_point_tracker.is_running() else 'Stopped'}\n"
-            f"Promotion: {'Running' if self.promotion_checker.is_running() else 'Stopped'}",
+            f"Promotion: {'Running' if self.promotion_checker.is_running() else 'Stopped'}\n"
+            f"Rollup: {'Running' if self.activity_rollup.is_running() else 'Stopped'}",
             inline=True,
         )
 
@@ -5,6 +5,8 @@ import logging
 import discord
 from discord.ext import commands
 
+from core.services.premium_cache import get_premium_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -81,13 +83,14 @@ class OnMemberRoleUpdateEvent(commands.Cog):
 
         # Handle role changes (existing logic)
         if roles_changed:
-            # Get the premium roles from config
-            premium_roles = [role["name"] for role in self.bot.config["premium_roles"]]
-
             # Check if user had any premium role before
-            had_premium = any(role.name in premium_roles for role in before.roles)
+            had_premium = self.bot.role_ids.has_premium(before)
             # Check if user has any premium role after
-            has_premium = any(role.name in premium_roles for role in after.roles)
+            has_premium = self.bot.role_ids.has_premium(after)
+
+            # Premium status cached for the member no longer matches their roles
+            if self.bot.role_ids.premium_roles_of(before) != self.bot.role_ids.premium_roles_of(after):
+                await get_premium_cache(self.bot).invalidate_member(after.id)
 
             # If user lost premium status (had premium before but doesn't have it now)
             if had_premium and not has_premium:
@@ -107,7 +110,7 @@ class OnMemberRoleUpdateEvent(commands.Cog):
         if nickname_changed:
             # Check if user has mutenick role
             nick_mute_role_id = self.bot.config["mute_roles"][2]["id"]  # ☢︎ role (attach_files_off)
-            has_nick_mute = any(role.id == nick_mute_role_id for role in after.roles)
+            has_nick_mute = after.get_role(nick_mute_role_id) is not None
 
             if has_nick_mute:
                 default_nick = self.bot.config.get("default_mute_nickname", "random")
@@ -14,6 +14,7 @@ from cogs.views.shop_views import BuyRoleButton
 from core.interfaces.member_interfaces import IMemberService
 from core.repositories import PaymentRepository
 from core.services.currency_service import CurrencyService
+from core.services.premium_cache import get_premium_cache
 from utils.premium import PremiumManager, TipplyDataProvider
 from utils.premium_logic import PREMIUM_PRIORITY, PremiumRoleManager
 
@@ -108,6 +109,8 @@ class OnPaymentEvent(commands.Cog):
                             await self.handle_payment(session, payment_data)
                             # Commit after each successful payment
                             await session.commit()
+                            # The payment may have assigned or extended a premium role
+                            await get_premium_cache(self.bot).invalidate_all()
                             logger.info("Successfully processed payment: %s", payment_data)
                         except Exception as e:
                             logger.error("Error processing payment %s: %s", payment_data, str(e))
@@ -14,6 +14,7 @@ from cogs.commands.info.admin_info import remove_premium_role_mod_permissions
 from core.interfaces.member_interfaces import IMemberService
 from core.repositories import ModerationRepository, NotificationRepository, RoleRepository
 from core.services.currency_service import CurrencyService
+from core.services.premium_cache import get_premium_cache
 from utils.role_manager import RoleManager
 
 # Currency constant
@@ -593,6 +594,7 @@ class OnTaskEvent(commands.Cog):
                                 await remove_premium_role_mod_permissions(session, self.bot, member.id)
                                 await role_repo.delete_member_role(member.id, discord_role.id)
                                 await session.commit()
+                                await get_premium_cache(self.bot).invalidate_member(member.id)
                                 # Powiadomienie użytkownika
                                 await self.notify_audit_role_removal(
                                     member,
@@ -10,6 +10,9 @@ from discord.ext import commands
 from core.adapters.voice_channel_adapter import VoiceChannelAdapter
 from utils.message_sender import MessageSender
 from utils.voice.autokick import AutoKickManager
+from utils.voice.channel_pool import VoiceChannelPool
+from utils.voice.event_pipeline import VoiceUpdate
+from utils.voice.overwrites import OverwritePlan
 from utils.voice.permissions import VoicePermissionManager
 
 logger = logging.getLogger(__name__)
@@ -34,10 +37,15 @@ class OnVoiceStateUpdateEvent(commands.Cog):
         self.permission_manager = VoicePermissionManager(bot)
         self.autokick_manager = AutoKickManager(bot)
         self.voice_adapter = VoiceChannelAdapter(bot)
+        # Gotowe, czyste kanały w kategoriach z formatem nazwy (voice_channel_pool w config.yml)
+        self.channel_pool = VoiceChannelPool.from_config(bot, self.permission_manager)
 
         self.channels_create = self.bot.config["channels_create"]
         self.vc_categories = self.bot.config["vc_categories"]
 
+        # Zdarzenia głosowe z bot.voice_events: po kolei dla każdej osoby, serie połączone w jedną zmianę
+        self.bot.voice_events.subscribe(self.on_voice_update)
+
         # Queue dla operacji autokick
         self.autokick_queue = asyncio.Queue()
         self.autokick_worker_task = None
@@ -68,6 +76,9 @@ class OnVoiceStateUpdateEvent(commands.Cog):
         logger.info("Setting guild for VoicePermissionManager in OnVoiceStateUpdateEvent")
         self.permission_manager.guild = self.guild
 
+        if self.channel_pool.sizes and self.channel_pool.guild is None:
+            self.channel_pool.start(self.guild)
+
         # Start autokick worker
         if self.autokick_worker_task is None:
             self.autokick_worker_task = asyncio.create_task(self._autokick_worker())
@@ -136,13 +147,18 @@ class OnVoiceStateUpdateEvent(commands.Cog):
         except Exception as e:
             self.logger.error(f"Failed to autokick {member.id}: {str(e)}")
 
-    @commands.Cog.listener()
-    async def on_voice_state_update(self, member, before, after):
-        """Handle the event when a member joins or leaves a voice channel."""
+    async def on_voice_update(self, update: VoiceUpdate):
+        """Handle a member's voice state change (a burst of events merged by bot.voice_events)."""
+        member, before, after = update.member, update.before, update.after
+
         # Check for autokicks when a member joins a voice channel
-        if after.channel and before.channel != after.channel:
+        if after.channel and update.channel_changed:
             logger.info(f"Member {member.display_name} joined channel {after.channel.name} (ID: {after.channel.id})")
 
+            if after.channel.id in self.channels_create:
+                # Load the owner's stored permissions while autokicks are checked
+                self.permission_manager.prefetch_owner_overwrites(member.id)
+
             if member.id != self.bot.config["owner_id"]:
                 await self.handle_autokicks(member, after.channel)
 
@@ -152,28 +168,17 @@ class OnVoiceStateUpdateEvent(commands.Cog):
             elif after.channel and after.channel.id == self.bot.config["channels_voice"]["afk"]:
                 return
 
-        if (
-            before.channel
-            and before.channel != after.channel
-            and before.channel.type == discord.ChannelType.voice
-            and len(before.channel.members) == 0
-        ):
-            await self.handle_channel_leave(before)
+        # Także kanały opuszczone w trakcie serii zdarzeń (np. przeskok przez kanał create)
+        for channel in update.channels_left:
+            if channel != after.channel and channel.type == discord.ChannelType.voice and len(channel.members) == 0:
+                await self.handle_channel_leave(channel)
 
     async def handle_autokicks(self, member, channel):
         """Handle autokicks for a member joining a voice channel"""
         if channel.id == self.bot.config["channels_voice"]["afk"]:
             return
 
-        # Try using the new service first
-        kicked = await self.voice_adapter.check_autokick(channel, member)
-        
-        if kicked:
-            self.metrics["autokicks_executed"] += 1
-            logger.info(f"Autokicked {member.display_name} using new service")
-            return
-            
-        # Fallback to old method for compatibility
+        # Sprawdzenie w indeksie w pamięci, bez zapytania do bazy
         should_kick, matching_owners = await self.autokick_manager.check_autokick(member, channel)
         
         if should_kick and matching_owners:
@@ -264,8 +269,13 @@ class OnVoiceStateUpdateEvent(commands.Cog):
         # Pobierz konfigurację kategorii z cache
         config = await self._get_category_config(category_id)
 
-        # Sprawdź puste kanały z cache
-        empty_channels = await self._get_empty_channels(category)
+        # Kategorie z pulą biorą gotowy kanał z puli; pozostałe szukają pustego kanału w kategorii
+        pooled_channel = None
+        if self.channel_pool.manages(category_id):
+            pooled_channel = self.channel_pool.acquire(category)
+            empty_channels = [pooled_channel] if pooled_channel else []
+        else:
+            empty_channels = await self._get_empty_channels(category)
 
         # Determine channel name based on category
         channel_name = member.display_name
@@ -318,35 +328,30 @@ class OnVoiceStateUpdateEvent(commands.Cog):
             existing_channel = empty_channels[0]
             logger.info(f"Wykorzystuję istniejący pusty kanał: {existing_channel.name}")
 
-            # Dodaj wszystkie uprawnienia do istniejącego kanału
-            # Najpierw ustaw uprawnienia właściciela
-            owner_permissions = permission_overwrites.get(member, None)
-            if owner_permissions:
-                await existing_channel.set_permissions(member, overwrite=owner_permissions)
-                logger.info(f"Dodano uprawnienia właściciela dla {member.display_name}")
+            # Wszystkie uprawnienia (właściciel + do 95 z bazy) jednym wywołaniem API zamiast set_permissions
+            # dla każdego celu osobno. Kanał zachowuje @everyone i role wyciszające ustawione przy opuszczeniu.
+            mute_role_ids = {role["id"] for role in self.bot.config["mute_roles"]}
 
-            # Następnie dodaj wszystkie inne uprawnienia z bazy danych
-            for target, overwrite in permission_overwrites.items():
-                if target != member and target != self.guild.default_role:
-                    # Pomiń role wyciszające (już są na kanale) i @everyone (już jest ustawiony)
-                    mute_role_ids = [role["id"] for role in self.bot.config["mute_roles"]]
-                    if isinstance(target, discord.Role) and target.id in mute_role_ids:
-                        continue
+            def is_mute_role(target):
+                return isinstance(target, discord.Role) and target.id in mute_role_ids
 
-                    await existing_channel.set_permissions(target, overwrite=overwrite)
-                    logger.info(f"Dodano uprawnienia z bazy danych dla {target}")
-
-            # Dodaj uprawnienia z db_overwrites jeśli istnieją
-            if db_overwrites:
-                for target, overwrite in db_overwrites.items():
-                    await existing_channel.set_permissions(target, overwrite=overwrite)
-                    logger.info(f"Dodano dodatkowe uprawnienia z bazy danych dla {target}")
+            plan = OverwritePlan.from_channel(
+                existing_channel, keep=lambda target: target == self.guild.default_role or is_mute_role(target)
+            )
+            for target, overwrite in permission_overwrites.items():
+                # Pomiń role wyciszające, które już są na kanale
+                if is_mute_role(target) and target in plan:
+                    continue
+                plan.set(target, overwrite)
+            await plan.apply(existing_channel)
+            logger.info(f"Ustawiono {len(plan)} uprawnień na kanale {existing_channel.name}")
 
             # Przenieś członka do kanału
             await member.move_to(existing_channel)
 
             # Usuń z cache pustych kanałów
-            self._empty_channels_cache[category_id].remove(existing_channel)
+            if pooled_channel is None:
+                self._empty_channels_cache[category_id].remove(existing_channel)
 
             # Wyślij informację o zajęciu kanału
             fake_ctx = FakeContext(self.bot, member.guild)
@@ -376,12 +381,11 @@ class OnVoiceStateUpdateEvent(commands.Cog):
             logger.info(f"Created new channel (fallback): {channel_name} with limit={user_limit}")
         else:
             logger.info(f"Created new channel (service): {channel_name}")
-            # Apply additional permissions if needed
-            if user_limit != 0:
-                await new_channel.edit(user_limit=user_limit)
-            if db_overwrites:
-                for target, overwrite in db_overwrites.items():
-                    await new_channel.set_permissions(target, overwrite=overwrite)
+            # Apply additional permissions and the user limit in one request
+            plan = OverwritePlan.from_channel(new_channel)
+            for target, overwrite in (db_overwrites or {}).items():
+                plan.set(target, overwrite)
+            await plan.apply(new_channel, **({"user_limit": user_limit} if user_limit != 0 else {}))
 
         # Move member to the new channel
         await member.move_to(new_channel)
@@ -397,21 +401,29 @@ class OnVoiceStateUpdateEvent(commands.Cog):
 
     def cog_unload(self):
         """Cleanup when cog is unloaded"""
+        self.bot.voice_events.unsubscribe(self.on_voice_update)
+        self.channel_pool.stop()
         if self.autokick_worker_task:
             self.autokick_worker_task.cancel()
             logger.info("Cancelled autokick worker task")
 
-    async def handle_channel_leave(self, before):
+    async def handle_channel_leave(self, channel):
         """
         Handle the deletion of a voice channel when all members leave.
         Ulepszona wersja z optymalizacjami.
         """
         # Nie usuwamy kanałów create ani AFK
-        if before.channel.id in self.channels_create or before.channel.id == self.bot.config["channels_voice"]["afk"]:
+        if channel.id in self.channels_create or channel.id == self.bot.config["channels_voice"]["afk"]:
             return
 
         # Usuwamy tylko kanały w kategoriach głosowych
-        if before.channel.category and before.channel.category.id in self.vc_categories:
+        if channel.category and channel.category.id in self.vc_categories:
+            # Kategorie z pulą: kanał wraca do puli i jest czyszczony w tle, a nadmiarowy jest usuwany
+            if self.channel_pool.manages(channel.category.id):
+                if not self.channel_pool.release(channel):
+                    await channel.delete()
+                return
+
             # Sprawdź, czy kategoria jest jedną z tych, gdzie zachowujemy puste kanały
             preserve_categories = [
                 id
@@ -441,51 +453,35 @@ class OnVoiceStateUpdateEvent(commands.Cog):
                 if id is not None
             ]
 
-            if before.channel.category.id in preserve_categories:
+            if channel.category.id in preserve_categories:
                 # Sprawdź ile pustych kanałów jest już w tej kategorii
                 empty_channels = [
-                    channel
-                    for channel in before.channel.category.voice_channels
-                    if len(channel.members) == 0
-                    and channel.id not in self.channels_create
-                    and channel.id != self.bot.config["channels_voice"]["afk"]
+                    voice_channel
+                    for voice_channel in channel.category.voice_channels
+                    if len(voice_channel.members) == 0
+                    and voice_channel.id not in self.channels_create
+                    and voice_channel.id != self.bot.config["channels_voice"]["afk"]
                 ]
 
-                self.logger.info(
-                    f"Liczba pustych kanałów w kategorii {before.channel.category.name}: {len(empty_channels)}"
-                )
+                self.logger.info(f"Liczba pustych kanałów w kategorii {channel.category.name}: {len(empty_channels)}")
 
                 if len(empty_channels) <= 3:  # Zachowaj kanał, jeśli pustych jest 3 lub mniej
-                    self.logger.info(
-                        f"Zachowuję pusty kanał {before.channel.name} w kategorii {before.channel.category.name}"
-                    )
-
-                    # Zoptymalizacja: Przygotuj wszystkie zmiany uprawnień na raz
-                    clean_perms = self.permission_manager._get_clean_everyone_permissions()
-
-                    # Przygotuj słownik wszystkich uprawnień do ustawienia za jednym razem
-                    new_overwrites = {}
-
-                    # Dodaj czyste uprawnienia dla @everyone
-                    new_overwrites[before.channel.guild.default_role] = clean_perms
+                    self.logger.info(f"Zachowuję pusty kanał {channel.name} w kategorii {channel.category.name}")
 
-                    # Zachowaj tylko uprawnienia dla ról wyciszających
-                    mute_role_ids = [role["id"] for role in self.bot.config["mute_roles"]]
-                    for target, overwrite in before.channel.overwrites.items():
-                        if isinstance(target, discord.Role) and target.id in mute_role_ids:
-                            new_overwrites[target] = overwrite
+                    # Zachowaj tylko uprawnienia dla ról wyciszających, czyste uprawnienia dla @everyone
+                    plan = self.permission_manager.clean_channel_plan(channel)
 
                     # Ustaw odpowiedni limit użytkowników
-                    user_limit = self.permission_manager._get_default_user_limit(before.channel.category.id)
+                    user_limit = self.permission_manager._get_default_user_limit(channel.category.id)
 
-                    # Zastosuj wszystkie zmiany jednym wywołaniem API
-                    await before.channel.edit(overwrites=new_overwrites, user_limit=user_limit)
+                    # Zastosuj wszystkie zmiany jednym wywołaniem API (lub żadnym, jeśli kanał już jest czysty)
+                    await plan.apply(channel, user_limit=user_limit)
 
                     # Zakończ funkcję, nie usuwając kanału
                     return
 
             # W pozostałych przypadkach usuń kanał
-            await before.channel.delete()
+            await channel.delete()
 
 
 async def setup(bot: commands.Bot):
@@ -5,6 +5,7 @@ from datetime import datetime, timedelta, timezone
 import discord
 from discord.ext.commands import Context
 
+from core.services.premium_cache import get_premium_cache
 from datasources.queries import MemberQueries, RoleQueries
 from utils.message_sender import MessageSender
 from utils.premium_logic import PremiumRoleManager
@@ -312,6 +313,7 @@ class RolePurchaseHandler:
             # Premium service logic handled by role assignment above
 
             await session.commit()
+            await get_premium_cache(self.bot).invalidate_member(member.id)
             return True
 
         except Exception as e:
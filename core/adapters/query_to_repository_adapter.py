@@ -27,32 +27,14 @@ class MemberQueriesAdapter:
         rejoined_at: Optional[datetime] = None,
     ) -> Member:
         """Get a Member by ID, or add a new one if it doesn't exist"""
-        repo = MemberRepository(session)
-
-        # Try to get existing member
-        member = await repo.get_by_discord_id(member_id)
-
-        if member is None:
-            # Create new member
-            member = await repo.create_member(
-                discord_id=member_id,
-                first_inviter_id=first_inviter_id,
-                current_inviter_id=current_inviter_id,
-                joined_at=joined_at,
-            )
-            # Update wallet balance if provided
-            if wallet_balance > 0:
-                member.wallet_balance = wallet_balance
-                await session.flush()
-        else:
-            # Update fields for existing members
-            if current_inviter_id is not None:
-                member.current_inviter_id = current_inviter_id
-            if rejoined_at is not None:
-                member.rejoined_at = rejoined_at
-            await session.flush()
-
-        return member
+        return await MemberRepository(session).get_or_add_member(
+            member_id,
+            wallet_balance=wallet_balance,
+            first_inviter_id=first_inviter_id,
+            current_inviter_id=current_inviter_id,
+            joined_at=joined_at,
+            rejoined_at=rejoined_at,
+        )
 
     @staticmethod
     async def add_to_wallet_balance(session: AsyncSession, member_id: int, amount: int) -> None:
@@ -140,12 +122,7 @@ class ActivityQueriesAdapter:
     @staticmethod
     async def ensure_member_exists(session: AsyncSession, member_id: int) -> None:
         """Ensure member exists in the database."""
-        from core.repositories.member_repository import MemberRepository
-
-        repo = MemberRepository(session)
-        member = await repo.get_by_discord_id(member_id)
-        if not member:
-            await repo.create_member(discord_id=member_id)
+        await MemberRepository(session).ensure_members_exist((member_id,))
 
     @staticmethod
     async def add_activity_points(
@@ -234,11 +211,7 @@ class AutoKickQueriesAdapter:
     @staticmethod
     async def ensure_members_exist(session: AsyncSession, owner_id: int, target_id: int) -> None:
         """Ensure both owner and target exist in members table."""
-        from core.repositories import MemberRepository
-
-        member_repo = MemberRepository(session)
-        await member_repo.get_or_create(owner_id)
-        await member_repo.get_or_create(target_id)
+        await MemberRepository(session).ensure_members_exist((owner_id, target_id))
         await session.commit()
 
     @staticmethod
@@ -0,0 +1,276 @@
+"""Request-scoped bundle of repositories and services sharing one database session."""
+
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Type, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.containers.unit_of_work import UnitOfWork
+from core.interfaces.activity_interfaces import IActivityTrackingService
+from core.interfaces.member_interfaces import IActivityService, IInviteService, IMemberService, IModerationService
+from core.interfaces.messaging_interfaces import IEmbedBuilder, IMessageSender, INotificationService
+from core.interfaces.premium_interfaces import IPaymentProcessor, IPremiumService
+from core.interfaces.role_interfaces import IRoleService
+from core.interfaces.team_interfaces import ITeamManagementService
+from core.interfaces.voice_interfaces import IAutoKickService, IVoiceChannelService
+from core.repositories.activity_repository import ActivityRepository
+from core.repositories.channel_repository import ChannelRepository
+from core.repositories.invite_repository import InviteRepository
+from core.repositories.member_repository import MemberRepository
+from core.repositories.moderation_repository import ModerationRepository
+from core.repositories.premium_repository import PaymentRepository, PremiumRepository
+from core.repositories.role_repository import RoleRepository
+from core.services.activity_tracking_service import ActivityTrackingService
+from core.services.autokick_service import AutoKickService
+from core.services.member_service import InviteService, MemberService, ModerationService
+from core.services.message_sender_service import MessageSenderService
+from core.services.notification_service import NotificationService
+from core.services.payment_processor_service import PaymentProcessorService
+from core.services.premium_service import PremiumService
+from core.services.role_service import RoleService
+from core.services.team_management_service import TeamManagementService
+from core.services.voice_channel_service import VoiceChannelService
+
+if TYPE_CHECKING:
+    from main import Zagadka
+
+T = TypeVar("T")
+
+# Key under which a session's scope is stored in ``session.info``
+SCOPE_INFO_KEY = "request_scope"
+
+
+class RequestScope:
+    """
+    Repositories and services for one ``get_db()`` session.
+
+    Everything is created on first access and reused for the rest of the
+    request, so a command that needs several services builds each of them
+    (and the shared unit of work) once. Session-less services come from the
+    bot's service container.
+    """
+
+    def __init__(self, bot: "Zagadka", session: AsyncSession):
+        self.bot = bot
+        self.session = session
+        self._unit_of_work: Optional[UnitOfWork] = None
+        self._repositories: Dict[type, Any] = {}
+        self._services: Dict[type, Any] = {}
+
+    @classmethod
+    def for_session(cls, bot: "Zagadka", session: AsyncSession) -> "RequestScope":
+        """The scope attached to a session, created on first use."""
+        scope = session.info.get(SCOPE_INFO_KEY)
+        if scope is None or scope.bot is not bot:
+            scope = session.info[SCOPE_INFO_KEY] = cls(bot, session)
+        return scope
+
+    @property
+    def unit_of_work(self) -> UnitOfWork:
+        """Unit of work shared by all services of the request."""
+        if self._unit_of_work is None:
+            self._unit_of_work = self.bot.service_container.create_unit_of_work(self.session)
+            # Reuse the repositories the unit of work already created
+            for repository in (
+                self._unit_of_work.members,
+                self._unit_of_work.activities,
+                self._unit_of_work.invites,
+                self._unit_of_work.moderation,
+                self._unit_of_work.roles,
+            ):
+                self._repositories.setdefault(type(repository), repository)
+        return self._unit_of_work
+
+    def repository(self, repository_type: Type[T]) -> T:
+        """Repository of the given class bound to this session."""
+        repository = self._repositories.get(repository_type)
+        if repository is None:
+            repository = self._repositories[repository_type] = repository_type(self.session)
+        return repository
+
+    def get(self, service_type: Type[T]) -> T:
+        """Service implementing ``service_type``, built once per request."""
+        service = self._services.get(service_type)
+        if service is None:
+            factory = SERVICE_FACTORIES.get(service_type)
+            if factory is None:
+                service = self.bot.service_container.get_service(service_type)
+            else:
+                service = factory(self)
+            self._services[service_type] = service
+        return service
+
+    @property
+    def premium(self) -> PremiumService:
+        return self.get(IPremiumService)
+
+    @property
+    def payments(self) -> PaymentProcessorService:
+        return self.get(IPaymentProcessor)
+
+    @property
+    def members(self) -> MemberService:
+        return self.get(IMemberService)
+
+    @property
+    def activity(self) -> ActivityTrackingService:
+        return self.get(IActivityService)
+
+    @property
+    def activity_tracking(self) -> ActivityTrackingService:
+        return self.get(IActivityTrackingService)
+
+    @property
+    def moderation(self) -> ModerationService:
+        return self.get(IModerationService)
+
+    @property
+    def invites(self) -> InviteService:
+        return self.get(IInviteService)
+
+    @property
+    def roles(self) -> RoleService:
+        return self.get(IRoleService)
+
+    @property
+    def messages(self) -> MessageSenderService:
+        return self.get(IMessageSender)
+
+    @property
+    def notifications(self) -> NotificationService:
+        return self.get(INotificationService)
+
+    @property
+    def team(self) -> TeamManagementService:
+        return self.get(ITeamManagementService)
+
+    @property
+    def voice(self) -> VoiceChannelService:
+        return self.get(IVoiceChannelService)
+
+    @property
+    def autokick(self) -> AutoKickService:
+        return self.get(IAutoKickService)
+
+
+def _role_service(scope: RequestScope) -> RoleService:
+    uow = scope.unit_of_work
+    return RoleService(role_repository=scope.repository(RoleRepository), unit_of_work=uow)
+
+
+def _message_sender(scope: RequestScope) -> MessageSenderService:
+    return MessageSenderService(unit_of_work=scope.unit_of_work)
+
+
+def _notification_service(scope: RequestScope) -> NotificationService:
+    return NotificationService(
+        embed_builder=scope.bot.service_container.get_service(IEmbedBuilder),
+        message_sender=scope.messages,
+        unit_of_work=scope.unit_of_work,
+    )
+
+
+def _premium_service(scope: RequestScope) -> PremiumService:
+    uow = scope.unit_of_work
+    premium_service = PremiumService(
+        premium_repository=scope.repository(PremiumRepository),
+        payment_repository=scope.repository(PaymentRepository),
+        bot=scope.bot,
+        unit_of_work=uow,
+    )
+    # Set guild if available
+    if scope.bot.guild:
+        premium_service.set_guild(scope.bot.guild)
+    return premium_service
+
+
+def _payment_processor(scope: RequestScope) -> PaymentProcessorService:
+    uow = scope.unit_of_work
+    payment_processor = PaymentProcessorService(
+        payment_repository=scope.repository(PaymentRepository),
+        unit_of_work=uow,
+    )
+    # Set premium service to avoid circular dependency
+    payment_processor.set_premium_service(scope.premium)
+    return payment_processor
+
+
+def _member_service(scope: RequestScope) -> MemberService:
+    uow = scope.unit_of_work
+    return MemberService(
+        member_repository=scope.repository(MemberRepository),
+        invite_repository=scope.repository(InviteRepository),
+        unit_of_work=uow,
+    )
+
+
+def _activity_service(scope: RequestScope) -> ActivityTrackingService:
+    uow = scope.unit_of_work
+    return ActivityTrackingService(
+        activity_repository=scope.repository(ActivityRepository),
+        member_repository=scope.repository(MemberRepository),
+        unit_of_work=uow,
+        activity_buffer=scope.bot.activity_buffer,
+        ranking_index=scope.bot.ranking_index,
+    )
+
+
+def _activity_tracking_service(scope: RequestScope) -> ActivityTrackingService:
+    uow = scope.unit_of_work
+    return ActivityTrackingService(
+        activity_repository=scope.repository(ActivityRepository),
+        member_repository=scope.repository(MemberRepository),
+        guild=scope.bot.guild,
+        unit_of_work=uow,
+        activity_buffer=scope.bot.activity_buffer,
+        ranking_index=scope.bot.ranking_index,
+    )
+
+
+def _moderation_service(scope: RequestScope) -> ModerationService:
+    uow = scope.unit_of_work
+    return ModerationService(
+        moderation_repository=scope.repository(ModerationRepository),
+        member_repository=scope.repository(MemberRepository),
+        unit_of_work=uow,
+    )
+
+
+def _invite_service(scope: RequestScope) -> InviteService:
+    uow = scope.unit_of_work
+    return InviteService(
+        invite_repository=scope.repository(InviteRepository),
+        member_repository=scope.repository(MemberRepository),
+        unit_of_work=uow,
+    )
+
+
+def _team_service(scope: RequestScope) -> TeamManagementService:
+    return TeamManagementService(bot=scope.bot, unit_of_work=scope.unit_of_work)
+
+
+def _voice_channel_service(scope: RequestScope) -> VoiceChannelService:
+    uow = scope.unit_of_work
+    return VoiceChannelService(channel_repository=scope.repository(ChannelRepository), bot=scope.bot, unit_of_work=uow)
+
+
+def _autokick_service(scope: RequestScope) -> AutoKickService:
+    uow = scope.unit_of_work
+    return AutoKickService(channel_repository=scope.repository(ChannelRepository), unit_of_work=uow)
+
+
+# Session-bound services by interface
+SERVICE_FACTORIES: Dict[type, Callable[[RequestScope], Any]] = {
+    IRoleService: _role_service,
+    IMessageSender: _message_sender,
+    INotificationService: _notification_service,
+    IPremiumService: _premium_service,
+    IPaymentProcessor: _payment_processor,
+    IMemberService: _member_service,
+    IActivityService: _activity_service,
+    IActivityTrackingService: _activity_tracking_service,
+    IModerationService: _moderation_service,
+    IInviteService: _invite_service,
+    ITeamManagementService: _team_service,
+    IVoiceChannelService: _voice_channel_service,
+    IAutoKickService: _autokick_service,
+}
@@ -39,6 +39,10 @@ class IActivityTrackingService(ABC):
     async def get_member_stats(self, session: AsyncSession, member_id: int, days_back: int = 7) -> Dict[str, any]:
         """Get comprehensive stats for a member."""
 
+    @abstractmethod
+    async def get_member_rank(self, session: AsyncSession, member_id: int, days_back: int = 7) -> Dict[str, any]:
+        """Get member's total points, position and tier without the activity breakdown."""
+
     @abstractmethod
     async def get_leaderboard(
         self, session: AsyncSession, limit: int = 10, days_back: int = 7
@@ -97,6 +101,10 @@ class IActivityTrackingService(ABC):
     async def track_voice_activity(self, member_id: int, channel_id: int, is_with_others: bool = True) -> None:
         """Track voice activity for a member in a specific channel."""
 
+    @abstractmethod
+    async def track_voice_activity_bulk(self, awards: List[Tuple[int, int, bool]]) -> int:
+        """Award one voice tick to many (member_id, channel_id, is_with_others) at once."""
+
     @abstractmethod
     async def track_promotion_activity(self, member_id: int) -> None:
         """Track promotion activity for a member."""
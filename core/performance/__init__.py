@@ -3,11 +3,16 @@ Performance optimization utilities for Discord bot.
 
 This module provides tools for:
 - Database query optimization
-- Caching frequently accessed data
+- Caching frequently accessed data (one size-bounded tiered cache)
 - Performance monitoring and metrics
+- N+1 query detection in development and tests
+- Skipping member existence checks for known members
+- In-memory autokick lookups on voice joins
+- Per-owner snapshots of stored voice channel permissions
 - Connection pool management
 """
 
+from .autokick_index import AutoKickIndex, autokick_index
 from .cache_manager import CacheKeyBuilder, CacheManager, cache, cache_manager
 from .database_optimizer import (
     DatabaseOptimizer,
@@ -17,8 +22,36 @@ from .database_optimizer import (
     db_optimizer,
     optimize_query,
 )
+from .member_cache import MemberExistenceCache, member_cache
+from .n_plus_one import NPlusOneDetected, NPlusOneDetector, n_plus_one_detector
+from .query_monitor import QueryTimingMonitor, query_monitor, track_queries
+from .tiered_cache import RedisTier, TieredCache, configure_tiered_cache, estimate_size, get_tiered_cache
+from .voice_permission_cache import VoicePermissionCache, voice_permission_cache
 
 __all__ = [
+    # Query timing
+    "QueryTimingMonitor",
+    "query_monitor",
+    "track_queries",
+    # N+1 detection
+    "NPlusOneDetector",
+    "NPlusOneDetected",
+    "n_plus_one_detector",
+    # Member existence
+    "MemberExistenceCache",
+    "member_cache",
+    # Autokick index
+    "AutoKickIndex",
+    "autokick_index",
+    # Voice permission snapshots
+    "VoicePermissionCache",
+    "voice_permission_cache",
+    # Tiered cache
+    "TieredCache",
+    "RedisTier",
+    "get_tiered_cache",
+    "configure_tiered_cache",
+    "estimate_size",
     # Cache management
     "CacheManager",
     "CacheKeyBuilder",
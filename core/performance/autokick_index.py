@@ -0,0 +1,158 @@
+"""
+Process-wide in-memory index of autokick entries.
+
+Every voice join has to know whether anyone in the joined channel has the
+joining member on their autokick list. The whole ``autokicks`` table is
+loaded once at startup; ``AutoKickRepository`` and ``AutoKickQueries``
+apply each committed add/remove to it, so join checks and the per-owner
+limit check never touch the database.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import select
+
+logger = logging.getLogger(__name__)
+
+
+def _autokick_model():
+    from datasources.models import AutoKick
+
+    return AutoKick
+
+
+class AutoKickIndex:
+    """
+    ``target_id -> owner IDs`` for join checks and ``owner_id -> target IDs``
+    for limits and listings, kept in step with each other.
+    """
+
+    def __init__(self):
+        self._owners_by_target: Dict[int, Set[int]] = {}
+        self._targets_by_owner: Dict[int, Set[int]] = {}
+        self.is_loaded = False
+        # Writes committed while a load is running, replayed on top of the loaded rows
+        self._writes_during_load: Optional[List[Tuple[bool, int, int]]] = None
+        self._load_lock: Optional[asyncio.Lock] = None
+        self._reserve_lock: Optional[asyncio.Lock] = None
+        self.checks = 0
+        self.matches = 0
+
+    def __len__(self) -> int:
+        return sum(len(targets) for targets in self._targets_by_owner.values())
+
+    def __contains__(self, entry: Tuple[int, int]) -> bool:
+        owner_id, target_id = entry
+        return owner_id in self._owners_by_target.get(target_id, ())
+
+    async def load(self, session_factory) -> int:
+        """Replace the index with every autokick from the database; returns the number of entries."""
+        AutoKick = _autokick_model()
+        self._writes_during_load = []
+        try:
+            async with session_factory() as session:
+                result = await session.execute(select(AutoKick.owner_id, AutoKick.target_id))
+                rows = result.all()
+
+            writes, self._writes_during_load = self._writes_during_load, None
+            self._owners_by_target = {}
+            self._targets_by_owner = {}
+            for owner_id, target_id in rows:
+                self._add(owner_id, target_id)
+            for added, owner_id, target_id in writes:
+                (self._add if added else self._remove)(owner_id, target_id)
+        finally:
+            self._writes_during_load = None
+
+        self.is_loaded = True
+        logger.info(f"Autokick index loaded: {len(rows)} entries")
+        return len(self)
+
+    async def ensure_loaded(self, session_factory) -> None:
+        """Load the index unless it already is (concurrent callers wait for a single load)."""
+        if self.is_loaded:
+            return
+        if self._load_lock is None:
+            self._load_lock = asyncio.Lock()
+        async with self._load_lock:
+            if not self.is_loaded:
+                await self.load(session_factory)
+
+    async def reserve(self, owner_id: int, target_id: int, limit: int) -> str:
+        """Claim an entry before it is written: ``"reserved"``, ``"exists"`` or ``"limit"``.
+
+        The check and the claim happen under one lock, so concurrent adds by the
+        same owner cannot both pass the limit or duplicate check. A reservation
+        whose write fails must be undone with ``remove``.
+        """
+        if self._reserve_lock is None:
+            self._reserve_lock = asyncio.Lock()
+        async with self._reserve_lock:
+            if (owner_id, target_id) in self:
+                return "exists"
+            if self.count_for_owner(owner_id) >= limit:
+                return "limit"
+            self.add(owner_id, target_id)
+            return "reserved"
+
+    def add(self, owner_id: int, target_id: int) -> None:
+        """Record a committed (or reserved) autokick."""
+        if self._writes_during_load is not None:
+            self._writes_during_load.append((True, owner_id, target_id))
+        self._add(owner_id, target_id)
+
+    def remove(self, owner_id: int, target_id: int) -> None:
+        """Forget a deleted autokick."""
+        if self._writes_during_load is not None:
+            self._writes_during_load.append((False, owner_id, target_id))
+        self._remove(owner_id, target_id)
+
+    def _add(self, owner_id: int, target_id: int) -> None:
+        self._owners_by_target.setdefault(target_id, set()).add(owner_id)
+        self._targets_by_owner.setdefault(owner_id, set()).add(target_id)
+
+    def _remove(self, owner_id: int, target_id: int) -> None:
+        owners = self._owners_by_target.get(target_id)
+        if owners is not None:
+            owners.discard(owner_id)
+            if not owners:
+                del self._owners_by_target[target_id]
+        targets = self._targets_by_owner.get(owner_id)
+        if targets is not None:
+            targets.discard(target_id)
+            if not targets:
+                del self._targets_by_owner[owner_id]
+
+    def count_for_owner(self, owner_id: int) -> int:
+        return len(self._targets_by_owner.get(owner_id, ()))
+
+    def targets_of(self, owner_id: int) -> List[int]:
+        return list(self._targets_by_owner.get(owner_id, ()))
+
+    def matching_owners(self, target_id: int, member_ids: Iterable[int]) -> Set[int]:
+        """Owners among ``member_ids`` who have ``target_id`` on their autokick list."""
+        self.checks += 1
+        owners = self._owners_by_target.get(target_id)
+        if not owners:
+            return set()
+        matching = owners.intersection(member_ids)
+        if matching:
+            self.matches += 1
+        return matching
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Size and check counters."""
+        return {
+            "loaded": self.is_loaded,
+            "entries": len(self),
+            "targets": len(self._owners_by_target),
+            "owners": len(self._targets_by_owner),
+            "checks": self.checks,
+            "matches": self.matches,
+        }
+
+
+# Process-wide index shared by every AutoKickManager and the autokick writers
+autokick_index = AutoKickIndex()
@@ -1,168 +1,97 @@
 """
 Cache management system for Discord bot.
 
-Provides in-memory caching with TTL, LRU eviction,
-and Redis support for distributed caching.
+Named LRU caches with TTL, stored as namespaces of the shared tiered cache
+(which provides the memory bound and optional Redis L2).
 """
 
-import asyncio
 import logging
-import time
-from collections import OrderedDict
 from datetime import datetime
 from functools import wraps
 from typing import Any, Callable, Dict, Optional, TypeVar
 
+from .tiered_cache import TieredCache, get_tiered_cache
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
 
-class CacheEntry:
-    """Represents a cached value with metadata."""
+class LRUCache:
+    """Least Recently Used cache over one namespace of a ``TieredCache``."""
 
-    def __init__(self, value: Any, ttl_seconds: int):
-        self.value = value
-        self.created_at = time.time()
-        self.ttl_seconds = ttl_seconds
-        self.access_count = 0
-        self.last_accessed = self.created_at
+    def __init__(self, max_size: int = 1000, namespace: str = "default", backend: Optional[TieredCache] = None):
+        self.max_size = max_size
+        self.namespace = namespace
+        self.backend = backend if backend is not None else TieredCache(max_entries=max_size)
+        self.backend.set_namespace_limit(namespace, max_size)
 
     @property
-    def is_expired(self) -> bool:
-        """Check if cache entry has expired."""
-        return time.time() - self.created_at > self.ttl_seconds
-
-    def access(self):
-        """Record an access to this cache entry."""
-        self.access_count += 1
-        self.last_accessed = time.time()
-
-
-class LRUCache:
-    """Least Recently Used cache implementation."""
+    def hits(self) -> int:
+        return self.backend.namespace_stats(self.namespace)["hits"]
 
-    def __init__(self, max_size: int = 1000):
-        self.max_size = max_size
-        self.cache: OrderedDict[str, CacheEntry] = OrderedDict()
-        self.hits = 0
-        self.misses = 0
+    @property
+    def misses(self) -> int:
+        return self.backend.namespace_stats(self.namespace)["misses"]
 
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache."""
-        if key not in self.cache:
-            self.misses += 1
-            return None
-
-        entry = self.cache[key]
-
-        # Check expiration
-        if entry.is_expired:
-            del self.cache[key]
-            self.misses += 1
-            return None
-
-        # Move to end (most recently used)
-        self.cache.move_to_end(key)
-        entry.access()
-        self.hits += 1
-
-        return entry.value
+        return self.backend.get_nowait(self.namespace, key)
 
     def set(self, key: str, value: Any, ttl_seconds: int = 300):
         """Set value in cache."""
-        # Remove if exists to update position
-        if key in self.cache:
-            del self.cache[key]
-
-        # Add new entry
-        self.cache[key] = CacheEntry(value, ttl_seconds)
-
-        # Evict oldest if over capacity
-        while len(self.cache) > self.max_size:
-            self.cache.popitem(last=False)
+        self.backend.set_nowait(self.namespace, key, value, ttl=ttl_seconds)
 
     def delete(self, key: str) -> bool:
         """Delete key from cache."""
-        if key in self.cache:
-            del self.cache[key]
-            return True
-        return False
+        return self.backend.delete_nowait(self.namespace, key)
 
     def clear(self):
         """Clear all cache entries."""
-        self.cache.clear()
-        self.hits = 0
-        self.misses = 0
+        self.backend.invalidate_namespace_nowait(self.namespace)
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
-        total_requests = self.hits + self.misses
-        hit_rate = self.hits / total_requests if total_requests > 0 else 0
-
+        stats = self.backend.namespace_stats(self.namespace)
         return {
-            "size": len(self.cache),
+            "size": stats["current_size"],
             "max_size": self.max_size,
-            "hits": self.hits,
-            "misses": self.misses,
-            "hit_rate": hit_rate,
-            "total_requests": total_requests,
+            "bytes": stats["bytes"],
+            "hits": stats["hits"],
+            "misses": stats["misses"],
+            "hit_rate": stats["hit_ratio"],
+            "total_requests": stats["hits"] + stats["misses"],
         }
 
     def cleanup_expired(self):
-        """Remove all expired entries."""
-        expired_keys = [key for key, entry in self.cache.items() if entry.is_expired]
-
-        for key in expired_keys:
-            del self.cache[key]
-
-        return len(expired_keys)
+        """Remove expired entries; the backend also does this in the background."""
+        return self.backend.remove_expired()
 
 
 class CacheManager:
-    """Main cache manager supporting multiple cache backends."""
+    """Main cache manager with named caches in the shared tiered cache."""
 
-    def __init__(self, default_ttl: int = 300):
+    def __init__(self, default_ttl: int = 300, backend: Optional[TieredCache] = None):
         self.default_ttl = default_ttl
-        self.caches: Dict[str, LRUCache] = {
-            "default": LRUCache(max_size=1000),
-            "members": LRUCache(max_size=5000),
-            "roles": LRUCache(max_size=500),
-            "activities": LRUCache(max_size=2000),
-            "permissions": LRUCache(max_size=1000),
-        }
-        self._cleanup_task = None
-        # Don't start cleanup task in __init__, start it manually when bot starts
-
-    def _start_cleanup_task(self):
-        """Start periodic cleanup of expired entries."""
-
-        async def cleanup_loop():
-            while True:
-                await asyncio.sleep(60)  # Run every minute
-                total_cleaned = 0
-
-                for cache_name, cache in self.caches.items():
-                    cleaned = cache.cleanup_expired()
-                    if cleaned > 0:
-                        logger.info(f"Cleaned {cleaned} expired entries from {cache_name} cache")
-                    total_cleaned += cleaned
-
-        try:
-            self._cleanup_task = asyncio.create_task(cleanup_loop())
-        except RuntimeError:
-            # No event loop running yet, skip cleanup task
-            logger.debug("Skipping cleanup task creation - no event loop")
+        self.backend = backend if backend is not None else get_tiered_cache()
+        self.caches: Dict[str, LRUCache] = {}
+        for namespace, max_size in (
+            ("default", 1000),
+            ("members", 5000),
+            ("roles", 500),
+            ("activities", 2000),
+            ("permissions", 1000),
+        ):
+            self.caches[namespace] = LRUCache(max_size=max_size, namespace=namespace, backend=self.backend)
 
     async def start(self):
-        """Start the cache manager cleanup task."""
-        if self._cleanup_task is None:
-            self._start_cleanup_task()
+        """Start expiry of the backing cache."""
+        await self.backend.start()
 
     def get_cache(self, namespace: str = "default") -> LRUCache:
         """Get cache for specific namespace."""
         if namespace not in self.caches:
-            self.caches[namespace] = LRUCache()
+            self.caches[namespace] = LRUCache(namespace=namespace, backend=self.backend)
         return self.caches[namespace]
 
     async def get(self, key: str, namespace: str = "default") -> Optional[Any]:
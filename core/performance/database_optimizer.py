@@ -6,18 +6,112 @@ managing connection pools, and implementing caching strategies.
 """
 
 import asyncio
+import hashlib
+import inspect
 import logging
 import time
 from collections import defaultdict
-from datetime import datetime, timedelta
+from dataclasses import dataclass
+from datetime import date, datetime
+from enum import Enum
 from functools import wraps
 from typing import Any, Callable, Dict, List, Optional
 
+from sqlalchemy import inspect as sa_inspect
 from sqlalchemy import text
+from sqlalchemy.exc import NoInspectionAvailable
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from .pool_monitor import engine_pool_kwargs, load_pool_settings
+from .tiered_cache import TieredCache, get_tiered_cache
 
 logger = logging.getLogger(__name__)
 
+# Namespace of cached query results in the shared tiered cache
+DB_RESULTS_NAMESPACE = "db_results"
+
+# Entry cap of cached query results, on top of the shared cache's memory limit
+DB_RESULTS_MAX_ENTRIES = 10000
+
+# Distinguishes a cached None from a miss
+_MISSING = object()
+
+# Argument names that never take part in a cache key
+_SKIPPED_PARAMS = frozenset({"self", "cls", "session"})
+
+
+def _stable_repr(value: Any) -> str:
+    """Representation of a cache key argument that is the same across processes and object instances."""
+    if value is None or isinstance(value, (bool, int, float, str, bytes, Enum, date)):
+        return repr(value)
+    if isinstance(value, (list, tuple)):
+        return "(" + ",".join(_stable_repr(item) for item in value) + ")"
+    if isinstance(value, (set, frozenset)):
+        return "{" + ",".join(sorted(_stable_repr(item) for item in value)) + "}"
+    if isinstance(value, dict):
+        return "{" + ",".join(sorted(f"{_stable_repr(k)}:{_stable_repr(v)}" for k, v in value.items())) + "}"
+
+    # ORM instances are identified by their primary key
+    try:
+        state = sa_inspect(value)
+        if state.identity is not None:
+            return f"{type(value).__name__}{_stable_repr(state.identity)}"
+    except NoInspectionAvailable:
+        pass
+
+    # Discord objects and other models with an ID
+    object_id = getattr(value, "id", None)
+    if isinstance(object_id, int):
+        return f"{type(value).__name__}#{object_id}"
+    return repr(value)
+
+
+def make_cache_key(func: Callable, param_names: List[str], args: tuple, kwargs: dict) -> str:
+    """Cache key of a call; ``self``, sessions and other session-like arguments are skipped."""
+    parts = []
+    for index, value in enumerate(args):
+        name = param_names[index] if index < len(param_names) else f"arg{index}"
+        if name in _SKIPPED_PARAMS or isinstance(value, (AsyncSession, Session)):
+            continue
+        parts.append(f"{name}={_stable_repr(value)}")
+    for name in sorted(kwargs):
+        value = kwargs[name]
+        if name in _SKIPPED_PARAMS or isinstance(value, (AsyncSession, Session)):
+            continue
+        parts.append(f"{name}={_stable_repr(value)}")
+
+    key_data = ",".join(parts)
+    # Hash long keys to bound key memory
+    if len(key_data) > 200:
+        key_data = hashlib.md5(key_data.encode()).hexdigest()
+    return f"{func.__module__}.{func.__qualname__}:{key_data}"
+
+
+@dataclass
+class CachedFunctionStats:
+    """Hit/miss counters of one ``cache_result``-decorated function."""
+
+    hits: int = 0
+    misses: int = 0
+    miss_time: float = 0.0
+    time_saved: float = 0.0
+
+    @property
+    def avg_miss_time(self) -> float:
+        """Average time of an uncached call."""
+        return self.miss_time / self.misses if self.misses else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / total if total else 0.0,
+            "avg_miss_ms": self.avg_miss_time * 1000,
+            "time_saved_s": self.time_saved,
+        }
+
 
 class QueryPerformanceMonitor:
     """Monitor and analyze database query performance."""
@@ -68,12 +162,11 @@ class QueryPerformanceMonitor:
 class DatabaseOptimizer:
     """Optimize database operations and manage performance."""
 
-    def __init__(self):
+    def __init__(self, cache: Optional[TieredCache] = None):
         self.monitor = QueryPerformanceMonitor()
-        self._cache = {}
-        self._cache_ttl = {}
-        self._connection_pool_size = 20
-        self._connection_pool_overflow = 10
+        self._cache = cache if cache is not None else get_tiered_cache()
+        self._cache.set_namespace_limit(DB_RESULTS_NAMESPACE, DB_RESULTS_MAX_ENTRIES)
+        self._cache_stats: Dict[str, CachedFunctionStats] = {}
 
     def optimize_query(self, func: Callable) -> Callable:
         """Decorator to optimize and monitor database queries."""
@@ -105,37 +198,45 @@ class DatabaseOptimizer:
         """
         Decorator to cache query results.
 
+        Results live in the shared tiered cache, so they count toward its memory
+        limit and expire in the background. Keys are built from the call's
+        arguments, skipping ``self`` and sessions; ORM and Discord objects are
+        keyed by ID.
+
         Args:
             ttl_seconds: Time to live for cache entries
             key_func: Function to generate cache key from arguments
         """
 
         def decorator(func: Callable) -> Callable:
+            func_name = f"{func.__module__}.{func.__qualname__}"
+            param_names = list(inspect.signature(func).parameters)
+            stats = self._cache_stats.setdefault(func_name, CachedFunctionStats())
+
             @wraps(func)
             async def wrapper(*args, **kwargs):
                 # Generate cache key
                 if key_func:
-                    cache_key = key_func(*args, **kwargs)
+                    cache_key = f"{func_name}:{key_func(*args, **kwargs)}"
                 else:
-                    # Simple key generation
-                    cache_key = f"{func.__name__}:{str(args)}:{str(kwargs)}"
+                    cache_key = make_cache_key(func, param_names, args, kwargs)
 
                 # Check cache
-                if cache_key in self._cache:
-                    if datetime.now() < self._cache_ttl[cache_key]:
-                        logger.debug(f"Cache hit for {cache_key}")
-                        return self._cache[cache_key]
-                    else:
-                        # Expired
-                        del self._cache[cache_key]
-                        del self._cache_ttl[cache_key]
+                cached = self._cache.get_nowait(DB_RESULTS_NAMESPACE, cache_key, _MISSING)
+                if cached is not _MISSING:
+                    stats.hits += 1
+                    stats.time_saved += stats.avg_miss_time
+                    logger.debug(f"Cache hit for {cache_key}")
+                    return cached
 
                 # Execute query
+                start_time = time.perf_counter()
                 result = await func(*args, **kwargs)
+                stats.misses += 1
+                stats.miss_time += time.perf_counter() - start_time
 
                 # Store in cache
-                self._cache[cache_key] = result
-                self._cache_ttl[cache_key] = datetime.now() + timedelta(seconds=ttl_seconds)
+                self._cache.set_nowait(DB_RESULTS_NAMESPACE, cache_key, result, ttl=ttl_seconds)
 
                 return result
 
@@ -143,18 +244,20 @@ class DatabaseOptimizer:
 
         return decorator
 
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Per-function hit/miss counters and estimated time saved, plus the result namespace size."""
+        return {
+            "functions": {name: stats.as_dict() for name, stats in self._cache_stats.items()},
+            "store": self._cache.namespace_stats(DB_RESULTS_NAMESPACE),
+        }
+
     def clear_cache(self, pattern: Optional[str] = None):
         """Clear cache entries matching pattern."""
         if pattern:
-            keys_to_remove = [k for k in self._cache.keys() if pattern in k]
-            for key in keys_to_remove:
-                del self._cache[key]
-                del self._cache_ttl[key]
-
-            logger.info(f"Cleared {len(keys_to_remove)} cache entries matching '{pattern}'")
+            removed = self._cache.invalidate_namespace_nowait(DB_RESULTS_NAMESPACE, lambda key: pattern in key)
+            logger.info(f"Cleared {removed} cache entries matching '{pattern}'")
         else:
-            self._cache.clear()
-            self._cache_ttl.clear()
+            self._cache.invalidate_namespace_nowait(DB_RESULTS_NAMESPACE)
             logger.info("Cleared all cache entries")
 
     async def analyze_indexes(self, session: AsyncSession) -> Dict[str, Any]:
@@ -241,16 +344,9 @@ class DatabaseOptimizer:
             logger.warning(f"Could not fetch slow queries (pg_stat_statements may not be enabled): {e}")
             return []
 
-    def get_connection_pool_config(self) -> Dict[str, Any]:
-        """Get optimized connection pool configuration."""
-        return {
-            "pool_size": self._connection_pool_size,
-            "max_overflow": self._connection_pool_overflow,
-            "pool_timeout": 30,
-            "pool_recycle": 1800,  # Recycle connections after 30 minutes
-            "pool_pre_ping": True,  # Test connections before using
-            "echo_pool": False,  # Set to True for debugging
-        }
+    def get_connection_pool_config(self, config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Connection pool configuration the bot's engine is created with."""
+        return engine_pool_kwargs(load_pool_settings(config))
 
     async def optimize_tables(self, session: AsyncSession) -> Dict[str, Any]:
         """Run maintenance operations on tables."""
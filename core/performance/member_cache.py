@@ -0,0 +1,138 @@
+"""
+Process-wide set of member IDs known to exist in ``members``.
+
+Nearly every write (activity points, autokicks, invites, payments) needs the
+member row to exist first and used to ``SELECT`` it. IDs found here skip the
+database; unknown IDs are inserted with ``ON CONFLICT DO NOTHING`` and become
+known once the inserting transaction commits, so a rollback never leaves an
+ID cached without its row. Members are never deleted, so the set only grows.
+"""
+
+import logging
+from typing import Any, Dict, Iterable, List, Set
+
+from sqlalchemy import event, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# One bind parameter per row, well under asyncpg's 32767 limit
+INSERT_CHUNK_SIZE = 10_000
+
+# Session.info key of IDs inserted in the session's current transaction
+PENDING_KEY = "member_cache_pending"
+
+
+def _member_model():
+    from datasources.models import Member
+
+    return Member
+
+
+class MemberExistenceCache:
+    """
+    Exact set of existing member IDs.
+
+    A plain ``set`` rather than a bloom filter: a false positive would skip an
+    insert the following write depends on, and Discord IDs cost ~70 bytes each.
+    """
+
+    def __init__(self):
+        self._known: Set[int] = set()
+        self.is_loaded = False
+        self.hits = 0
+        self.misses = 0
+        self.inserted = 0
+        self._installed = False
+
+    def __contains__(self, member_id: int) -> bool:
+        return member_id in self._known
+
+    def __len__(self) -> int:
+        return len(self._known)
+
+    def install(self) -> None:
+        """Promote pending IDs on commit and drop them on rollback, for every session."""
+        if self._installed:
+            return
+        event.listen(Session, "after_commit", self._after_commit)
+        event.listen(Session, "after_soft_rollback", self._discard_pending)
+        event.listen(Session, "after_transaction_end", self._after_transaction_end)
+        self._installed = True
+
+    async def load(self, session_factory) -> int:
+        """Add every member ID from the database; returns the number of known IDs."""
+        Member = _member_model()
+        async with session_factory() as session:
+            result = await session.execute(select(Member.id))
+            # Merged rather than replaced: IDs committed while loading stay known
+            self._known.update(result.scalars())
+        self.is_loaded = True
+        logger.info(f"Member cache loaded: {len(self._known)} members")
+        return len(self._known)
+
+    def missing(self, member_ids: Iterable[int]) -> List[int]:
+        """Sorted IDs not known to exist (sorted for a stable lock order between writers)."""
+        missing = set()
+        for member_id in member_ids:
+            if member_id in self._known:
+                self.hits += 1
+            else:
+                missing.add(member_id)
+        self.misses += len(missing)
+        return sorted(missing)
+
+    async def ensure(self, session, member_ids: Iterable[int]) -> int:
+        """Make sure the members exist, touching the database only for unknown IDs.
+
+        Returns:
+            Number of IDs that had to be sent to the database
+        """
+        pending = session.info.get(PENDING_KEY, ())
+        missing = [member_id for member_id in self.missing(member_ids) if member_id not in pending]
+        if not missing:
+            return 0
+
+        Member = _member_model()
+        for i in range(0, len(missing), INSERT_CHUNK_SIZE):
+            chunk = missing[i : i + INSERT_CHUNK_SIZE]
+            result = await session.execute(
+                insert(Member).values([{"id": member_id} for member_id in chunk]).on_conflict_do_nothing()
+            )
+            self.inserted += max(result.rowcount, 0)
+        self.mark_known(session, missing)
+        return len(missing)
+
+    def mark_known(self, session, member_ids: Iterable[int]) -> None:
+        """Record IDs whose rows this session wrote; they become known when it commits."""
+        session.info.setdefault(PENDING_KEY, set()).update(member_ids)
+
+    def _after_commit(self, session: Session) -> None:
+        pending = session.info.pop(PENDING_KEY, None)
+        if pending:
+            self._known.update(pending)
+
+    def _discard_pending(self, session: Session, previous_transaction) -> None:
+        # Also on savepoint rollbacks: forgetting an inserted ID only costs one idempotent insert later
+        session.info.pop(PENDING_KEY, None)
+
+    def _after_transaction_end(self, session: Session, transaction) -> None:
+        if transaction.parent is None:
+            session.info.pop(PENDING_KEY, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Size and hit counters."""
+        lookups = self.hits + self.misses
+        return {
+            "loaded": self.is_loaded,
+            "members": len(self._known),
+            "hits": self.hits,
+            "misses": self.misses,
+            "inserted": self.inserted,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+# Process-wide cache shared by the query functions and repositories
+member_cache = MemberExistenceCache()
@@ -0,0 +1,245 @@
+"""
+N+1 query detection for development and tests.
+
+While enabled, every command, event and task invocation runs inside a
+``QueryScope`` counting the statements it issues. A statement executed
+``threshold`` or more times within one scope (typically one query per member
+inside a loop) is reported with the repository/query method that issued it
+and the application line that called into the data layer.
+"""
+
+import functools
+import logging
+import os
+import sys
+import sysconfig
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+
+from .query_monitor import fingerprint, query_origin
+
+try:
+    import greenlet
+
+    GREENLET_AVAILABLE = True
+except ImportError:
+    GREENLET_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Frames in these directories are never reported as call sites
+_LIBRARY_PATHS = tuple(
+    {os.path.abspath(sysconfig.get_paths()[name]) for name in ("stdlib", "platstdlib", "purelib", "platlib")}
+)
+_DATA_LAYER_PATHS = tuple(
+    os.path.join(PROJECT_ROOT, path) + os.sep
+    for path in ("core/performance", "core/repositories", "datasources")
+)
+
+# Innermost scope collecting statements for the running command/event/task
+active_scope: ContextVar[Optional["QueryScope"]] = ContextVar("active_query_scope", default=None)
+
+
+class NPlusOneDetected(AssertionError):
+    """Raised by ``expect_no_n_plus_one`` when a scope repeated a statement too often."""
+
+
+def _caller_frame():
+    """The frame that led to the current statement, across SQLAlchemy's asyncio greenlet bridge."""
+    frame = sys._getframe(2)
+    if GREENLET_AVAILABLE:
+        current = greenlet.getcurrent()
+        if current.parent is not None:
+            # Inside await_only(): the awaiting coroutines are suspended in the parent greenlet
+            frame = current.parent.gr_frame
+    return frame
+
+
+def application_call_site() -> Optional[str]:
+    """``path:line (function)`` of the nearest frame outside libraries and the data layer."""
+    frame = _caller_frame()
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if (
+            not filename.startswith(_DATA_LAYER_PATHS)
+            and not filename.startswith(_LIBRARY_PATHS)
+            and not filename.startswith("<")
+        ):
+            return f"{os.path.relpath(filename, PROJECT_ROOT)}:{frame.f_lineno} ({frame.f_code.co_name})"
+        frame = frame.f_back
+    return None
+
+
+class QueryScope:
+    """Statements issued by one command, event or task invocation."""
+
+    __slots__ = ("name", "parent", "statements", "counts", "sites", "findings")
+
+    def __init__(self, name: str, parent: Optional["QueryScope"] = None):
+        self.name = name
+        self.parent = parent
+        self.statements = 0
+        self.counts: Dict[str, int] = {}
+        self.sites: Dict[str, Dict[Tuple[Optional[str], Optional[str]], int]] = {}
+        self.findings: List[Dict[str, Any]] = []
+
+    def record(self, statement: str, origin: Optional[str], call_site: Optional[str]) -> None:
+        self.statements += 1
+        self.counts[statement] = self.counts.get(statement, 0) + 1
+        sites = self.sites.setdefault(statement, {})
+        sites[(origin, call_site)] = sites.get((origin, call_site), 0) + 1
+
+    def close(self, threshold: int) -> List[Dict[str, Any]]:
+        """Findings of this scope's own statements; totals and findings propagate to the parent."""
+        own = []
+        for statement, count in self.counts.items():
+            if count < threshold:
+                continue
+            (origin, call_site), _ = max(self.sites[statement].items(), key=lambda item: item[1])
+            own.append(
+                {
+                    "scope": self.name,
+                    "statement": fingerprint(statement),
+                    "count": count,
+                    "origin": origin,
+                    "call_site": call_site,
+                }
+            )
+        self.findings.extend(own)
+
+        if self.parent is not None:
+            self.parent.statements += self.statements
+            self.parent.findings.extend(self.findings)
+        return own
+
+    def summary(self) -> Dict[str, Any]:
+        return {"scope": self.name, "statements": self.statements, "n_plus_one": list(self.findings)}
+
+
+class NPlusOneDetector:
+    """
+    Opens query scopes around invocations and reports repeated statement shapes.
+
+    Disabled by default; scopes are no-ops unless the detector is enabled
+    (``database.detect_n_plus_one`` or ``DEV_MODE=true``) or forced by a test.
+    """
+
+    def __init__(self, threshold: int = 5, history: int = 100):
+        self.enabled = False
+        self.threshold = threshold
+        self.scopes = 0
+        self.total_findings = 0
+        self.recent: deque = deque(maxlen=history)
+        self.by_scope: Dict[str, Dict[str, int]] = {}
+
+    def configure(self, config: Optional[Dict[str, Any]] = None) -> "NPlusOneDetector":
+        """Apply the ``database`` config section; ``DEV_MODE=true`` also enables detection."""
+        section = (config or {}).get("database", {}) or {}
+        dev_mode = os.getenv("DEV_MODE", "false").lower() == "true"
+        self.enabled = bool(section.get("detect_n_plus_one", False)) or dev_mode
+        self.threshold = int(section.get("n_plus_one_threshold", self.threshold))
+        return self
+
+    def install(self, engine) -> None:
+        """Count statements of an (async) engine into the active scope."""
+        sync_engine = getattr(engine, "sync_engine", engine)
+        event.listen(sync_engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        scope = active_scope.get()
+        if scope is not None:
+            scope.record(statement, query_origin.get(), application_call_site())
+
+    @contextmanager
+    def scope(self, name: str, force: bool = False) -> Iterator[Optional[QueryScope]]:
+        """Collect the statements issued inside the block; yields ``None`` while disabled."""
+        if not (self.enabled or force):
+            yield None
+            return
+
+        scope = QueryScope(name, active_scope.get())
+        token = active_scope.set(scope)
+        try:
+            yield scope
+        finally:
+            active_scope.reset(token)
+            self._finish(scope)
+
+    def wrap(self, func, name: str):
+        """Run a coroutine function inside a scope on every call (used for task loops)."""
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with self.scope(name):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    @contextmanager
+    def expect_no_n_plus_one(self, name: str = "test", max_statements: Optional[int] = None) -> Iterator[QueryScope]:
+        """Fail with ``NPlusOneDetected`` if the block repeats a statement or exceeds ``max_statements``."""
+        with self.scope(name, force=True) as scope:
+            yield scope
+        if scope.findings:
+            raise NPlusOneDetected(format_findings(scope.findings))
+        if max_statements is not None and scope.statements > max_statements:
+            raise NPlusOneDetected(f"{name} issued {scope.statements} statements (budget {max_statements})")
+
+    def _finish(self, scope: QueryScope) -> None:
+        findings = scope.close(self.threshold)
+        for finding in findings:
+            logger.warning(
+                f"N+1 in {finding['scope']}: {finding['count']}x {finding['origin'] or 'raw SQL'} "
+                f"from {finding['call_site'] or 'unknown call site'}: {finding['statement'][:200]}"
+            )
+        if scope.parent is not None:
+            return
+
+        self.scopes += 1
+        self.total_findings += len(scope.findings)
+        totals = self.by_scope.setdefault(scope.name, {"runs": 0, "max_statements": 0, "n_plus_one": 0})
+        totals["runs"] += 1
+        totals["max_statements"] = max(totals["max_statements"], scope.statements)
+        totals["n_plus_one"] += len(scope.findings)
+        if scope.findings:
+            self.recent.append(scope.summary())
+
+    def reset(self) -> None:
+        """Forget recorded scopes and findings."""
+        self.scopes = 0
+        self.total_findings = 0
+        self.recent.clear()
+        self.by_scope.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters, the scopes with findings and the most recent findings."""
+        offenders = {name: totals for name, totals in self.by_scope.items() if totals["n_plus_one"]}
+        return {
+            "enabled": self.enabled,
+            "threshold": self.threshold,
+            "scopes": self.scopes,
+            "findings": self.total_findings,
+            "offending_scopes": offenders,
+            "recent": list(self.recent),
+        }
+
+
+def format_findings(findings: List[Dict[str, Any]]) -> str:
+    """Human readable list of N+1 findings."""
+    lines = []
+    for finding in findings:
+        lines.append(
+            f"{finding['scope']}: {finding['count']}x {finding['origin'] or 'raw SQL'} "
+            f"at {finding['call_site'] or 'unknown call site'}\n    {finding['statement'][:300]}"
+        )
+    return "N+1 queries detected:\n" + "\n".join(lines)
+
+
+# Process-wide detector installed on the bot's engines
+n_plus_one_detector = NPlusOneDetector()
@@ -0,0 +1,254 @@
+"""
+Connection pool telemetry.
+
+Pool and statement cache settings are read from the ``database`` config
+section (overridable by environment variables) and the engine's pool reports
+checkout waits, pre-ping cost and in-use/overflow gauges, so the pool can be
+sized from data gathered during event spikes.
+"""
+
+import logging
+import math
+import os
+import time
+from bisect import bisect_left
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (ms) of the checkout wait histogram buckets; the last bucket is open-ended
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+# Pool and statement cache settings: config key -> (environment variable, type, default)
+POOL_SETTINGS = {
+    "pool_size": ("DB_POOL_SIZE", int, 20),
+    "max_overflow": ("DB_MAX_OVERFLOW", int, 40),
+    "pool_timeout": ("DB_POOL_TIMEOUT", float, 30.0),
+    "pool_recycle": ("DB_POOL_RECYCLE", int, 1800),
+    "pool_pre_ping": ("DB_POOL_PRE_PING", bool, True),
+    "checkout_warn_ms": ("DB_CHECKOUT_WARN_MS", float, 250.0),
+    # SQLAlchemy compiled statement cache (per engine; SQLAlchemy's default is 500)
+    "query_cache_size": ("DB_QUERY_CACHE_SIZE", int, 1200),
+    # asyncpg prepared statements kept per connection (SQLAlchemy's default is 100)
+    "prepared_statement_cache_size": ("DB_PREPARED_STATEMENT_CACHE_SIZE", int, 500),
+}
+
+# Replica pool sizing (``database.replica`` config section), smaller than the primary's by default
+REPLICA_POOL_SETTINGS = {
+    "pool_size": ("DB_REPLICA_POOL_SIZE", int, 10),
+    "max_overflow": ("DB_REPLICA_MAX_OVERFLOW", int, 20),
+}
+
+# Minimum seconds between two slow-checkout warnings
+WARN_INTERVAL = 30.0
+
+
+def _parse(value: str, value_type: type) -> Any:
+    if value_type is bool:
+        return value.strip().lower() in ("1", "true", "yes", "on")
+    return value_type(value)
+
+
+def load_pool_settings(config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Pool settings from the ``database`` config section; environment variables take precedence."""
+    section = (config or {}).get("database", {}) or {}
+    settings = {}
+    for key, (env_name, value_type, default) in POOL_SETTINGS.items():
+        env_value = os.environ.get(env_name)
+        if env_value:
+            settings[key] = _parse(env_value, value_type)
+        else:
+            settings[key] = value_type(section.get(key, default))
+    return settings
+
+
+def load_replica_pool_settings(config: Optional[Dict[str, Any]], settings: Dict[str, Any]) -> Dict[str, Any]:
+    """``settings`` with the replica's own pool sizing (``database.replica``, overridable by environment variables)."""
+    section = ((config or {}).get("database", {}) or {}).get("replica", {}) or {}
+    replica_settings = dict(settings)
+    for key, (env_name, value_type, default) in REPLICA_POOL_SETTINGS.items():
+        env_value = os.environ.get(env_name)
+        replica_settings[key] = _parse(env_value, value_type) if env_value else value_type(section.get(key, default))
+    return replica_settings
+
+
+def engine_pool_kwargs(settings: Dict[str, Any]) -> Dict[str, Any]:
+    """``create_async_engine`` (postgresql+asyncpg) keyword arguments for the given pool settings."""
+    return {
+        "poolclass": InstrumentedAsyncQueuePool,
+        "pool_size": settings["pool_size"],
+        "max_overflow": settings["max_overflow"],
+        "pool_timeout": settings["pool_timeout"],
+        "pool_recycle": settings["pool_recycle"],
+        "pool_pre_ping": settings["pool_pre_ping"],
+        "query_cache_size": settings["query_cache_size"],
+        "connect_args": {"prepared_statement_cache_size": settings["prepared_statement_cache_size"]},
+    }
+
+
+class TimedCheckoutMixin:
+    """Pool mixin timing each checkout (queue wait, connect and pre-ping) for an attached monitor."""
+
+    monitor: Optional["PoolMonitor"] = None
+
+    def connect(self):
+        monitor = self.monitor
+        if monitor is None:
+            return super().connect()
+
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except Exception:
+            monitor.record_checkout_failure()
+            raise
+        monitor.record_checkout_wait(time.perf_counter() - started)
+        return connection
+
+    def recreate(self):
+        # dispose() builds a fresh pool of the same class; keep reporting to the same monitor
+        pool = super().recreate()
+        pool.monitor = self.monitor
+        if self.monitor is not None:
+            self.monitor.pool = pool
+        return pool
+
+
+class InstrumentedAsyncQueuePool(TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    """The asyncio queue pool with checkout timing."""
+
+
+class PoolMonitor:
+    """Checkout wait histogram, pre-ping cost and gauges of one engine's pool."""
+
+    def __init__(self, name: str = "primary", warn_threshold_ms: float = 250.0):
+        self.name = name
+        self.warn_threshold = warn_threshold_ms / 1000
+        self.pool = None
+
+        self.wait_buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+        self.checkouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.slow_checkouts = 0
+        self.failed_checkouts = 0
+
+        self.pings = 0
+        self.total_ping = 0.0
+        self.max_ping = 0.0
+
+        self.connects = 0
+        self.invalidations = 0
+        self.peak_checked_out = 0
+
+        self._last_warning = 0.0
+        self._suppressed_warnings = 0
+
+    def install(self, engine) -> None:
+        """Attach to an (async) engine created with ``engine_pool_kwargs``."""
+        sync_engine = getattr(engine, "sync_engine", engine)
+        pool = sync_engine.pool
+        if not isinstance(pool, TimedCheckoutMixin):
+            logger.warning(f"Pool {self.name} is {type(pool).__name__}; checkout waits will not be timed")
+        else:
+            pool.monitor = self
+        self.pool = pool
+
+        event.listen(pool, "connect", self._on_connect)
+        event.listen(pool, "checkout", self._on_checkout)
+        event.listen(pool, "invalidate", self._on_invalidate)
+
+        # Pre-ping goes through dialect.do_ping; time it on this engine's dialect only
+        dialect = sync_engine.dialect
+        do_ping = dialect.do_ping
+
+        def timed_ping(dbapi_connection):
+            started = time.perf_counter()
+            try:
+                return do_ping(dbapi_connection)
+            finally:
+                self.record_ping(time.perf_counter() - started)
+
+        dialect.do_ping = timed_ping
+
+    # Recording
+
+    def record_checkout_wait(self, seconds: float) -> None:
+        self.checkouts += 1
+        self.total_wait += seconds
+        if seconds > self.max_wait:
+            self.max_wait = seconds
+        self.wait_buckets[bisect_left(WAIT_BUCKETS_MS, seconds * 1000)] += 1
+
+        if seconds >= self.warn_threshold:
+            self.slow_checkouts += 1
+            self._warn_slow_checkout(seconds)
+
+    def record_checkout_failure(self) -> None:
+        self.failed_checkouts += 1
+
+    def record_ping(self, seconds: float) -> None:
+        self.pings += 1
+        self.total_ping += seconds
+        if seconds > self.max_ping:
+            self.max_ping = seconds
+
+    def _on_connect(self, dbapi_connection, connection_record) -> None:
+        self.connects += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        checked_out = self.pool.checkedout()
+        if checked_out > self.peak_checked_out:
+            self.peak_checked_out = checked_out
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception) -> None:
+        self.invalidations += 1
+
+    def _warn_slow_checkout(self, seconds: float) -> None:
+        now = time.monotonic()
+        if now - self._last_warning < WARN_INTERVAL:
+            self._suppressed_warnings += 1
+            return
+
+        suppressed = f" ({self._suppressed_warnings} more since last warning)" if self._suppressed_warnings else ""
+        logger.warning(
+            f"Slow DB connection checkout on {self.name} pool: {seconds * 1000:.0f} ms{suppressed}; "
+            f"{self.pool.status() if self.pool is not None else ''}"
+        )
+        self._last_warning = now
+        self._suppressed_warnings = 0
+
+    # Reporting
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Gauges, checkout wait histogram and pre-ping cost."""
+        histogram = {}
+        for bound, count in zip(WAIT_BUCKETS_MS, self.wait_buckets):
+            histogram[f"le_{bound}ms"] = count
+        histogram[f"gt_{WAIT_BUCKETS_MS[-1]}ms"] = self.wait_buckets[-1]
+
+        pool = self.pool
+        stats = {
+            "size": pool.size() if pool is not None else None,
+            "checked_out": pool.checkedout() if pool is not None else None,
+            "overflow": pool.overflow() if pool is not None else None,
+            "idle": pool.checkedin() if pool is not None else None,
+            "peak_checked_out": self.peak_checked_out,
+            "checkouts": self.checkouts,
+            "failed_checkouts": self.failed_checkouts,
+            "slow_checkouts": self.slow_checkouts,
+            "avg_wait_ms": self.total_wait / self.checkouts * 1000 if self.checkouts else 0.0,
+            "max_wait_ms": self.max_wait * 1000,
+            "wait_histogram": histogram,
+            "pings": self.pings,
+            "avg_ping_ms": self.total_ping / self.pings * 1000 if self.pings else 0.0,
+            "max_ping_ms": self.max_ping * 1000,
+            "connects": self.connects,
+            "invalidations": self.invalidations,
+        }
+        # Room for the observed peak plus 20% headroom
+        stats["suggested_pool_size"] = max(1, math.ceil(self.peak_checked_out * 1.2))
+        return stats
@@ -0,0 +1,228 @@
+"""
+Engine-level query timing.
+
+``QueryTimingMonitor`` listens to the engine's cursor events, so every
+statement is timed without decorating repositories. Statements are grouped
+by a normalized fingerprint computed once per distinct SQL string, and the
+repository or query method that issued them is taken from a context variable
+set by ``track_queries``-instrumented classes.
+"""
+
+import functools
+import inspect
+import logging
+import re
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine.default import CACHE_HIT
+
+logger = logging.getLogger(__name__)
+
+# Repository/query method currently talking to the database
+query_origin: ContextVar[Optional[str]] = ContextVar("query_origin", default=None)
+
+# Latency samples kept per fingerprint for percentiles
+SAMPLE_SIZE = 512
+# Distinct fingerprints tracked; further statements are counted under OTHER_FINGERPRINT
+MAX_FINGERPRINTS = 1000
+OTHER_FINGERPRINT = "<other>"
+UNKNOWN_ORIGIN = "<unknown>"
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w$])-?\d+(?:\.\d+)?\b")
+_PARAMETER_LIST = re.compile(r"\(\s*(?:\?|\$\d+|%\(\w+\)s|:\w+)(?:\s*,\s*(?:\?|\$\d+|%\(\w+\)s|:\w+))*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(statement: str) -> str:
+    """Normalize a SQL statement: literals become ``?``, parameter lists collapse, whitespace is squeezed."""
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _PARAMETER_LIST.sub("(...)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+def _with_origin(func, label: str):
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        token = query_origin.set(label)
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            query_origin.reset(token)
+
+    return wrapper
+
+
+def track_queries(cls):
+    """Class decorator labelling queries issued by the class's public coroutine methods."""
+    for name, attribute in list(vars(cls).items()):
+        if name.startswith("_"):
+            continue
+        label = f"{cls.__name__}.{name}"
+        if isinstance(attribute, staticmethod) and inspect.iscoroutinefunction(attribute.__func__):
+            setattr(cls, name, staticmethod(_with_origin(attribute.__func__, label)))
+        elif isinstance(attribute, classmethod) and inspect.iscoroutinefunction(attribute.__func__):
+            setattr(cls, name, classmethod(_with_origin(attribute.__func__, label)))
+        elif inspect.iscoroutinefunction(attribute):
+            setattr(cls, name, _with_origin(attribute, label))
+    return cls
+
+
+class StatementStats:
+    """Counters and a latency sample ring for one fingerprint."""
+
+    __slots__ = (
+        "fingerprint",
+        "count",
+        "total_time",
+        "max_time",
+        "rows",
+        "compiled_hits",
+        "samples",
+        "_next",
+        "origins",
+    )
+
+    def __init__(self, statement_fingerprint: str):
+        self.fingerprint = statement_fingerprint
+        self.count = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.rows = 0
+        self.compiled_hits = 0
+        self.samples: List[float] = []
+        self._next = 0
+        self.origins: Dict[Optional[str], int] = {}
+
+    def record(self, elapsed: float, rows: int, origin: Optional[str], compiled_hit: bool = False) -> None:
+        self.count += 1
+        self.total_time += elapsed
+        if elapsed > self.max_time:
+            self.max_time = elapsed
+        if rows > 0:
+            self.rows += rows
+        if compiled_hit:
+            self.compiled_hits += 1
+
+        if len(self.samples) < SAMPLE_SIZE:
+            self.samples.append(elapsed)
+        else:
+            self.samples[self._next] = elapsed
+            self._next = (self._next + 1) % SAMPLE_SIZE
+
+        self.origins[origin] = self.origins.get(origin, 0) + 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        ordered = sorted(self.samples)
+
+        def percentile(fraction: float) -> float:
+            if not ordered:
+                return 0.0
+            return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] * 1000
+
+        origins = sorted(self.origins.items(), key=lambda item: item[1], reverse=True)
+        return {
+            "fingerprint": self.fingerprint,
+            "count": self.count,
+            "total_ms": self.total_time * 1000,
+            "avg_ms": self.total_time / self.count * 1000 if self.count else 0.0,
+            "p50_ms": percentile(0.50),
+            "p95_ms": percentile(0.95),
+            "p99_ms": percentile(0.99),
+            "max_ms": self.max_time * 1000,
+            "rows": self.rows,
+            "compiled_cache_hit_ratio": self.compiled_hits / self.count if self.count else 0.0,
+            "origins": {origin or UNKNOWN_ORIGIN: count for origin, count in origins[:5]},
+        }
+
+
+class QueryTimingMonitor:
+    """
+    Times every statement of the engines it is installed on.
+
+    The hot path does two dict lookups and a few additions: fingerprints are
+    computed once per distinct SQL string, and percentiles only when stats
+    are requested.
+    """
+
+    def __init__(self):
+        self._by_statement: Dict[str, StatementStats] = {}
+        self._by_fingerprint: Dict[str, StatementStats] = {}
+        self.total_queries = 0
+        self.total_time = 0.0
+        self.compiled_cache_hits = 0
+
+    def install(self, engine) -> None:
+        """Listen to the cursor events of an (async) engine."""
+        sync_engine = getattr(engine, "sync_engine", engine)
+        event.listen(sync_engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        context._query_started = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        started = getattr(context, "_query_started", None)
+        if started is None:
+            return
+        elapsed = time.perf_counter() - started
+
+        stats = self._by_statement.get(statement)
+        if stats is None:
+            stats = self._stats_for(statement)
+
+        # Whether SQLAlchemy reused the compiled form instead of compiling the statement again
+        compiled_hit = getattr(context, "cache_hit", None) is CACHE_HIT
+
+        self.total_queries += 1
+        self.total_time += elapsed
+        if compiled_hit:
+            self.compiled_cache_hits += 1
+        stats.record(elapsed, cursor.rowcount, query_origin.get(), compiled_hit)
+
+    def _stats_for(self, statement: str) -> StatementStats:
+        """Stats bucket of a SQL string not seen before."""
+        if len(self._by_statement) >= MAX_FINGERPRINTS * 4:
+            # Unbounded statement variety (e.g. inlined literals); stop remembering raw strings
+            return self._bucket(OTHER_FINGERPRINT)
+        stats = self._bucket(fingerprint(statement))
+        self._by_statement[statement] = stats
+        return stats
+
+    def _bucket(self, statement_fingerprint: str) -> StatementStats:
+        stats = self._by_fingerprint.get(statement_fingerprint)
+        if stats is None:
+            if len(self._by_fingerprint) >= MAX_FINGERPRINTS:
+                statement_fingerprint = OTHER_FINGERPRINT
+                stats = self._by_fingerprint.get(statement_fingerprint)
+            if stats is None:
+                stats = self._by_fingerprint[statement_fingerprint] = StatementStats(statement_fingerprint)
+        return stats
+
+    def reset(self) -> None:
+        """Forget all recorded statements."""
+        self._by_statement.clear()
+        self._by_fingerprint.clear()
+        self.total_queries = 0
+        self.total_time = 0.0
+        self.compiled_cache_hits = 0
+
+    def get_stats(self, limit: int = 20, sort_by: str = "total_ms") -> Dict[str, Any]:
+        """Top fingerprints ordered by ``sort_by`` (total_ms, avg_ms, p95_ms, p99_ms, count or rows)."""
+        statements = [stats.as_dict() for stats in self._by_fingerprint.values()]
+        statements.sort(key=lambda item: item.get(sort_by, 0), reverse=True)
+        return {
+            "total_queries": self.total_queries,
+            "total_ms": self.total_time * 1000,
+            "compiled_cache_hit_ratio": self.compiled_cache_hits / self.total_queries if self.total_queries else 0.0,
+            "fingerprints": len(self._by_fingerprint),
+            "statements": statements[:limit],
+        }
+
+
+# Process-wide monitor installed on the bot's engines
+query_monitor = QueryTimingMonitor()
@@ -0,0 +1,771 @@
+"""
+Process-wide tiered cache.
+
+One in-memory L1 shared by every cache API in the bot (``CacheService``,
+``CacheManager`` and ``DatabaseOptimizer.cache_result``), bounded by the
+estimated size of its values, with namespaces, TTL, tags, single-flight
+loading and one metrics surface. An optional Redis L2 keeps selected
+namespaces warm across restarts.
+"""
+
+import asyncio
+import inspect
+import logging
+import pickle
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+try:
+    import redis.asyncio as redis
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    redis = None
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# (namespace, key)
+CacheKey = Tuple[str, str]
+
+# Rough per-entry bookkeeping cost on top of the value itself
+ENTRY_OVERHEAD_BYTES = 200
+
+# Containers larger than this are sampled when estimating their size
+_SIZE_SAMPLE = 64
+_SIZE_MAX_DEPTH = 4
+
+# Values whose size is just their own object size
+_SCALAR_TYPES = frozenset({str, bytes, bytearray, int, float, bool, type(None)})
+
+# Distinguishes a cached None from a miss
+_MISSING = object()
+
+_NO_TAGS: frozenset = frozenset()
+
+# Namespaces whose values are plain data (bools, IDs, dates, dicts/lists of them)
+# and may therefore be pickled into the Redis L2. ORM objects and other
+# session-bound values must never be mirrored.
+L2_SAFE_NAMESPACES = frozenset({"premium"})
+
+
+def estimate_size(value: Any, _depth: int = 0) -> int:
+    """Approximate memory footprint of a value in bytes.
+
+    Containers are walked a few levels deep; large ones are sampled and
+    extrapolated, so the cost stays bounded for big query results.
+    """
+    size = sys.getsizeof(value, 64)
+    if type(value) in _SCALAR_TYPES or _depth >= _SIZE_MAX_DEPTH:
+        return size
+    if isinstance(value, (str, bytes, bytearray, int, float)):
+        return size
+
+    if isinstance(value, dict):
+        items = list(value.items())
+        if not items:
+            return size
+        sample = items[:_SIZE_SAMPLE]
+        inner = sum(estimate_size(k, _depth + 1) + estimate_size(v, _depth + 1) for k, v in sample)
+        return size + inner * len(items) // len(sample)
+
+    if isinstance(value, (list, tuple, set, frozenset)):
+        if not value:
+            return size
+        sample = list(value)[:_SIZE_SAMPLE] if not isinstance(value, (list, tuple)) else value[:_SIZE_SAMPLE]
+        inner = sum(estimate_size(item, _depth + 1) for item in sample)
+        return size + inner * len(value) // len(sample)
+
+    attributes = getattr(value, "__dict__", None)
+    if isinstance(attributes, dict):
+        return size + estimate_size(attributes, _depth + 1)
+    return size
+
+
+class CacheEntry:
+    """Individual cache entry: value, expiry, tags and estimated size."""
+
+    __slots__ = ("value", "expires_at", "tags", "size")
+
+    def __init__(self, value: Any, expires_at: Optional[float], tags: frozenset, size: int):
+        self.value = value
+        self.expires_at = expires_at
+        self.tags = tags
+        self.size = size
+
+    @property
+    def is_expired(self) -> bool:
+        """Check if entry is expired."""
+        return self.expires_at is not None and time.time() > self.expires_at
+
+
+@dataclass
+class CacheStats:
+    """Cache performance statistics."""
+
+    hits: int = 0
+    misses: int = 0
+    sets: int = 0
+    deletes: int = 0
+    evictions: int = 0
+    expired_cleanups: int = 0
+    coalesced_loads: int = 0
+    l2_hits: int = 0
+    l2_errors: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Calculate cache hit ratio."""
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+    @property
+    def total_operations(self) -> int:
+        """Total cache operations."""
+        return self.hits + self.misses + self.sets + self.deletes
+
+
+class NamespaceState:
+    """Per-namespace size and counters."""
+
+    __slots__ = ("count", "bytes", "max_entries", "order", "stats")
+
+    def __init__(self):
+        self.count = 0
+        self.bytes = 0
+        self.max_entries: Optional[int] = None
+        # Keys from least to most recently used; kept only for namespaces with an entry limit
+        self.order: "Optional[OrderedDict[str, None]]" = None
+        self.stats = CacheStats()
+
+
+class RedisTier:
+    """
+    Optional Redis L2 for selected namespaces.
+
+    Values are pickled together with their expiry and tags so a restarted bot
+    can refill L1 from Redis. Only namespaces in ``L2_SAFE_NAMESPACES`` are
+    mirrored, whatever the config asks for; Redis must still be a trusted,
+    internal service.
+    """
+
+    def __init__(self, url: str, namespaces: Iterable[str], prefix: str = "zgdk:cache:"):
+        namespaces = frozenset(namespaces)
+        rejected = namespaces - L2_SAFE_NAMESPACES
+        if rejected:
+            logger.warning(f"Redis L2 cache ignores namespaces not holding plain data: {', '.join(sorted(rejected))}")
+        self.url = url
+        self.namespaces = namespaces & L2_SAFE_NAMESPACES
+        self.prefix = prefix
+        self._client = None
+
+    @property
+    def is_connected(self) -> bool:
+        """Whether the Redis client is connected."""
+        return self._client is not None
+
+    def handles(self, namespace: str) -> bool:
+        """Whether a namespace is mirrored to Redis."""
+        return self._client is not None and namespace in self.namespaces
+
+    async def connect(self) -> bool:
+        """Connect and ping Redis; L2 stays disabled on failure."""
+        if not REDIS_AVAILABLE:
+            logger.warning("Redis L2 cache configured but the redis package is not installed")
+            return False
+        try:
+            client = redis.from_url(self.url)
+            await client.ping()
+            self._client = client
+            logger.info(f"Redis L2 cache connected for namespaces: {', '.join(sorted(self.namespaces))}")
+            return True
+        except Exception as e:
+            logger.warning(f"Redis L2 cache unavailable, continuing with memory only: {e}")
+            self._client = None
+            return False
+
+    async def close(self) -> None:
+        """Close the Redis connection."""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+    def _key(self, namespace: str, key: str) -> str:
+        return f"{self.prefix}{namespace}:{key}"
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.prefix}tag:{tag}"
+
+    def _namespace_key(self, namespace: str) -> str:
+        return f"{self.prefix}ns:{namespace}"
+
+    async def get(self, namespace: str, key: str) -> Optional[Tuple[Any, Optional[float], Set[str]]]:
+        """(value, expires_at, tags) stored for a key, or None."""
+        payload = await self._client.get(self._key(namespace, key))
+        if payload is None:
+            return None
+        return pickle.loads(payload)
+
+    async def set(self, namespace: str, key: str, value: Any, expires_at: Optional[float], tags: Set[str]) -> None:
+        """Store a value with the remaining TTL and register it under its tags."""
+        redis_key = self._key(namespace, key)
+        payload = pickle.dumps((value, expires_at, tags), protocol=pickle.HIGHEST_PROTOCOL)
+        ttl_ms = int((expires_at - time.time()) * 1000) if expires_at is not None else None
+        if ttl_ms is not None and ttl_ms <= 0:
+            return
+
+        async with self._client.pipeline(transaction=False) as pipe:
+            pipe.set(redis_key, payload, px=ttl_ms)
+            pipe.sadd(self._namespace_key(namespace), redis_key)
+            for tag in tags:
+                pipe.sadd(self._tag_key(tag), redis_key)
+            await pipe.execute()
+
+    async def delete(self, namespace: str, key: str) -> None:
+        """Delete a single key."""
+        await self._client.delete(self._key(namespace, key))
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> None:
+        """Delete every key registered under any of the tags."""
+        for tag in tags:
+            tag_key = self._tag_key(tag)
+            members = await self._client.smembers(tag_key)
+            await self._client.delete(tag_key, *members)
+
+    async def invalidate_namespace(self, namespace: str) -> None:
+        """Delete every key of a namespace."""
+        namespace_key = self._namespace_key(namespace)
+        members = await self._client.smembers(namespace_key)
+        await self._client.delete(namespace_key, *members)
+
+
+class TieredCache:
+    """
+    Size-bounded LRU cache with namespaces, TTL, tags and an optional Redis L2.
+
+    All entries live in one ``OrderedDict`` ordered from least to most recently
+    used, so a hit is a ``move_to_end`` and an eviction a ``popitem``. L1
+    operations are synchronous and never await while the cache is half-updated,
+    so they are atomic on the event loop without locks; ``get_or_set`` runs one
+    loader per key no matter how many callers miss at once.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        max_entries: Optional[int] = None,
+        default_ttl: int = 300,
+        l2: Optional[RedisTier] = None,
+    ):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.l2 = l2
+
+        # Ordered from least to most recently used, across all namespaces
+        self._entries: "OrderedDict[CacheKey, CacheEntry]" = OrderedDict()
+        self._namespaces: Dict[str, NamespaceState] = {}
+        self._bytes = 0
+        self._stats = CacheStats()
+
+        # Tag tracking for invalidation
+        self._tag_to_keys: Dict[str, Set[CacheKey]] = {}
+
+        # In-flight get_or_set loaders and the tags their results will carry
+        self._inflight: Dict[CacheKey, asyncio.Future] = {}
+        self._inflight_tags: Dict[CacheKey, frozenset] = {}
+        # In-flight keys invalidated while loading; their results are returned but not stored
+        self._stale_loads: Set[CacheKey] = set()
+
+        self._cleanup_task: Optional[asyncio.Task] = None
+        self._ensure_cleanup_task()
+
+    # Lifecycle
+
+    def configure(
+        self,
+        max_bytes: Optional[int] = None,
+        max_entries: Optional[int] = None,
+        default_ttl: Optional[int] = None,
+        l2: Optional[RedisTier] = None,
+    ) -> None:
+        """Apply limits from config to an already shared instance."""
+        if max_bytes is not None:
+            self.max_bytes = max_bytes
+        if max_entries is not None:
+            self.max_entries = max_entries
+        if default_ttl is not None:
+            self.default_ttl = default_ttl
+        if l2 is not None:
+            self.l2 = l2
+        self._enforce_limits()
+
+    async def start(self) -> None:
+        """Start background expiry and connect the L2 tier, if configured."""
+        self._ensure_cleanup_task()
+        if self.l2 is not None and not self.l2.is_connected:
+            await self.l2.connect()
+
+    async def close(self) -> None:
+        """Stop background expiry and disconnect L2."""
+        self.stop_cleanup()
+        if self.l2 is not None:
+            try:
+                await self.l2.close()
+            except Exception as e:
+                logger.error(f"Error closing Redis L2 cache: {e}")
+
+    def stop_cleanup(self) -> None:
+        """Stop the background cleanup task."""
+        if self._cleanup_task is not None and not self._cleanup_task.done():
+            self._cleanup_task.cancel()
+        self._cleanup_task = None
+
+    def _ensure_cleanup_task(self) -> None:
+        """Start the cleanup task if it isn't running and a loop is available."""
+        if self._cleanup_task is not None and not self._cleanup_task.done():
+            return
+        try:
+            self._cleanup_task = asyncio.get_running_loop().create_task(self._cleanup_expired())
+        except RuntimeError:
+            # Created outside the event loop; started on first write or start()
+            self._cleanup_task = None
+
+    def set_namespace_limit(self, namespace: str, max_entries: Optional[int]) -> None:
+        """Cap the number of entries a namespace may hold."""
+        state = self._namespace(namespace)
+        state.max_entries = max_entries
+        if max_entries is None:
+            state.order = None
+            return
+        if state.order is None:
+            state.order = OrderedDict((key, None) for ns, key in self._entries if ns == namespace)
+        while state.count > max_entries:
+            self._evict_from(namespace)
+
+    def _namespace(self, namespace: str) -> NamespaceState:
+        state = self._namespaces.get(namespace)
+        if state is None:
+            state = self._namespaces[namespace] = NamespaceState()
+        return state
+
+    # L1 synchronous API
+
+    def get_nowait(self, namespace: str, key: str, default: Any = None) -> Any:
+        """Get a value from L1 without locking or yielding to the event loop."""
+        cache_key = (namespace, key)
+        entry = self._entries.get(cache_key)
+        state = self._namespaces.get(namespace)
+
+        if entry is None:
+            self._record_miss(state)
+            return default
+
+        if entry.expires_at is not None and time.time() > entry.expires_at:
+            self._remove(cache_key)
+            self._record_miss(state)
+            self._stats.expired_cleanups += 1
+            return default
+
+        self._entries.move_to_end(cache_key)
+        if state.order is not None:
+            state.order.move_to_end(key)
+        self._stats.hits += 1
+        state.stats.hits += 1
+        return entry.value
+
+    def _record_miss(self, state: Optional[NamespaceState]) -> None:
+        self._stats.misses += 1
+        if state is not None:
+            state.stats.misses += 1
+
+    def set_nowait(
+        self,
+        namespace: str,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        tags: Optional[Set[str]] = None,
+        expires_at: Optional[float] = None,
+    ) -> None:
+        """Store a value in L1."""
+        if expires_at is None:
+            if ttl is None:
+                ttl = self.default_ttl
+            expires_at = time.time() + ttl if ttl > 0 else None
+        if self._cleanup_task is None or self._cleanup_task.done():
+            self._ensure_cleanup_task()
+
+        entries = self._entries
+        cache_key = (namespace, key)
+        previous = entries.pop(cache_key, None)
+        if previous is not None:
+            self._forget(cache_key, previous)
+
+        entry_tags = frozenset(tags) if tags else _NO_TAGS
+        size = estimate_size(value) + ENTRY_OVERHEAD_BYTES
+        state = self._namespaces.get(namespace) or self._namespace(namespace)
+
+        entries[cache_key] = CacheEntry(value, expires_at, entry_tags, size)
+        state.count += 1
+        state.bytes += size
+        self._bytes += size
+        self._stats.sets += 1
+        state.stats.sets += 1
+
+        for tag in entry_tags:
+            self._tag_to_keys.setdefault(tag, set()).add(cache_key)
+
+        if state.order is not None:
+            state.order[key] = None
+            while state.count > state.max_entries:
+                self._evict_from(namespace)
+        if self._bytes > self.max_bytes or (self.max_entries is not None and len(entries) > self.max_entries):
+            self._enforce_limits()
+
+    def delete_nowait(self, namespace: str, key: str) -> bool:
+        """Delete a key from L1."""
+        cache_key = (namespace, key)
+        if cache_key in self._inflight:
+            self._stale_loads.add(cache_key)
+        if cache_key not in self._entries:
+            return False
+        self._remove(cache_key)
+        self._stats.deletes += 1
+        self._namespace(namespace).stats.deletes += 1
+        return True
+
+    def invalidate_tags_nowait(self, tags: Union[str, Iterable[str]]) -> int:
+        """Remove every L1 entry carrying any of the tags."""
+        tags = {tags} if isinstance(tags, str) else set(tags)
+        self._stale_loads.update(
+            cache_key for cache_key, loading_tags in self._inflight_tags.items() if not tags.isdisjoint(loading_tags)
+        )
+        keys: Set[CacheKey] = set()
+        for tag in tags:
+            keys.update(self._tag_to_keys.get(tag, ()))
+        for cache_key in keys:
+            self._remove(cache_key)
+        return len(keys)
+
+    def invalidate_namespace_nowait(self, namespace: str, match: Optional[Callable[[str], bool]] = None) -> int:
+        """Remove L1 entries of a namespace, optionally only keys accepted by ``match``."""
+        self._stale_loads.update(
+            cache_key
+            for cache_key in self._inflight
+            if cache_key[0] == namespace and (match is None or match(cache_key[1]))
+        )
+        state = self._namespaces.get(namespace)
+        if state is None or not state.count:
+            return 0
+        keys = [
+            cache_key
+            for cache_key in self._entries
+            if cache_key[0] == namespace and (match is None or match(cache_key[1]))
+        ]
+        for cache_key in keys:
+            self._remove(cache_key)
+        return len(keys)
+
+    def clear_nowait(self) -> None:
+        """Remove all L1 entries."""
+        self._stale_loads.update(self._inflight)
+        self._entries.clear()
+        self._tag_to_keys.clear()
+        self._bytes = 0
+        for state in self._namespaces.values():
+            state.count = 0
+            state.bytes = 0
+            if state.order is not None:
+                state.order.clear()
+
+    def keys(self, namespace: str) -> List[str]:
+        """Keys currently held in L1 for a namespace, least recently used first."""
+        state = self._namespaces.get(namespace)
+        if state is None:
+            return []
+        if state.order is not None:
+            return list(state.order)
+        return [key for ns, key in self._entries if ns == namespace]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # Tiered async API
+
+    async def get(self, namespace: str, key: str, default: Any = None) -> Any:
+        """Get a value from L1, falling back to L2 for mirrored namespaces."""
+        value = self.get_nowait(namespace, key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        if self.l2 is not None and self.l2.handles(namespace):
+            try:
+                stored = await self.l2.get(namespace, key)
+            except Exception as e:
+                self._stats.l2_errors += 1
+                logger.debug(f"Redis L2 get failed for {namespace}:{key}: {e}")
+                stored = None
+            if stored is not None:
+                value, expires_at, tags = stored
+                if expires_at is None or expires_at > time.time():
+                    self._stats.l2_hits += 1
+                    self._namespace(namespace).stats.l2_hits += 1
+                    self.set_nowait(namespace, key, value, tags=tags, expires_at=expires_at)
+                    return value
+        return default
+
+    async def set(
+        self, namespace: str, key: str, value: Any, ttl: Optional[float] = None, tags: Optional[Set[str]] = None
+    ) -> None:
+        """Store a value in L1 and, for mirrored namespaces, in L2."""
+        self.set_nowait(namespace, key, value, ttl=ttl, tags=tags)
+        if self.l2 is not None and self.l2.handles(namespace):
+            await self._write_l2(namespace, key)
+
+    async def _write_l2(self, namespace: str, key: str) -> None:
+        entry = self._entries.get((namespace, key))
+        if entry is None:
+            return
+        try:
+            await self.l2.set(namespace, key, entry.value, entry.expires_at, entry.tags)
+        except Exception as e:
+            self._stats.l2_errors += 1
+            logger.debug(f"Redis L2 set failed for {namespace}:{key}: {e}")
+
+    async def delete(self, namespace: str, key: str) -> bool:
+        """Delete a key from both tiers."""
+        deleted = self.delete_nowait(namespace, key)
+        if self.l2 is not None and self.l2.handles(namespace):
+            try:
+                await self.l2.delete(namespace, key)
+            except Exception as e:
+                self._stats.l2_errors += 1
+                logger.debug(f"Redis L2 delete failed for {namespace}:{key}: {e}")
+        return deleted
+
+    async def invalidate_tags(self, tags: Union[str, Iterable[str]]) -> int:
+        """Invalidate tagged entries in both tiers."""
+        tags = {tags} if isinstance(tags, str) else set(tags)
+        removed = self.invalidate_tags_nowait(tags)
+        if self.l2 is not None and self.l2.is_connected:
+            try:
+                await self.l2.invalidate_tags(tags)
+            except Exception as e:
+                self._stats.l2_errors += 1
+                logger.debug(f"Redis L2 tag invalidation failed for {tags}: {e}")
+        return removed
+
+    async def invalidate_namespace(self, namespace: str) -> int:
+        """Invalidate a namespace in both tiers."""
+        removed = self.invalidate_namespace_nowait(namespace)
+        if self.l2 is not None and self.l2.handles(namespace):
+            try:
+                await self.l2.invalidate_namespace(namespace)
+            except Exception as e:
+                self._stats.l2_errors += 1
+                logger.debug(f"Redis L2 namespace invalidation failed for {namespace}: {e}")
+        return removed
+
+    async def get_or_set(
+        self,
+        namespace: str,
+        key: str,
+        factory: Callable,
+        ttl: Optional[float] = None,
+        tags: Optional[Set[str]] = None,
+    ) -> Any:
+        """Get a value or load it with ``factory``; concurrent misses share a single load."""
+        cache_key = (namespace, key)
+
+        while True:
+            value = await self.get(namespace, key)
+            if value is not None:
+                return value
+
+            inflight = self._inflight.get(cache_key)
+            if inflight is None:
+                break
+
+            # Another caller is already loading this key; wait for its result
+            self._stats.coalesced_loads += 1
+            self._namespace(namespace).stats.coalesced_loads += 1
+            await asyncio.wait({inflight})
+            if not inflight.cancelled():
+                return inflight.result()
+            # The loading caller was cancelled; retry, possibly becoming the loader
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        self._inflight_tags[cache_key] = frozenset(tags or ())
+
+        try:
+            value = factory()
+            # Accept coroutine functions as well as plain callables returning an awaitable
+            if inspect.isawaitable(value):
+                value = await value
+
+            # Store in cache unless this key was invalidated while loading
+            if cache_key not in self._stale_loads:
+                await self.set(namespace, key, value, ttl=ttl, tags=tags)
+            future.set_result(value)
+            return value
+
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+
+        except Exception as e:
+            logger.error(f"Factory function failed for {namespace}:{key}: {e}")
+            future.set_exception(e)
+            # Mark retrieved so a failure nobody waited for isn't logged by asyncio
+            future.exception()
+            raise
+
+        finally:
+            self._inflight.pop(cache_key, None)
+            self._inflight_tags.pop(cache_key, None)
+            self._stale_loads.discard(cache_key)
+
+    # Metrics
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Overall and per-namespace statistics."""
+        return {
+            **self._format_stats(self._stats),
+            "current_size": len(self._entries),
+            "max_entries": self.max_entries,
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "tag_count": len(self._tag_to_keys),
+            "inflight_loads": len(self._inflight),
+            "l2_connected": self.l2 is not None and self.l2.is_connected,
+            "l2_errors": self._stats.l2_errors,
+            "namespaces": {name: self.namespace_stats(name) for name in sorted(self._namespaces)},
+        }
+
+    def namespace_stats(self, namespace: str) -> Dict[str, Any]:
+        """Statistics for one namespace."""
+        state = self._namespace(namespace)
+        return {
+            **self._format_stats(state.stats),
+            "current_size": state.count,
+            "max_entries": state.max_entries,
+            "bytes": state.bytes,
+        }
+
+    @staticmethod
+    def _format_stats(stats: CacheStats) -> Dict[str, Any]:
+        return {
+            "hits": stats.hits,
+            "misses": stats.misses,
+            "sets": stats.sets,
+            "deletes": stats.deletes,
+            "evictions": stats.evictions,
+            "expired_cleanups": stats.expired_cleanups,
+            "coalesced_loads": stats.coalesced_loads,
+            "l2_hits": stats.l2_hits,
+            "hit_ratio": stats.hit_ratio,
+            "total_operations": stats.total_operations,
+        }
+
+    # Internals
+
+    def _remove(self, cache_key: CacheKey) -> None:
+        """Remove an entry and its tag and size bookkeeping."""
+        entry = self._entries.pop(cache_key, None)
+        if entry is not None:
+            self._forget(cache_key, entry)
+
+    def _forget(self, cache_key: CacheKey, entry: CacheEntry) -> None:
+        """Drop the bookkeeping of an entry already taken out of ``_entries``."""
+        namespace, key = cache_key
+        state = self._namespaces[namespace]
+        state.count -= 1
+        state.bytes -= entry.size
+        self._bytes -= entry.size
+        if state.order is not None:
+            state.order.pop(key, None)
+
+        for tag in entry.tags:
+            keys = self._tag_to_keys.get(tag)
+            if keys is not None:
+                keys.discard(cache_key)
+                if not keys:
+                    del self._tag_to_keys[tag]
+
+    def _evict_from(self, namespace: str) -> None:
+        """Evict the least recently used entry of a namespace with an entry limit."""
+        state = self._namespaces[namespace]
+        key = next(iter(state.order))
+        self._remove((namespace, key))
+        self._stats.evictions += 1
+        state.stats.evictions += 1
+
+    def _enforce_limits(self) -> None:
+        """Evict globally least recently used entries until within size and count limits."""
+        entries = self._entries
+        while entries and (
+            self._bytes > self.max_bytes or (self.max_entries is not None and len(entries) > self.max_entries)
+        ):
+            cache_key, entry = entries.popitem(last=False)
+            self._forget(cache_key, entry)
+            self._stats.evictions += 1
+            self._namespaces[cache_key[0]].stats.evictions += 1
+
+    def remove_expired(self) -> int:
+        """Remove every expired entry."""
+        now = time.time()
+        expired = [
+            cache_key
+            for cache_key, entry in self._entries.items()
+            if entry.expires_at is not None and entry.expires_at <= now
+        ]
+        for cache_key in expired:
+            self._remove(cache_key)
+        self._stats.expired_cleanups += len(expired)
+        return len(expired)
+
+    async def _cleanup_expired(self) -> None:
+        """Background task to clean up expired entries."""
+        while True:
+            try:
+                await asyncio.sleep(60)  # Run every minute
+                removed = self.remove_expired()
+                if removed:
+                    logger.debug(f"Cleaned up {removed} expired cache entries")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in cache cleanup task: {e}")
+
+
+# Process-wide instance shared by all cache adapters
+_shared_cache: Optional[TieredCache] = None
+
+
+def get_tiered_cache() -> TieredCache:
+    """The process-wide tiered cache."""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = TieredCache()
+    return _shared_cache
+
+
+def configure_tiered_cache(config: Dict[str, Any], redis_url: Optional[str] = None) -> TieredCache:
+    """Apply the ``cache`` config section to the shared cache and return it."""
+    cache = get_tiered_cache()
+    l2 = None
+    url = redis_url or config.get("redis_url")
+    if url:
+        l2 = RedisTier(url, config.get("redis_namespaces", []))
+    cache.configure(
+        max_bytes=int(config.get("max_memory_mb", 64) * 1024 * 1024),
+        max_entries=config.get("max_entries"),
+        default_ttl=config.get("default_ttl", 300),
+        l2=l2,
+    )
+    return cache
@@ -0,0 +1,111 @@
+"""
+Per-owner snapshots of stored voice channel permissions.
+
+Handing a voice channel to its owner needs the owner's stored overwrites
+(up to 95 rows ordered by a CASE expression). The snapshot built from them
+is cached per owner, invalidated by ``ChannelRepository`` whenever the
+owner's rows change, and prefetched when the owner joins a create channel,
+so the hand-off itself needs no query and no per-row object construction.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class VoicePermissionCache:
+    """
+    LRU of per-owner snapshots with in-flight load deduplication.
+
+    Snapshots are shared between callers and must be treated as read-only.
+    A load that overlaps an invalidation still answers its callers but is not
+    stored, so a write is never hidden behind a snapshot read before it.
+    """
+
+    def __init__(self, max_owners: int = 2000, ttl: float = 900.0):
+        self.max_owners = max_owners
+        self.ttl = ttl
+        self._entries: "OrderedDict[int, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[int, asyncio.Task] = {}
+        self._stale: Set[int] = set()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def __contains__(self, owner_id: int) -> bool:
+        entry = self._entries.get(owner_id)
+        return entry is not None and entry[0] > time.monotonic()
+
+    async def get_or_load(self, owner_id: int, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """The owner's snapshot, running ``loader`` at most once for concurrent misses."""
+        entry = self._entries.get(owner_id)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                self._entries.move_to_end(owner_id)
+                self.hits += 1
+                return entry[1]
+            del self._entries[owner_id]
+
+        self.misses += 1
+        task = self._inflight.get(owner_id)
+        if task is None:
+            task = self._inflight[owner_id] = asyncio.create_task(self._load(owner_id, loader))
+        # Shielded so one cancelled waiter does not cancel the load for the others
+        return await asyncio.shield(task)
+
+    def prefetch(self, owner_id: int, loader: Callable[[], Awaitable[Any]]) -> None:
+        """Start loading the owner's snapshot in the background unless it is cached or loading."""
+        if owner_id in self or owner_id in self._inflight:
+            return
+        self._inflight[owner_id] = task = asyncio.create_task(self._load(owner_id, loader))
+        task.add_done_callback(self._log_prefetch_error)
+
+    async def _load(self, owner_id: int, loader: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            snapshot = await loader()
+            if owner_id in self._stale:
+                return snapshot
+            self._entries[owner_id] = (time.monotonic() + self.ttl, snapshot)
+            self._entries.move_to_end(owner_id)
+            while len(self._entries) > self.max_owners:
+                self._entries.popitem(last=False)
+            return snapshot
+        finally:
+            self._inflight.pop(owner_id, None)
+            self._stale.discard(owner_id)
+
+    @staticmethod
+    def _log_prefetch_error(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Voice permission prefetch failed: {task.exception()}")
+
+    def invalidate(self, owner_id: int) -> None:
+        """Forget the owner's snapshot after their stored permissions changed."""
+        self.invalidations += 1
+        self._entries.pop(owner_id, None)
+        if owner_id in self._inflight:
+            self._stale.add(owner_id)
+
+    def invalidate_all(self) -> None:
+        self.invalidations += 1
+        self._entries.clear()
+        self._stale.update(self._inflight)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Size and hit counters."""
+        lookups = self.hits + self.misses
+        return {
+            "owners": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+# Process-wide cache; ChannelRepository invalidates it on every write
+voice_permission_cache = VoicePermissionCache()
@@ -11,6 +11,7 @@ from typing import List
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.performance.autokick_index import autokick_index
 from datasources.models import AutoKick
 
 from .base_repository import BaseRepository
@@ -54,6 +55,7 @@ class AutoKickRepository(BaseRepository):
 
         self.session.add(autokick)
         await self.session.commit()
+        autokick_index.add(owner_id, target_id)
         await self.session.refresh(autokick)
 
         logger.info(f"Added autokick: owner={owner_id}, target={target_id}")
@@ -76,6 +78,7 @@ class AutoKickRepository(BaseRepository):
 
         removed = result.rowcount > 0
         if removed:
+            autokick_index.remove(owner_id, target_id)
             logger.info(f"Removed autokick: owner={owner_id}, target={target_id}")
 
         return removed
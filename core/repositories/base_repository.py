@@ -3,15 +3,26 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Optional, Type
+from typing import Any, Callable, Iterable, Mapping, Optional, Sequence, Type
 
-from sqlalchemy import select
+from sqlalchemy import any_, bindparam, delete, func, inspect, select, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY, asyncpg, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.performance.query_monitor import track_queries
+
+# asyncpg accepts at most 32767 bind parameters per statement
+MAX_BIND_PARAMETERS = 32767
+
 
 class BaseRepository:
     """Base repository class providing common CRUD operations."""
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Attribute the queries of every repository method in query timing stats
+        track_queries(cls)
+
     def __init__(self, entity_class: Type[Any], session: AsyncSession) -> None:
         self.session = session
         self.entity_class = entity_class
@@ -94,6 +105,146 @@ class BaseRepository:
             self.logger.error(f"Error checking existence of {self.entity_class.__name__} with ID {entity_id}: {e}")
             raise
 
+    async def get_many_by_ids(self, entity_ids: Iterable[Any]) -> dict[Any, Any]:
+        """Get entities by primary key in one query, keyed by ID; missing IDs are left out.
+
+        Composite keys are passed and returned as tuples in primary key column order.
+        """
+        ids = list(dict.fromkeys(entity_ids))
+        if not ids:
+            return {}
+        try:
+            result = await self.session.execute(select(self.entity_class).where(self._keys_clause(ids)))
+            entities = result.scalars().all()
+            self.logger.debug(f"Retrieved {len(entities)}/{len(ids)} {self.entity_class.__name__} entities by ID")
+            return {self._identity(entity): entity for entity in entities}
+        except Exception as e:
+            self.logger.error(f"Error getting {self.entity_class.__name__} entities by IDs: {e}")
+            raise
+
+    async def bulk_upsert(
+        self,
+        rows: Sequence[Mapping[str, Any]],
+        update_columns: Optional[Sequence[str]] = None,
+        update_set: Optional[Callable[[Any], Mapping[str, Any]]] = None,
+        conflict_columns: Optional[Sequence[str]] = None,
+        returning: bool = False,
+    ) -> Any:
+        """Insert rows with ``INSERT ... ON CONFLICT`` in as few statements as the bind limit allows.
+
+        Args:
+            rows: Column values per row; every row must have the same keys
+            update_columns: Columns overwritten from the incoming row on conflict
+            update_set: Builds extra SET expressions from the statement's ``excluded`` row
+            conflict_columns: Conflict target; defaults to the primary key
+            returning: Return the inserted/updated entities instead of a row count
+
+        Without ``update_columns``/``update_set`` conflicting rows are left untouched
+        (``DO NOTHING``) and are not returned.
+
+        Returns:
+            List of entities if ``returning``, otherwise the number of affected rows
+        """
+        if not rows:
+            return [] if returning else 0
+        try:
+            chunk_size = self._upsert_chunk_size(rows[0], update_columns, update_set, conflict_columns)
+            entities: list[Any] = []
+            affected = 0
+            for i in range(0, len(rows), chunk_size):
+                stmt = self._upsert_statement(rows[i : i + chunk_size], update_columns, update_set, conflict_columns)
+                if returning:
+                    result = await self.session.execute(
+                        stmt.returning(self.entity_class), execution_options={"populate_existing": True}
+                    )
+                    entities.extend(result.scalars().all())
+                else:
+                    result = await self.session.execute(stmt)
+                    affected += max(result.rowcount, 0)
+            self.logger.debug(f"Upserted {len(rows)} {self.entity_class.__name__} rows")
+            return entities if returning else affected
+        except Exception as e:
+            self.logger.error(f"Error upserting {self.entity_class.__name__}: {e}")
+            raise
+
+    async def bulk_delete_by_keys(self, entity_ids: Iterable[Any]) -> int:
+        """Delete entities by primary key in one statement; returns the number of deleted rows."""
+        ids = list(dict.fromkeys(entity_ids))
+        if not ids:
+            return 0
+        try:
+            result = await self.session.execute(delete(self.entity_class).where(self._keys_clause(ids)))
+            self.logger.debug(f"Deleted {result.rowcount} {self.entity_class.__name__} rows by key")
+            return result.rowcount
+        except Exception as e:
+            self.logger.error(f"Error deleting {self.entity_class.__name__} entities by keys: {e}")
+            raise
+
+    def _primary_key(self) -> Sequence[Any]:
+        return inspect(self.entity_class).primary_key
+
+    def _identity(self, entity: Any) -> Any:
+        values = tuple(getattr(entity, column.key) for column in self._primary_key())
+        return values if len(values) > 1 else values[0]
+
+    def _keys_clause(self, ids: Sequence[Any]) -> Any:
+        """``pk = ANY(:ids)``, or a tuple match against ``unnest`` arrays for composite keys.
+
+        Array parameters keep one statement shape (and prepared statement) for any number of IDs.
+        """
+        columns = self._primary_key()
+        if len(columns) == 1:
+            column = columns[0]
+            return column == any_(bindparam("ids", list(ids), type_=ARRAY(column.type)))
+
+        arrays = [
+            bindparam(f"ids_{column.key}", [key[position] for key in ids], type_=ARRAY(column.type))
+            for position, column in enumerate(columns)
+        ]
+        keys = func.unnest(*arrays).table_valued(*(column.key for column in columns)).render_derived()
+        return tuple_(*columns).in_(select(keys))
+
+    def _upsert_chunk_size(
+        self,
+        row: Mapping[str, Any],
+        update_columns: Optional[Sequence[str]],
+        update_set: Optional[Callable[[Any], Mapping[str, Any]]],
+        conflict_columns: Optional[Sequence[str]],
+    ) -> int:
+        """Rows per statement that stay under the bind limit.
+
+        Counted from compiled one- and two-row statements, so binds added for
+        Python-side column defaults and by ``update_set`` are included.
+        """
+        dialect = asyncpg.dialect()
+        one, two = (
+            len(
+                self._upsert_statement([row] * n, update_columns, update_set, conflict_columns)
+                .compile(dialect=dialect)
+                .positiontup
+            )
+            for n in (1, 2)
+        )
+        per_row = max(1, two - one)
+        return max(1, (MAX_BIND_PARAMETERS - (one - per_row)) // per_row)
+
+    def _upsert_statement(
+        self,
+        rows: Sequence[Mapping[str, Any]],
+        update_columns: Optional[Sequence[str]],
+        update_set: Optional[Callable[[Any], Mapping[str, Any]]],
+        conflict_columns: Optional[Sequence[str]],
+    ) -> Any:
+        stmt = insert(self.entity_class).values(list(rows))
+        index_elements = list(conflict_columns) if conflict_columns else [column.key for column in self._primary_key()]
+
+        set_ = {column: stmt.excluded[column] for column in update_columns or ()}
+        if update_set is not None:
+            set_.update(update_set(stmt.excluded))
+        if not set_:
+            return stmt.on_conflict_do_nothing(index_elements=index_elements)
+        return stmt.on_conflict_do_update(index_elements=index_elements, set_=set_)
+
     def _log_operation(self, operation_name: str, **context: Any) -> None:
         """Log repository operation with context."""
         context_str = ", ".join([f"{k}={v}" for k, v in context.items()])
@@ -8,10 +8,11 @@ import logging
 from datetime import datetime, timezone
 from typing import List, Optional
 
-from sqlalchemy import func, select
+from sqlalchemy import delete, func, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.expression import case
 
+from core.performance.voice_permission_cache import voice_permission_cache
 from datasources.models import ChannelPermission
 
 from .base_repository import BaseRepository
@@ -50,24 +51,28 @@ class ChannelRepository(BaseRepository):
         Returns:
             Updated ChannelPermission
         """
-        permission = await self.session.get(ChannelPermission, (member_id, target_id))
-        if permission is None:
-            permission = ChannelPermission(
-                member_id=member_id,
-                target_id=target_id,
-                allow_permissions_value=allow_permissions_value,
-                deny_permissions_value=deny_permissions_value,
-                last_updated_at=datetime.now(timezone.utc),
-            )
-            self.session.add(permission)
-        else:
-            permission.allow_permissions_value = (
-                permission.allow_permissions_value | allow_permissions_value
-            ) & ~deny_permissions_value
-            permission.deny_permissions_value = (
-                permission.deny_permissions_value | deny_permissions_value
-            ) & ~allow_permissions_value
-            permission.last_updated_at = datetime.now(timezone.utc)
+        # Merge into the existing bitmasks inside the INSERT ... ON CONFLICT DO UPDATE itself
+        (permission,) = await self.bulk_upsert(
+            [
+                {
+                    "member_id": member_id,
+                    "target_id": target_id,
+                    "allow_permissions_value": allow_permissions_value,
+                    "deny_permissions_value": deny_permissions_value,
+                    "last_updated_at": datetime.now(timezone.utc),
+                }
+            ],
+            update_set=lambda excluded: {
+                "allow_permissions_value": (
+                    ChannelPermission.allow_permissions_value.bitwise_or(excluded.allow_permissions_value)
+                ).bitwise_and(excluded.deny_permissions_value.bitwise_not()),
+                "deny_permissions_value": (
+                    ChannelPermission.deny_permissions_value.bitwise_or(excluded.deny_permissions_value)
+                ).bitwise_and(excluded.allow_permissions_value.bitwise_not()),
+                "last_updated_at": excluded.last_updated_at,
+            },
+            returning=True,
+        )
 
         # Count permissions excluding default ones
         permissions_count = await self.session.scalar(
@@ -98,7 +103,7 @@ class ChannelRepository(BaseRepository):
                 )
 
         await self.session.commit()
-        await self.session.refresh(permission)
+        voice_permission_cache.invalidate(member_id)
 
         logger.info(
             f"Updated permission: member={member_id}, target={target_id}, "
@@ -116,10 +121,10 @@ class ChannelRepository(BaseRepository):
         Returns:
             True if removed, False if not found
         """
-        permission = await self.session.get(ChannelPermission, (member_id, target_id))
-        if permission:
-            await self.session.delete(permission)
+        removed = await self.bulk_delete_by_keys([(member_id, target_id)])
+        if removed:
             await self.session.commit()
+            voice_permission_cache.invalidate(member_id)
             logger.info(f"Removed permission for member {member_id} and target {target_id}")
             return True
         else:
@@ -147,7 +152,9 @@ class ChannelRepository(BaseRepository):
         Returns:
             List of ChannelPermission entries
         """
-        result = await self.session.execute(select(ChannelPermission).where(ChannelPermission.target_id == target_id))
+        result = await self.session.execute(
+            lambda_stmt(lambda: select(ChannelPermission).where(ChannelPermission.target_id == target_id))
+        )
         return list(result.scalars().all())
 
     async def get_permissions_for_member(self, member_id: int, limit: int = 95) -> List[ChannelPermission]:
@@ -163,23 +170,25 @@ class ChannelRepository(BaseRepository):
             List of ChannelPermission entries
         """
         result = await self.session.execute(
-            select(ChannelPermission)
-            .where(ChannelPermission.member_id == member_id)
-            .order_by(
-                case(
-                    (
-                        ChannelPermission.allow_permissions_value.bitwise_and(0x00002000) != 0,
-                        0,
-                    ),  # manage_messages
-                    (
-                        ChannelPermission.target_id == member_id,
-                        0,
-                    ),  # everyone permissions
-                    else_=1,
-                ),
-                ChannelPermission.last_updated_at.desc(),
+            lambda_stmt(
+                lambda: select(ChannelPermission)
+                .where(ChannelPermission.member_id == member_id)
+                .order_by(
+                    case(
+                        (
+                            ChannelPermission.allow_permissions_value.bitwise_and(0x00002000) != 0,
+                            0,
+                        ),  # manage_messages
+                        (
+                            ChannelPermission.target_id == member_id,
+                            0,
+                        ),  # everyone permissions
+                        else_=1,
+                    ),
+                    ChannelPermission.last_updated_at.desc(),
+                )
+                .limit(limit)
             )
-            .limit(limit)
         )
         return list(result.scalars().all())
 
@@ -192,15 +201,11 @@ class ChannelRepository(BaseRepository):
         Returns:
             Number of permissions removed
         """
-        result = await self.session.execute(select(ChannelPermission).where(ChannelPermission.member_id == owner_id))
-        permissions = result.scalars().all()
-
-        for permission in permissions:
-            await self.session.delete(permission)
-
+        result = await self.session.execute(delete(ChannelPermission).where(ChannelPermission.member_id == owner_id))
         await self.session.commit()
+        voice_permission_cache.invalidate(owner_id)
 
-        count = len(permissions)
+        count = result.rowcount
         logger.info(f"Removed all {count} permissions for owner {owner_id}")
         return count
 
@@ -233,6 +238,7 @@ class ChannelRepository(BaseRepository):
                 logger.info(f"Removed moderator permission granted by {owner_id} " f"to target {permission.target_id}")
 
         await self.session.commit()
+        voice_permission_cache.invalidate(owner_id)
 
         logger.info(f"Total moderator permissions removed for owner {owner_id}: " f"{mod_permissions_removed}")
         return mod_permissions_removed
@@ -257,16 +263,20 @@ class ChannelRepository(BaseRepository):
 
         # Check each permission for manage_messages (0x00002000)
         removed_count = 0
+        owners = set()
         for permission in permissions:
             if permission.allow_permissions_value & 0x00002000:
                 # Remove permission that contains manage_messages
                 await self.session.delete(permission)
                 removed_count += 1
+                owners.add(permission.member_id)
                 logger.info(
                     f"Removed moderator permission for target {target_id} " f"from owner {permission.member_id}"
                 )
 
         await self.session.commit()
+        for owner_id in owners:
+            voice_permission_cache.invalidate(owner_id)
 
         logger.info(f"Total moderator permissions removed for target {target_id}: " f"{removed_count}")
         return removed_count
@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Iterable, Optional
 
-from sqlalchemy import func, select
+from sqlalchemy import func, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from core.performance.member_cache import member_cache
+
 # Interfaces are now Protocols - no need to import for inheritance
 from core.repositories.base_repository import BaseRepository
 from datasources.models import Activity, AutoKick, Invite, Member, ModerationLog
@@ -23,7 +25,8 @@ class MemberRepository(BaseRepository):
     async def get_by_discord_id(self, discord_id: int) -> Optional[Member]:
         """Get member by Discord ID."""
         try:
-            result = await self.session.execute(select(Member).where(Member.id == discord_id))
+            # Hot path: lambda statements skip rebuilding the SELECT and its cache key on every call
+            result = await self.session.execute(lambda_stmt(lambda: select(Member).where(Member.id == discord_id)))
             return result.scalar_one_or_none()
         except Exception as e:
             self._log_error("get_by_discord_id", e, discord_id=discord_id)
@@ -32,12 +35,12 @@ class MemberRepository(BaseRepository):
     async def get_or_create(self, discord_id: int, **kwargs) -> Member:
         """Get existing member or create new one."""
         try:
-            # Try to get existing member
-            member = await self.get_by_discord_id(discord_id)
-            if member:
-                return member
+            # Only IDs known to exist are selected; create_member's ON CONFLICT DO NOTHING covers the rest
+            if discord_id in member_cache:
+                member = await self.get_by_discord_id(discord_id)
+                if member:
+                    return member
 
-            # Create new member if not found
             return await self.create_member(
                 discord_id=discord_id,
                 first_inviter_id=kwargs.get("first_inviter_id"),
@@ -64,23 +67,30 @@ class MemberRepository(BaseRepository):
         first_inviter_id: Optional[int] = None,
         current_inviter_id: Optional[int] = None,
         joined_at: Optional[datetime] = None,
+        wallet_balance: int = 0,
+        rejoined_at: Optional[datetime] = None,
     ) -> Member:
-        """Create a new member."""
+        """Create a new member (or return the existing one if it was inserted concurrently)."""
         try:
             if joined_at is None:
                 joined_at = datetime.now(timezone.utc)
 
-            member = Member(
-                id=discord_id,
-                first_inviter_id=first_inviter_id,
-                current_inviter_id=current_inviter_id,
-                joined_at=joined_at,
-                wallet_balance=0,
+            # INSERT ... ON CONFLICT DO NOTHING RETURNING: no refresh round-trip, no IntegrityError on races
+            created = await self.bulk_upsert(
+                [
+                    {
+                        "id": discord_id,
+                        "first_inviter_id": first_inviter_id,
+                        "current_inviter_id": current_inviter_id,
+                        "joined_at": joined_at,
+                        "rejoined_at": rejoined_at,
+                        "wallet_balance": wallet_balance,
+                    }
+                ],
+                returning=True,
             )
-
-            self.session.add(member)
-            await self.session.flush()
-            await self.session.refresh(member)
+            member = created[0] if created else await self.get_by_discord_id(discord_id)
+            member_cache.mark_known(self.session, (discord_id,))
 
             self._log_operation(
                 "create_member",
@@ -95,6 +105,14 @@ class MemberRepository(BaseRepository):
             self._log_error("create_member", e, discord_id=discord_id)
             raise
 
+    async def ensure_members_exist(self, member_ids: Iterable[int]) -> int:
+        """Insert the members not known to exist; returns how many IDs had to be sent to the database."""
+        try:
+            return await member_cache.ensure(self.session, member_ids)
+        except Exception as e:
+            self._log_error("ensure_members_exist", e)
+            raise
+
     async def update_wallet_balance(self, member_id: int, new_balance: int) -> bool:
         """Update member's wallet balance."""
         try:
@@ -201,7 +219,7 @@ class MemberRepository(BaseRepository):
     ) -> Member:
         """Legacy compatibility method for MemberQueries.get_or_add_member."""
         try:
-            member = await self.get_by_discord_id(member_id)
+            member = await self.get_by_discord_id(member_id) if member_id in member_cache else None
             if member is None:
                 member = await self.create_member(
                     discord_id=member_id,
@@ -211,13 +229,13 @@ class MemberRepository(BaseRepository):
                     joined_at=joined_at,
                     rejoined_at=rejoined_at,
                 )
-            else:
-                # Update fields for existing members
-                if current_inviter_id is not None:
-                    member.current_inviter_id = current_inviter_id
-                if rejoined_at is not None:
-                    member.rejoined_at = rejoined_at
-                await self.session.flush()
+
+            # Update fields for existing members (no-op for a member created above)
+            if current_inviter_id is not None:
+                member.current_inviter_id = current_inviter_id
+            if rejoined_at is not None:
+                member.rejoined_at = rejoined_at
+            await self.session.flush()
 
             return member
 
@@ -754,9 +772,11 @@ class AutoKickRepository(BaseRepository):
         """Get specific autokick setting."""
         try:
             result = await self.session.execute(
-                select(AutoKick).where(
-                    AutoKick.owner_id == owner_id,
-                    AutoKick.target_id == target_id,
+                lambda_stmt(
+                    lambda: select(AutoKick).where(
+                        AutoKick.owner_id == owner_id,
+                        AutoKick.target_id == target_id,
+                    )
                 )
             )
             return result.scalar_one_or_none()
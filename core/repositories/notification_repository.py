@@ -51,24 +51,22 @@ class NotificationRepository(BaseRepository):
         Returns:
             NotificationLog entry
         """
-        notification_log = await self.session.get(NotificationLog, (member_id, notification_tag))
-
-        if notification_log is None:
-            notification_log = NotificationLog(
-                member_id=member_id,
-                notification_tag=notification_tag,
-                sent_at=datetime.now(timezone.utc),
-                notification_count=0,
-                opted_out=False,
-            )
-            self.session.add(notification_log)
-        else:
-            notification_log.sent_at = datetime.now(timezone.utc)
-            if reset_notification_count:
-                notification_log.notification_count = 0
-
+        # A single INSERT ... ON CONFLICT ... RETURNING instead of get, write and refresh
+        update_columns = ["sent_at", "notification_count"] if reset_notification_count else ["sent_at"]
+        (notification_log,) = await self.bulk_upsert(
+            [
+                {
+                    "member_id": member_id,
+                    "notification_tag": notification_tag,
+                    "sent_at": datetime.now(timezone.utc),
+                    "notification_count": 0,
+                    "opted_out": False,
+                }
+            ],
+            update_columns=update_columns,
+            returning=True,
+        )
         await self.session.commit()
-        await self.session.refresh(notification_log)
 
         logger.info(f"Updated notification log: member={member_id}, tag={notification_tag}")
         return notification_log
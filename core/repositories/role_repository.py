@@ -183,16 +183,13 @@ class RoleRepository(BaseRepository):
     async def add_member_role(
         self, member_id: int, role_id: int, expiration_date: Optional[datetime] = None, role_type: str = "temporary"
     ) -> MemberRole:
-        """Add a role to a member."""
+        """Add a role to a member; an existing assignment is returned unchanged."""
         try:
-            member_role = MemberRole(member_id=member_id, role_id=role_id, expiration_date=expiration_date)
-            self.session.add(member_role)
-            await self.session.flush()
-            return member_role
-        except IntegrityError:
-            await self.session.rollback()
-            # Role already exists, return it
-            return await self.get_member_role(member_id, role_id)
+            # ON CONFLICT DO NOTHING instead of rolling back the whole session on a duplicate
+            created = await self.bulk_upsert(
+                [{"member_id": member_id, "role_id": role_id, "expiration_date": expiration_date}], returning=True
+            )
+            return created[0] if created else await self.get_member_role(member_id, role_id)
         except Exception as e:
             self.logger.error(f"Error adding role {role_id} to member {member_id}: {e}")
             raise
@@ -258,24 +255,16 @@ class RoleRepository(BaseRepository):
     ) -> bool:
         """Add a role to a member or update its expiration date if it already exists."""
         try:
-            member_role = await self.session.get(MemberRole, (member_id, role_id))
-
             # Calculate expiration date (if duration is None, set it to None for permanent)
             expiration_date = None if duration is None else datetime.now(timezone.utc) + duration
 
-            if member_role:
-                member_role.expiration_date = expiration_date
-                logger.info(f"Updated expiration date for role {role_id} of member {member_id}")
-            else:
-                member_role = MemberRole(
-                    member_id=member_id,
-                    role_id=role_id,
-                    expiration_date=expiration_date,
-                )
-                self.session.add(member_role)
-                logger.info(f"Added new role {role_id} to member {member_id}")
-
-            await self.session.flush()
+            # Single INSERT ... ON CONFLICT DO UPDATE; returning refreshes an already loaded MemberRole
+            await self.bulk_upsert(
+                [{"member_id": member_id, "role_id": role_id, "expiration_date": expiration_date}],
+                update_columns=["expiration_date"],
+                returning=True,
+            )
+            logger.info(f"Added or updated role {role_id} of member {member_id}")
             return True
 
         except IntegrityError as e:
@@ -1,6 +1,7 @@
 """Service layer - business logic abstraction."""
 
 # Export all services for easy importing
+from .activity_buffer import ActivityPointsBuffer
 from .activity_tracking_service import ActivityTrackingService
 from .base_service import BaseService
 from .cache_service import CacheService
@@ -13,6 +14,7 @@ from .notification_service import NotificationService
 from .payment_processor_service import PaymentProcessorService
 from .permission_service import PermissionService
 from .premium_service import PremiumService
+from .ranking_index import ActivityRankingIndex
 from .role_service import RoleService
 from .team_management_service import TeamManagementService
 
@@ -20,6 +22,8 @@ __all__ = [
     # Base service
     "BaseService",
     # Activity tracking
+    "ActivityPointsBuffer",
+    "ActivityRankingIndex",
     "ActivityTrackingService",
     # Cache
     "CacheService",
@@ -0,0 +1,184 @@
+"""Write-behind buffer that coalesces activity points before they reach the database."""
+
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from datasources.queries.activity_queries import rebuild_activity_summary, upsert_activity_points
+
+logger = logging.getLogger(__name__)
+
+# (member_id, day, activity_type)
+BufferKey = Tuple[int, datetime, str]
+
+
+def activity_day(moment: Optional[datetime] = None) -> datetime:
+    """Return the UTC midnight that activity points for ``moment`` are stored under."""
+    moment = moment or datetime.now(timezone.utc)
+    return moment.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+class ActivityPointsBuffer:
+    """
+    In-memory aggregation of activity points keyed by (member_id, day, activity_type).
+
+    Increments are coalesced in memory and written periodically (and on shutdown)
+    as a single multi-row ``INSERT ... ON CONFLICT DO UPDATE``, so message and voice
+    tracking no longer open a transaction per event.
+    """
+
+    def __init__(self, session_factory, flush_interval: float = 15.0, max_pending: int = 5000):
+        self._session_factory = session_factory
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+
+        self._pending: Dict[BufferKey, int] = defaultdict(int)
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._early_flush_task: Optional[asyncio.Task] = None
+
+        self._stats = {
+            "increments": 0,
+            "flushes": 0,
+            "failed_flushes": 0,
+            "rows_written": 0,
+            "last_flush_duration": 0.0,
+        }
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the periodic flush loop is active."""
+        return self._flush_task is not None and not self._flush_task.done()
+
+    @property
+    def pending_count(self) -> int:
+        """Number of distinct (member, day, type) keys waiting to be written."""
+        return len(self._pending)
+
+    def add(self, member_id: int, activity_type: str, points: int, date: Optional[datetime] = None) -> None:
+        """Queue points for a member. Never touches the database."""
+        if not points:
+            return
+
+        key = (member_id, date or activity_day(), activity_type)
+        self._pending[key] += points
+        self._stats["increments"] += 1
+
+        if len(self._pending) >= self.max_pending and self.is_running:
+            if self._early_flush_task is None or self._early_flush_task.done():
+                self._early_flush_task = asyncio.create_task(self.flush())
+
+    async def flush(self) -> int:
+        """Write all pending points to the database. Returns number of rows upserted."""
+        async with self._flush_lock:
+            return await self._flush_pending()
+
+    @asynccontextmanager
+    async def flushed(self) -> AsyncIterator["ActivityPointsBuffer"]:
+        """Flush, then hold off further flushes until the block exits.
+
+        Inside the block the database has every point except those returned by
+        ``pending_increments``, which also covers points added while the block runs.
+        """
+        async with self._flush_lock:
+            await self._flush_pending()
+            yield self
+
+    def pending_increments(self) -> List[Tuple[int, datetime, str, int]]:
+        """Points not yet written, as (member_id, day, activity_type, points)."""
+        return [
+            (member_id, day, activity_type, points)
+            for (member_id, day, activity_type), points in self._pending.items()
+        ]
+
+    async def _flush_pending(self) -> int:
+        """Write the pending batch; the caller holds ``_flush_lock``."""
+        if not self._pending:
+            return 0
+
+        batch = self._pending
+        self._pending = defaultdict(int)
+        start_time = time.monotonic()
+
+        try:
+            await self._write_batch(batch)
+        except Exception as e:
+            # Put the points back so the next flush retries them
+            for key, points in batch.items():
+                self._pending[key] += points
+            self._stats["failed_flushes"] += 1
+            logger.error(f"Failed to flush {len(batch)} activity rows: {e}")
+            return 0
+
+        duration = time.monotonic() - start_time
+        self._stats["flushes"] += 1
+        self._stats["rows_written"] += len(batch)
+        self._stats["last_flush_duration"] = duration
+        logger.debug(f"Flushed {len(batch)} activity rows in {duration * 1000:.1f}ms")
+        return len(batch)
+
+    async def _write_batch(self, batch: Dict[BufferKey, int]) -> None:
+        """Upsert members, activity rows and the summary for a batch in one transaction."""
+        increments = [
+            (member_id, date, activity_type, points) for (member_id, date, activity_type), points in batch.items()
+        ]
+
+        async with self._session_factory() as session:
+            try:
+                await upsert_activity_points(session, increments)
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+    async def rebuild_summary(self) -> int:
+        """Recompute the rolling summary windows, holding back flushes so no increment is lost."""
+        async with self._flush_lock:
+            async with self._session_factory() as session:
+                try:
+                    rows = await rebuild_activity_summary(session)
+                    await session.commit()
+                except Exception:
+                    await session.rollback()
+                    raise
+
+        logger.info(f"Activity summary rebuilt: {rows} rows")
+        return rows
+
+    async def _flush_loop(self) -> None:
+        """Background task flushing the buffer every ``flush_interval`` seconds."""
+        while True:
+            try:
+                await asyncio.sleep(self.flush_interval)
+                await self.flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in activity buffer flush loop: {e}")
+
+    def start(self) -> None:
+        """Start the periodic flush loop."""
+        if not self.is_running:
+            self._flush_task = asyncio.create_task(self._flush_loop())
+            logger.info(f"Activity buffer started (flush every {self.flush_interval}s)")
+
+    async def stop(self) -> None:
+        """Stop the flush loop and write everything that is still pending."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+
+        flushed = await self.flush()
+        logger.info(f"Activity buffer stopped, final flush wrote {flushed} rows")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get buffer statistics."""
+        return {**self._stats, "pending": len(self._pending), "running": self.is_running}
@@ -16,8 +16,16 @@ from datasources.queries import (
     get_member_activity_breakdown,
     get_member_ranking_position,
     get_member_total_points,
-    get_ranking_tier,
+    upsert_activity_points,
+    upsert_activity_summary,
 )
+from core.services.ranking_index import UNRANKED, tier_for_position
+from utils.keyword_matcher import KeywordMatch, shared_matcher
+
+# Status text that counts as promoting our server
+PROMOTION_KEYWORDS = ("zagadka", ".gg/zagadka", "discord.gg/zagadka")
+# Invite fragment that, without a promotion keyword, means promoting another server
+ANTIPROMO_MARKER = ".gg/"
 
 
 class ActivityTrackingService(BaseService, IActivityTrackingService):
@@ -43,12 +51,27 @@ class ActivityTrackingService(BaseService, IActivityTrackingService):
     NIGHT_OWL_BONUS = 1  # Extra point for activity 22:00-06:00
     EARLY_BIRD_BONUS = 1  # Extra point for activity 06:00-10:00
 
-    def __init__(self, activity_repository, member_repository, unit_of_work, guild: discord.Guild = None, **kwargs):
+    def __init__(
+        self,
+        activity_repository,
+        member_repository,
+        unit_of_work,
+        guild: discord.Guild = None,
+        activity_buffer=None,
+        ranking_index=None,
+        **kwargs,
+    ):
         super().__init__(unit_of_work=unit_of_work)
         self.activity_repository = activity_repository
         self.member_repository = member_repository
         self.guild = guild
-        self.promotion_keywords = ["zagadka", ".gg/zagadka", "discord.gg/zagadka"]
+        # Shared write-behind buffer owned by the bot; None means write-through
+        self.activity_buffer = activity_buffer
+        # Shared in-memory ranking index; answers indexed windows without Postgres
+        self.ranking_index = ranking_index
+        self.promotion_keywords = list(PROMOTION_KEYWORDS)
+        # Promotion keywords and the invite marker, compiled once and shared between instances
+        self.status_matcher = shared_matcher(*PROMOTION_KEYWORDS, ANTIPROMO_MARKER)
         self.logger = logging.getLogger(self.__class__.__name__)
 
     async def validate_operation(self, *args, **kwargs) -> bool:
@@ -151,12 +174,25 @@ class ActivityTrackingService(BaseService, IActivityTrackingService):
 
     async def _add_points(self, session: AsyncSession, member_id: int, activity_type: str, points: int) -> None:
         """Internal method to add points."""
+        if self.activity_buffer is not None:
+            self.activity_buffer.add(member_id, activity_type, points)
+            if self.ranking_index is not None:
+                self.ranking_index.add_points(member_id, points)
+            self.logger.debug(f"Buffered {points} {activity_type} points for member {member_id}")
+            return
+
         try:
             # Ensure member exists in database
             await ensure_member_exists(session, member_id)
             await add_activity_points(session, member_id, activity_type, points)
+            await upsert_activity_summary(
+                session, [(member_id, datetime.now(timezone.utc), activity_type, points)]
+            )
             await session.commit()
 
+            if self.ranking_index is not None:
+                self.ranking_index.add_points(member_id, points)
+
             self.logger.debug(f"Added {points} {activity_type} points to member {member_id}")
 
         except Exception as e:
@@ -167,9 +203,14 @@ class ActivityTrackingService(BaseService, IActivityTrackingService):
     async def get_member_stats(self, session: AsyncSession, member_id: int, days_back: int = 7) -> Dict[str, any]:
         """Get comprehensive stats for a member."""
         try:
-            total_points = await get_member_total_points(session, member_id, days_back)
-            position = await get_member_ranking_position(session, member_id, days_back)
-            tier = await get_ranking_tier(session, member_id, days_back)
+            if self.ranking_index is not None and self.ranking_index.covers(days_back):
+                total_points = self.ranking_index.get_total_points(member_id, days_back)
+                position = self.ranking_index.get_position(member_id, days_back)
+                tier = tier_for_position(position)
+            else:
+                total_points = await get_member_total_points(session, member_id, days_back)
+                position = await get_member_ranking_position(session, member_id, days_back)
+                tier = tier_for_position(position)
             breakdown = await get_member_activity_breakdown(session, member_id, days_back)
 
             stats = {
@@ -206,12 +247,36 @@ class ActivityTrackingService(BaseService, IActivityTrackingService):
                 "days_back": days_back,
             }
 
+    async def get_member_rank(self, session: AsyncSession, member_id: int, days_back: int = 7) -> Dict[str, any]:
+        """Get member's total points, position and tier without the activity breakdown."""
+        try:
+            if self.ranking_index is not None and self.ranking_index.covers(days_back):
+                total_points = self.ranking_index.get_total_points(member_id, days_back)
+                position = self.ranking_index.get_position(member_id, days_back)
+            else:
+                total_points = await get_member_total_points(session, member_id, days_back)
+                position = await get_member_ranking_position(session, member_id, days_back)
+
+            return {
+                "total_points": total_points,
+                "position": position,
+                "tier": tier_for_position(position),
+                "days_back": days_back,
+            }
+
+        except Exception as e:
+            self._log_error("get_member_rank", e, member_id=member_id, days_back=days_back)
+            return {"total_points": 0, "position": 0, "tier": UNRANKED, "days_back": days_back}
+
     async def get_leaderboard(
         self, session: AsyncSession, limit: int = 10, days_back: int = 7
     ) -> List[Tuple[int, int, int]]:
         """Get leaderboard with member_id, points, and position."""
         try:
-            leaderboard = await get_activity_leaderboard_with_names(session, limit, days_back)
+            if self.ranking_index is not None and self.ranking_index.covers(days_back):
+                leaderboard = self.ranking_index.get_leaderboard(limit, days_back)
+            else:
+                leaderboard = await get_activity_leaderboard_with_names(session, limit, days_back)
 
             self._log_operation(
                 "get_leaderboard",
@@ -231,56 +296,22 @@ class ActivityTrackingService(BaseService, IActivityTrackingService):
             )
             return []
 
+    def _activity_label(self, match: KeywordMatch) -> str:
+        """Label used in logs for the activity field a keyword was found in."""
+        return "custom" if isinstance(match.activity, discord.CustomActivity) else match.field
+
     async def check_member_promotion_status(self, member: discord.Member) -> bool:
         """Check if member has server promotion in their status."""
         try:
-            if not member.activities:
-                return False
-
-            for activity in member.activities:
-                # Check custom status
-                if isinstance(activity, discord.CustomActivity):
-                    if activity.name and any(keyword in activity.name.lower() for keyword in self.promotion_keywords):
-                        self._log_operation(
-                            "promotion_status_found",
-                            member_id=member.id,
-                            activity_type="custom",
-                            content=activity.name,
-                        )
-                        return True
-
-                # Check activity name
-                if hasattr(activity, "name") and activity.name:
-                    if any(keyword in activity.name.lower() for keyword in self.promotion_keywords):
-                        self._log_operation(
-                            "promotion_status_found",
-                            member_id=member.id,
-                            activity_type="name",
-                            content=activity.name,
-                        )
-                        return True
-
-                # Check activity details
-                if hasattr(activity, "details") and activity.details:
-                    if any(keyword in activity.details.lower() for keyword in self.promotion_keywords):
-                        self._log_operation(
-                            "promotion_status_found",
-                            member_id=member.id,
-                            activity_type="details",
-                            content=activity.details,
-                        )
-                        return True
-
-                # Check activity state
-                if hasattr(activity, "state") and activity.state:
-                    if any(keyword in activity.state.lower() for keyword in self.promotion_keywords):
-                        self._log_operation(
-                            "promotion_status_found",
-                            member_id=member.id,
-                            activity_type="state",
-                            content=activity.state,
-                        )
-                        return True
+            for match in self.status_matcher.scan_activities(member.activities):
+                if match.keyword != ANTIPROMO_MARKER:
+                    self._log_operation(
+                        "promotion_status_found",
+                        member_id=member.id,
+                        activity_type=self._activity_label(match),
+                        content=match.content,
+                    )
+                    return True
 
             return False
 
@@ -291,34 +322,22 @@ class ActivityTrackingService(BaseService, IActivityTrackingService):
     async def check_member_antipromo_status(self, member: discord.Member) -> bool:
         """Check if member is promoting other Discord servers (anti-cheat)."""
         try:
-            if not member.activities:
-                return False
-
-            for activity in member.activities:
-                # Check custom status
-                if isinstance(activity, discord.CustomActivity):
-                    if activity.name and ".gg/" in activity.name.lower():
-                        # Check if it's NOT our server
-                        if not any(keyword in activity.name.lower() for keyword in self.promotion_keywords):
-                            self._log_operation(
-                                "antipromo_status_found",
-                                member_id=member.id,
-                                activity_type="custom",
-                                content=activity.name,
-                            )
-                            return True
-
-                # Check activity name
-                if hasattr(activity, "name") and activity.name:
-                    if ".gg/" in activity.name.lower():
-                        if not any(keyword in activity.name.lower() for keyword in self.promotion_keywords):
-                            self._log_operation(
-                                "antipromo_status_found",
-                                member_id=member.id,
-                                activity_type="name",
-                                content=activity.name,
-                            )
-                            return True
+            # Keywords found per activity name; an invite without our keywords is someone else's server
+            names: Dict[int, List[KeywordMatch]] = {}
+            for match in self.status_matcher.scan_activities(member.activities):
+                if match.field == "name":
+                    names.setdefault(id(match.activity), []).append(match)
+
+            for matches in names.values():
+                keywords = {match.keyword for match in matches}
+                if keywords == {ANTIPROMO_MARKER}:
+                    self._log_operation(
+                        "antipromo_status_found",
+                        member_id=member.id,
+                        activity_type=self._activity_label(matches[0]),
+                        content=matches[0].content,
+                    )
+                    return True
 
             return False
 
@@ -674,6 +693,53 @@ class ActivityTrackingService(BaseService, IActivityTrackingService):
         except Exception as e:
             self._log_error("track_voice_activity", e, member_id=member_id, channel_id=channel_id)
 
+    async def track_voice_activity_bulk(self, awards: List[Tuple[int, int, bool]]) -> int:
+        """Award one voice tick to many (member_id, channel_id, is_with_others) at once."""
+        if not awards:
+            return 0
+
+        try:
+            time_bonus = self.get_time_bonus()
+            points_by_member: Dict[int, int] = {}
+            for member_id, _channel_id, is_with_others in awards:
+                base_points = self.VOICE_WITH_OTHERS if is_with_others else self.VOICE_ALONE
+                points_by_member[member_id] = base_points + time_bonus
+
+            if self.activity_buffer is not None:
+                for member_id, points in points_by_member.items():
+                    self.activity_buffer.add(member_id, ActivityType.VOICE, points)
+            else:
+                if not self.unit_of_work:
+                    self._log_error("track_voice_activity_bulk", ValueError("No unit of work available"))
+                    return 0
+
+                now = datetime.now(timezone.utc)
+                day = now.replace(hour=0, minute=0, second=0, microsecond=0)
+                async with self.unit_of_work as uow:
+                    await upsert_activity_points(
+                        uow.session,
+                        [
+                            (member_id, day, ActivityType.VOICE, points)
+                            for member_id, points in points_by_member.items()
+                        ],
+                    )
+                    await uow.commit()
+
+            if self.ranking_index is not None:
+                for member_id, points in points_by_member.items():
+                    self.ranking_index.add_points(member_id, points)
+
+            self._log_operation(
+                "track_voice_activity_bulk",
+                member_count=len(points_by_member),
+                time_bonus=time_bonus,
+            )
+            return len(points_by_member)
+
+        except Exception as e:
+            self._log_error("track_voice_activity_bulk", e, member_count=len(awards))
+            return 0
+
     async def track_promotion_activity(self, member_id: int) -> None:
         """Track promotion activity for a member."""
         try:
@@ -7,238 +7,95 @@ import asyncio
 import hashlib
 import json
 import logging
-import time
-from dataclasses import dataclass
 from typing import Any, Callable, Dict, Optional, Set, Union
 
-logger = logging.getLogger(__name__)
-
-
-@dataclass
-class CacheEntry:
-    """Individual cache entry with metadata."""
-
-    value: Any
-    created_at: float
-    expires_at: Optional[float]
-    access_count: int = 0
-    last_accessed: float = 0
-    tags: Set[str] = None
-
-    def __post_init__(self):
-        if self.tags is None:
-            self.tags = set()
-        self.last_accessed = time.time()
-
-    @property
-    def is_expired(self) -> bool:
-        """Check if entry is expired."""
-        if self.expires_at is None:
-            return False
-        return time.time() > self.expires_at
-
-    @property
-    def age_seconds(self) -> float:
-        """Get age of entry in seconds."""
-        return time.time() - self.created_at
-
-    def access(self) -> Any:
-        """Record access and return value."""
-        self.access_count += 1
-        self.last_accessed = time.time()
-        return self.value
-
-
-@dataclass
-class CacheStats:
-    """Cache performance statistics."""
+from core.performance.tiered_cache import TieredCache, get_tiered_cache
 
-    hits: int = 0
-    misses: int = 0
-    sets: int = 0
-    deletes: int = 0
-    evictions: int = 0
-    expired_cleanups: int = 0
-
-    @property
-    def hit_ratio(self) -> float:
-        """Calculate cache hit ratio."""
-        total = self.hits + self.misses
-        return self.hits / total if total > 0 else 0.0
-
-    @property
-    def total_operations(self) -> int:
-        """Total cache operations."""
-        return self.hits + self.misses + self.sets + self.deletes
+logger = logging.getLogger(__name__)
 
 
 class CacheService:
     """
-    High-performance memory cache with advanced features:
+    Namespaced cache API over a ``TieredCache``.
+
     - TTL (Time To Live) support
     - Tag-based invalidation
-    - LRU eviction
+    - Size-bounded O(1) LRU eviction
     - Performance metrics
-    - Key namespacing
+    - Key namespacing with keyword parameters
+
+    Without a ``backend`` the service uses the process-wide cache from
+    ``get_tiered_cache``, so its entries count against the bot-wide memory
+    budget and show up in the shared metrics.
     """
 
-    def __init__(self, max_size: int = 10000, default_ttl: int = 300):
-        self._cache: Dict[str, CacheEntry] = {}
-        self._max_size = max_size
+    def __init__(self, default_ttl: int = 300, backend: Optional[TieredCache] = None):
         self._default_ttl = default_ttl
-        self._stats = CacheStats()
-        self._lock = asyncio.Lock()
-
-        # Tag tracking for invalidation
-        self._tag_to_keys: Dict[str, Set[str]] = {}
+        self._backend = backend if backend is not None else get_tiered_cache()
 
-        # Start background cleanup task
-        self._cleanup_task = asyncio.create_task(self._cleanup_expired())
+    @property
+    def backend(self) -> TieredCache:
+        """The tiered cache holding this service's entries."""
+        return self._backend
 
-    def _generate_key(self, namespace: str, key: str, **kwargs) -> str:
-        """Generate cache key with namespace and parameters."""
+    def _generate_key(self, key: str, **kwargs) -> str:
+        """Generate the in-namespace cache key from a key and parameters."""
         if kwargs:
             # Sort kwargs for consistent key generation
             params_str = json.dumps(kwargs, sort_keys=True, default=str)
-            key_data = f"{namespace}:{key}:{params_str}"
+            key_data = f"{key}:{params_str}"
         else:
-            key_data = f"{namespace}:{key}"
+            key_data = key
 
         # Hash long keys to avoid memory issues
         if len(key_data) > 250:
-            return f"{namespace}:{hashlib.md5(key_data.encode()).hexdigest()}"
+            return hashlib.md5(key_data.encode()).hexdigest()
         return key_data
 
-    async def get(self, namespace: str, key: str, default: Any = None, **kwargs) -> Any:
-        """Get value from cache."""
-        cache_key = self._generate_key(namespace, key, **kwargs)
-
-        async with self._lock:
-            entry = self._cache.get(cache_key)
+    def _ttl(self, ttl: Optional[int]) -> int:
+        return self._default_ttl if ttl is None else ttl
 
-            if entry is None:
-                self._stats.misses += 1
-                logger.debug(f"Cache MISS: {cache_key}")
-                return default
+    def get_nowait(self, namespace: str, key: str, default: Any = None, **kwargs) -> Any:
+        """Get value from the in-memory tier without locking or yielding to the event loop."""
+        return self._backend.get_nowait(namespace, self._generate_key(key, **kwargs), default)
 
-            if entry.is_expired:
-                # Remove expired entry
-                await self._remove_entry(cache_key)
-                self._stats.misses += 1
-                self._stats.expired_cleanups += 1
-                logger.debug(f"Cache EXPIRED: {cache_key}")
-                return default
-
-            # Cache hit
-            self._stats.hits += 1
-            logger.debug(f"Cache HIT: {cache_key} (age: {entry.age_seconds:.1f}s)")
-            return entry.access()
+    async def get(self, namespace: str, key: str, default: Any = None, **kwargs) -> Any:
+        """Get value from cache."""
+        return await self._backend.get(namespace, self._generate_key(key, **kwargs), default)
 
     async def set(
         self, namespace: str, key: str, value: Any, ttl: Optional[int] = None, tags: Optional[Set[str]] = None, **kwargs
     ) -> None:
         """Set value in cache with optional TTL and tags."""
-        cache_key = self._generate_key(namespace, key, **kwargs)
-
-        if ttl is None:
-            ttl = self._default_ttl
-
-        expires_at = time.time() + ttl if ttl > 0 else None
-        entry_tags = tags or set()
-
-        async with self._lock:
-            # Check if we need to evict entries
-            if len(self._cache) >= self._max_size:
-                await self._evict_lru()
-
-            # Remove old entry if exists (for tag cleanup)
-            if cache_key in self._cache:
-                await self._remove_entry(cache_key)
-
-            # Create new entry
-            entry = CacheEntry(value=value, created_at=time.time(), expires_at=expires_at, tags=entry_tags)
-
-            self._cache[cache_key] = entry
-            self._stats.sets += 1
-
-            # Update tag tracking
-            for tag in entry_tags:
-                if tag not in self._tag_to_keys:
-                    self._tag_to_keys[tag] = set()
-                self._tag_to_keys[tag].add(cache_key)
-
-            logger.debug(f"Cache SET: {cache_key} (ttl: {ttl}s, tags: {entry_tags})")
+        await self._backend.set(namespace, self._generate_key(key, **kwargs), value, ttl=self._ttl(ttl), tags=tags)
 
     async def delete(self, namespace: str, key: str, **kwargs) -> bool:
         """Delete specific cache entry."""
-        cache_key = self._generate_key(namespace, key, **kwargs)
-
-        async with self._lock:
-            if cache_key in self._cache:
-                await self._remove_entry(cache_key)
-                self._stats.deletes += 1
-                logger.debug(f"Cache DELETE: {cache_key}")
-                return True
-            return False
+        return await self._backend.delete(namespace, self._generate_key(key, **kwargs))
 
     async def invalidate_by_tags(self, tags: Union[str, Set[str]]) -> int:
         """Invalidate all cache entries with specified tags."""
-        if isinstance(tags, str):
-            tags = {tags}
-
-        async with self._lock:
-            keys_to_remove = set()
-
-            for tag in tags:
-                if tag in self._tag_to_keys:
-                    keys_to_remove.update(self._tag_to_keys[tag])
-
-            removed_count = 0
-            for cache_key in keys_to_remove:
-                if cache_key in self._cache:
-                    await self._remove_entry(cache_key)
-                    removed_count += 1
-
-            logger.info(f"Cache invalidated {removed_count} entries by tags: {tags}")
-            return removed_count
+        removed_count = await self._backend.invalidate_tags(tags)
+        logger.info(f"Cache invalidated {removed_count} entries by tags: {tags}")
+        return removed_count
 
     async def invalidate_namespace(self, namespace: str) -> int:
         """Invalidate all entries in a namespace."""
-        async with self._lock:
-            prefix = f"{namespace}:"
-            keys_to_remove = [key for key in self._cache.keys() if key.startswith(prefix)]
-
-            removed_count = 0
-            for cache_key in keys_to_remove:
-                await self._remove_entry(cache_key)
-                removed_count += 1
-
-            logger.info(f"Cache invalidated {removed_count} entries in namespace: {namespace}")
-            return removed_count
+        removed_count = await self._backend.invalidate_namespace(namespace)
+        logger.info(f"Cache invalidated {removed_count} entries in namespace: {namespace}")
+        return removed_count
 
     async def clear(self) -> None:
         """Clear all cache entries."""
-        async with self._lock:
-            count = len(self._cache)
-            self._cache.clear()
-            self._tag_to_keys.clear()
-            logger.info(f"Cache cleared {count} entries")
+        count = len(self._backend)
+        self._backend.clear_nowait()
+        logger.info(f"Cache cleared {count} entries")
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache performance statistics."""
-        return {
-            "hits": self._stats.hits,
-            "misses": self._stats.misses,
-            "sets": self._stats.sets,
-            "deletes": self._stats.deletes,
-            "evictions": self._stats.evictions,
-            "expired_cleanups": self._stats.expired_cleanups,
-            "hit_ratio": self._stats.hit_ratio,
-            "total_operations": self._stats.total_operations,
-            "current_size": len(self._cache),
-            "max_size": self._max_size,
-            "tag_count": len(self._tag_to_keys),
-        }
+        stats = self._backend.get_stats()
+        stats["max_size"] = self._backend.max_entries
+        return stats
 
     async def get_or_set(
         self,
@@ -249,87 +106,13 @@ class CacheService:
         tags: Optional[Set[str]] = None,
         **kwargs,
     ) -> Any:
-        """Get value from cache or set it using factory function."""
-        # Try to get from cache first
-        value = await self.get(namespace, key, **kwargs)
-
-        if value is not None:
-            return value
-
-        # Value not in cache, create it
-        try:
-            if asyncio.iscoroutinefunction(factory):
-                value = await factory()
-            else:
-                value = factory()
-
-            # Store in cache
-            await self.set(namespace, key, value, ttl=ttl, tags=tags, **kwargs)
-            return value
-
-        except Exception as e:
-            logger.error(f"Factory function failed for {namespace}:{key}: {e}")
-            raise
-
-    async def _remove_entry(self, cache_key: str) -> None:
-        """Remove cache entry and clean up tags."""
-        if cache_key not in self._cache:
-            return
-
-        entry = self._cache[cache_key]
-
-        # Clean up tag references
-        for tag in entry.tags:
-            if tag in self._tag_to_keys:
-                self._tag_to_keys[tag].discard(cache_key)
-                if not self._tag_to_keys[tag]:
-                    del self._tag_to_keys[tag]
-
-        del self._cache[cache_key]
-
-    async def _evict_lru(self) -> None:
-        """Evict least recently used entries."""
-        if not self._cache:
-            return
-
-        # Find LRU entries (oldest last_accessed)
-        sorted_entries = sorted(self._cache.items(), key=lambda x: x[1].last_accessed)
-
-        # Evict 10% of cache size to avoid frequent evictions
-        evict_count = max(1, len(self._cache) // 10)
-
-        for i in range(evict_count):
-            if i < len(sorted_entries):
-                cache_key = sorted_entries[i][0]
-                await self._remove_entry(cache_key)
-                self._stats.evictions += 1
-
-    async def _cleanup_expired(self) -> None:
-        """Background task to clean up expired entries."""
-        while True:
-            try:
-                await asyncio.sleep(60)  # Run every minute
-
-                async with self._lock:
-                    expired_keys = []
-                    for cache_key, entry in self._cache.items():
-                        if entry.is_expired:
-                            expired_keys.append(cache_key)
-
-                    for cache_key in expired_keys:
-                        await self._remove_entry(cache_key)
-                        self._stats.expired_cleanups += 1
-
-                    if expired_keys:
-                        logger.debug(f"Cleaned up {len(expired_keys)} expired cache entries")
-
-            except Exception as e:
-                logger.error(f"Error in cache cleanup task: {e}")
+        """Get value from cache or set it using factory function.
 
-    def __del__(self):
-        """Cleanup when service is destroyed."""
-        if hasattr(self, "_cleanup_task") and not self._cleanup_task.done():
-            self._cleanup_task.cancel()
+        Concurrent misses for the same key share a single factory call.
+        """
+        return await self._backend.get_or_set(
+            namespace, self._generate_key(key, **kwargs), factory, ttl=self._ttl(ttl), tags=tags
+        )
 
 
 # Decorator for easy caching
@@ -350,8 +133,8 @@ def cached(namespace: str, ttl: int = 300, tags: Optional[Set[str]] = None, key_
             if args and hasattr(args[0], "cache_service"):
                 cache_service = args[0].cache_service
             else:
-                # Fallback - create temporary cache
-                cache_service = CacheService()
+                # Fallback - the shared cache
+                cache_service = get_cache()
 
             # Generate cache key
             if key_func:
@@ -24,7 +24,7 @@ from core.interfaces.premium_interfaces import (
 from core.repositories import InviteRepository
 from core.repositories.premium_repository import PaymentRepository, PremiumRepository
 from core.services.base_service import BaseService
-from core.services.cache_service import CacheService
+from core.services.premium_cache import get_premium_cache
 from datasources.queries import HandledPaymentQueries, MemberQueries, RoleQueries
 
 logger = logging.getLogger(__name__)
@@ -81,7 +81,8 @@ class ConsolidatedPremiumService(BaseService, IPremiumService, IPremiumChecker,
         self.payment_repository = payment_repository
         self.bot = bot
         self.guild: Optional[discord.Guild] = None
-        self.cache_service = CacheService(max_size=5000, default_ttl=300)  # 5 min cache
+        # Shared with every other request-scoped premium service
+        self.premium_cache = get_premium_cache(bot)
         self.config = bot.config
         self.mute_roles = {role["name"]: role for role in bot.config.get("mute_roles", [])}
         self.premium_roles_config = bot.config.get("premium_roles", [])
@@ -262,7 +263,7 @@ class ConsolidatedPremiumService(BaseService, IPremiumService, IPremiumChecker,
         """Check if member has any premium role (cached)."""
         try:
             # Try cache first
-            cached_result = await self.cache_service.get("premium", "has_premium_role", member_id=member.id)
+            cached_result = await self.premium_cache.get("has_premium_role", member.id)
             if cached_result is not None:
                 return cached_result
 
@@ -271,14 +272,7 @@ class ConsolidatedPremiumService(BaseService, IPremiumService, IPremiumChecker,
             has_premium = any(role_name in self.PREMIUM_PRIORITY for role_name in user_roles)
 
             # Cache result for 5 minutes
-            await self.cache_service.set(
-                "premium",
-                "has_premium_role",
-                has_premium,
-                ttl=300,
-                tags={f"member:{member.id}", "premium_roles"},
-                member_id=member.id,
-            )
+            await self.premium_cache.set("has_premium_role", member.id, has_premium, ttl=300)
 
             return has_premium
         except Exception as e:
@@ -416,6 +410,20 @@ class ConsolidatedPremiumService(BaseService, IPremiumService, IPremiumChecker,
         Main function to handle all premium role operations.
         Returns (embed, refund_amount, add_to_wallet).
         """
+        try:
+            return await self._assign_or_extend_premium_role(session, member, role_name, amount, duration_days, source)
+        finally:
+            await self.premium_cache.invalidate_member(member.id)
+
+    async def _assign_or_extend_premium_role(
+        self,
+        session,
+        member: discord.Member,
+        role_name: str,
+        amount: int,
+        duration_days: int,
+        source: str,
+    ) -> Tuple[discord.Embed, Optional[int], Optional[bool]]:
         if not self.guild:
             return (
                 discord.Embed(
@@ -672,6 +680,7 @@ class ConsolidatedPremiumService(BaseService, IPremiumService, IPremiumChecker,
 
                 # Use new service architecture
                 await member_service.get_or_create_member(member)
+                await self.premium_cache.invalidate_member(member.id)
 
                 # Check legacy conversion
                 final_amount = payment_data.amount
@@ -861,6 +870,9 @@ class ConsolidatedPremiumService(BaseService, IPremiumService, IPremiumChecker,
                                 logger.error(f"Error removing expired role: {e}")
                 await session.commit()
 
+            if processed:
+                await self.premium_cache.invalidate_all()
+
             return {
                 "expired_roles_processed": processed,
                 "maintenance_completed": 1,
@@ -973,6 +985,7 @@ class ConsolidatedPremiumService(BaseService, IPremiumService, IPremiumChecker,
                 async with self.bot.get_db() as session:
                     await RoleQueries.delete_member_role(session, member.id, role.id)
                     await session.commit()
+                await self.premium_cache.invalidate_member(member.id)
                 return True
             return False
         except Exception as e:
@@ -16,6 +16,7 @@ from core.interfaces.member_interfaces import (
     IModerationRepository,
     IModerationService,
 )
+from core.performance.member_cache import member_cache
 from core.services.base_service import BaseService
 from datasources.models import Activity, Invite, Member, ModerationLog
 
@@ -39,9 +40,11 @@ class MemberService(BaseService, IMemberService):
     async def get_or_create_member(self, discord_user: discord.Member | discord.User) -> Member:
         """Get existing member or create new one."""
         try:
-            member = await self.member_repository.get_by_discord_id(discord_user.id)
-            if member:
-                return member
+            # Unknown IDs skip the SELECT; create_member inserts with ON CONFLICT DO NOTHING
+            if discord_user.id in member_cache:
+                member = await self.member_repository.get_by_discord_id(discord_user.id)
+                if member:
+                    return member
 
             # Create new member
             joined_at = None
@@ -8,7 +8,7 @@ import discord
 
 from core.interfaces.premium_interfaces import CommandTier, IPremiumChecker
 from core.services.base_service import BaseService
-from core.services.cache_service import CacheService
+from core.services.premium_cache import get_premium_cache
 from datasources.queries import MemberQueries
 
 logger = logging.getLogger(__name__)
@@ -37,7 +37,8 @@ class PremiumCheckerService(BaseService, IPremiumChecker):
         super().__init__(**kwargs)
         self.bot = bot
         self.guild: Optional[discord.Guild] = None
-        self.cache_service = CacheService(max_size=1000, default_ttl=300)  # 5 min cache
+        # Shared with every other request-scoped premium service
+        self.premium_cache = get_premium_cache(bot)
         self.config = bot.config
         self.premium_roles_config = bot.config.get("premium_roles", [])
 
@@ -79,8 +80,7 @@ class PremiumCheckerService(BaseService, IPremiumChecker):
     async def has_premium_role(self, member: discord.Member) -> bool:
         """Check if member has any premium role."""
         # Check cache first
-        cache_key = f"has_premium:{member.id}"
-        cached_result = await self.cache_service.get(cache_key)
+        cached_result = await self.premium_cache.get("has_premium_role", member.id)
         if cached_result is not None:
             return cached_result
 
@@ -88,7 +88,7 @@ class PremiumCheckerService(BaseService, IPremiumChecker):
         result = any(role.name in self.PREMIUM_PRIORITY for role in member.roles)
 
         # Cache the result
-        await self.cache_service.set(cache_key, result)
+        await self.premium_cache.set("has_premium_role", member.id, result)
         return result
 
     async def get_member_premium_level(self, member: discord.Member) -> Optional[str]:
@@ -150,8 +150,7 @@ class PremiumCheckerService(BaseService, IPremiumChecker):
     async def has_alternative_bypass_access(self, member: discord.Member) -> bool:
         """Check if member has any alternative bypass access (T, booster, invite)."""
         # Check cache first
-        cache_key = f"alt_bypass:{member.id}"
-        cached_result = await self.cache_service.get(cache_key)
+        cached_result = await self.premium_cache.get("alt_bypass", member.id)
         if cached_result is not None:
             return cached_result
 
@@ -171,7 +170,7 @@ class PremiumCheckerService(BaseService, IPremiumChecker):
             has_bypass = True
 
         # Cache the result
-        await self.cache_service.set(cache_key, has_bypass, ttl=60)  # Short TTL for bypass
+        await self.premium_cache.set("alt_bypass", member.id, has_bypass, ttl=60)  # Short TTL for bypass
         return has_bypass
 
     async def get_command_tier(self, command_name: str) -> CommandTier:
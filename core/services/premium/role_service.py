@@ -9,6 +9,7 @@ import discord
 from core.interfaces.premium_interfaces import ExtensionResult, ExtensionType, IPremiumRoleManager, PremiumRoleConfig
 from core.repositories.premium_repository import PremiumRepository
 from core.services.base_service import BaseService
+from core.services.premium_cache import get_premium_cache
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +53,8 @@ class PremiumRoleService(BaseService, IPremiumRoleManager):
         self.config = bot.config
         self.mute_roles = {role["name"]: role for role in bot.config.get("mute_roles", [])}
         self.premium_roles_config = bot.config.get("premium_roles", [])
+        # Shared premium status cache, invalidated whenever roles change
+        self.premium_cache = get_premium_cache(bot)
 
         # Initialize dynamic mappings
         self.partial_extensions = {}
@@ -164,6 +167,7 @@ class PremiumRoleService(BaseService, IPremiumRoleManager):
 
             # Remove mute roles
             await self.remove_mute_roles(member)
+            await self.premium_cache.invalidate_member(member.id)
 
             self._log_operation(
                 "assign_premium_role",
@@ -211,6 +215,7 @@ class PremiumRoleService(BaseService, IPremiumRoleManager):
                 current_role.expires_at = new_expiry
                 current_role.duration_days += additional_days
                 await session.commit()
+                await self.premium_cache.invalidate_member(member.id)
 
                 self._log_operation(
                     "extend_premium_role",
@@ -254,6 +259,7 @@ class PremiumRoleService(BaseService, IPremiumRoleManager):
             async with self.bot.get_db() as session:
                 await self.premium_repository.remove_premium_role(member.id, role_name)
                 await session.commit()
+            await self.premium_cache.invalidate_member(member.id)
 
             self._log_operation(
                 "remove_premium_role",
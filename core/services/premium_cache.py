@@ -0,0 +1,88 @@
+"""Process-wide premium status cache shared by all request-scoped premium services."""
+
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from core.performance.tiered_cache import TieredCache
+from core.services.cache_service import CacheService
+
+logger = logging.getLogger(__name__)
+
+PREMIUM_NAMESPACE = "premium"
+PREMIUM_ROLES_TAG = "premium_roles"
+
+
+def member_tag(member_id: int) -> str:
+    """Invalidation tag for everything cached about one member."""
+    return f"member:{member_id}"
+
+
+class PremiumStatusCache:
+    """
+    Premium status cache owned by the bot.
+
+    Premium services are created per request by ``get_service``; they all read
+    and invalidate this one cache so results survive between requests. The
+    premium namespace is capped at ``max_size`` entries within ``backend``
+    (the process-wide tiered cache by default).
+    """
+
+    def __init__(self, max_size: int = 5000, default_ttl: int = 300, backend: Optional[TieredCache] = None):
+        self.cache = CacheService(default_ttl=default_ttl, backend=backend)
+        self.cache.backend.set_namespace_limit(PREMIUM_NAMESPACE, max_size)
+
+    async def get(self, key: str, member_id: int) -> Any:
+        """Cached value of ``key`` for a member, or None."""
+        return await self.cache.get(PREMIUM_NAMESPACE, key, member_id=member_id)
+
+    async def set(self, key: str, member_id: int, value: Any, ttl: Optional[int] = None) -> None:
+        """Cache ``key`` for a member, tagged for member and premium-wide invalidation."""
+        await self.cache.set(
+            PREMIUM_NAMESPACE,
+            key,
+            value,
+            ttl=ttl,
+            tags={member_tag(member_id), PREMIUM_ROLES_TAG},
+            member_id=member_id,
+        )
+
+    async def get_or_load(
+        self, key: str, member_id: int, loader: Callable[[], Awaitable[Any]], ttl: Optional[int] = None
+    ) -> Any:
+        """Cached value of ``key``, loading it once even when many callers miss together."""
+        return await self.cache.get_or_set(
+            PREMIUM_NAMESPACE,
+            key,
+            loader,
+            ttl=ttl,
+            tags={member_tag(member_id), PREMIUM_ROLES_TAG},
+            member_id=member_id,
+        )
+
+    async def invalidate_member(self, member_id: int) -> int:
+        """Drop everything cached for a member after their premium roles change."""
+        return await self.cache.invalidate_by_tags(member_tag(member_id))
+
+    async def invalidate_all(self) -> int:
+        """Drop all cached premium data, e.g. after bulk expiry processing."""
+        return await self.cache.invalidate_by_tags(PREMIUM_ROLES_TAG)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit rate and size of the premium namespace."""
+        return self.cache.backend.namespace_stats(PREMIUM_NAMESPACE)
+
+
+# Fallback instance for services constructed without a bot-owned cache
+_shared_cache: Optional[PremiumStatusCache] = None
+
+
+def get_premium_cache(bot: Any = None) -> PremiumStatusCache:
+    """The bot's premium cache, or a process-wide fallback when the bot has none."""
+    cache = getattr(bot, "premium_cache", None)
+    if isinstance(cache, PremiumStatusCache):
+        return cache
+
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = PremiumStatusCache()
+    return _shared_cache
@@ -18,7 +18,7 @@ from core.interfaces.premium_interfaces import (
 )
 from core.repositories.premium_repository import PaymentRepository, PremiumRepository
 from core.services.base_service import BaseService
-from core.services.cache_service import CacheService
+from core.services.premium_cache import get_premium_cache
 
 
 class PremiumService(BaseService, IPremiumService, IPremiumChecker, IPremiumRoleManager):
@@ -41,6 +41,9 @@ class PremiumService(BaseService, IPremiumService, IPremiumChecker, IPremiumRole
         CommandTier.TIER_3: ["autokick"],
     }
 
+    # Fields of get_member_premium_roles results kept in the shared cache (no ORM objects)
+    CACHED_ROLE_FIELDS = ("member_id", "role_id", "role_name", "expiration_date", "role_type")
+
     # Role IDs for bypass checking
     BOOSTER_ROLE_ID = 1052692705718829117
     INVITE_ROLE_ID = 960665311760248879
@@ -57,7 +60,8 @@ class PremiumService(BaseService, IPremiumService, IPremiumChecker, IPremiumRole
         self.payment_repository = payment_repository
         self.bot = bot
         self.guild: Optional[discord.Guild] = None
-        self.cache_service = CacheService(max_size=5000, default_ttl=300)  # 5 min cache
+        # Shared with every other request-scoped premium service
+        self.premium_cache = get_premium_cache(bot)
 
     async def validate_operation(self, *args, **kwargs) -> bool:
         """Validate premium operations."""
@@ -72,33 +76,20 @@ class PremiumService(BaseService, IPremiumService, IPremiumChecker, IPremiumRole
     async def has_premium_role(self, member: discord.Member) -> bool:
         """Check if member has any premium role (cached)."""
         try:
-            # Try cache first
-            cached_result = await self.cache_service.get("premium", "has_premium_role", member_id=member.id)
-            if cached_result is not None:
-                return cached_result
 
-            premium_roles = await self.premium_repository.get_member_premium_roles(member.id)
+            async def load() -> bool:
+                premium_roles = await self.premium_repository.get_member_premium_roles(member.id)
 
-            # Check if any premium role is still valid
-            current_time = datetime.now(timezone.utc)
-            has_premium = False
-            for role_data in premium_roles:
-                expiry = role_data["expiration_date"]
-                if expiry is None or expiry > current_time:
-                    has_premium = True
-                    break
+                # Check if any premium role is still valid
+                current_time = datetime.now(timezone.utc)
+                for role_data in premium_roles:
+                    expiry = role_data["expiration_date"]
+                    if expiry is None or expiry > current_time:
+                        return True
+                return False
 
             # Cache result for 5 minutes with member tag for invalidation
-            await self.cache_service.set(
-                "premium",
-                "has_premium_role",
-                has_premium,
-                ttl=300,
-                tags={f"member:{member.id}", "premium_roles"},
-                member_id=member.id,
-            )
-
-            return has_premium
+            return await self.premium_cache.get_or_load("has_premium_role", member.id, load, ttl=300)
         except Exception as e:
             self._log_error("has_premium_role", e, member_id=member.id)
             return False
@@ -131,26 +122,19 @@ class PremiumService(BaseService, IPremiumService, IPremiumChecker, IPremiumRole
             return None
 
     async def get_member_premium_roles(self, member_id: int) -> list[dict]:
-        """Get all premium roles for a member (cached)."""
+        """Get all premium roles for a member (cached).
+
+        Only plain fields are returned: the cache outlives the session that
+        loaded the rows and may be mirrored to Redis.
+        """
         try:
-            # Try cache first
-            cached_result = await self.cache_service.get("premium", "member_roles", member_id=member_id)
-            if cached_result is not None:
-                return cached_result
-
-            premium_roles = await self.premium_repository.get_member_premium_roles(member_id)
-
-            # Cache for 5 minutes
-            await self.cache_service.set(
-                "premium",
-                "member_roles",
-                premium_roles,
-                ttl=300,
-                tags={f"member:{member_id}", "premium_roles"},
-                member_id=member_id,
-            )
 
-            return premium_roles
+            async def load() -> list[dict]:
+                premium_roles = await self.premium_repository.get_member_premium_roles(member_id)
+                return [{field: role_data[field] for field in self.CACHED_ROLE_FIELDS} for role_data in premium_roles]
+
+            # Cache for 5 minutes; concurrent misses share one repository query
+            return await self.premium_cache.get_or_load("member_roles", member_id, load, ttl=300)
 
         except Exception as e:
             self._log_error("get_member_premium_roles", e, member_id=member_id)
@@ -257,7 +241,7 @@ class PremiumService(BaseService, IPremiumService, IPremiumChecker, IPremiumRole
             )
 
             # Invalidate cache for this member
-            await self.cache_service.invalidate_by_tags({f"member:{member.id}", "premium_roles"})
+            await self.premium_cache.invalidate_member(member.id)
 
             return ExtensionResult(
                 success=True,
@@ -323,6 +307,8 @@ class PremiumService(BaseService, IPremiumService, IPremiumChecker, IPremiumRole
                 payment_amount=payment_amount,
             )
 
+            await self.premium_cache.invalidate_member(member.id)
+
             return ExtensionResult(
                 success=True,
                 extension_type=ExtensionType.NORMAL,
@@ -416,6 +402,7 @@ class PremiumService(BaseService, IPremiumService, IPremiumChecker, IPremiumRole
             await self.premium_repository.remove_member_role(member_id=member.id, role_id=role_data["id"])
 
             self._log_operation("remove_premium_role", member_id=member.id, role_name=role_name)
+            await self.premium_cache.invalidate_member(member.id)
             return True
 
         except Exception as e:
@@ -0,0 +1,227 @@
+"""In-memory ranking index answering position, tier and leaderboard queries without the database."""
+
+import logging
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import func, select
+
+from core.services.activity_buffer import activity_day
+from datasources.models import Activity
+
+logger = logging.getLogger(__name__)
+
+# Upper bound (inclusive) of each ranking tier, checked in order
+RANKING_TIERS = ((100, "100"), (200, "200"), (300, "300"))
+UNRANKED = "Unranked"
+
+
+def tier_for_position(position: int) -> str:
+    """Map a 1-based ranking position to its tier name."""
+    if position > 0:
+        for max_position, tier in RANKING_TIERS:
+            if position <= max_position:
+                return tier
+    return UNRANKED
+
+
+class RankingWindow:
+    """Rolling N-day point totals kept in a sorted array for O(log n) lookups."""
+
+    __slots__ = ("days", "totals", "order")
+
+    def __init__(self, days: int):
+        self.days = days
+        self.totals: Dict[int, int] = {}
+        # Sorted by (-points, member_id) so index 0 is the leader
+        self.order: List[Tuple[int, int]] = []
+
+    def rebuild(self, totals: Dict[int, int]) -> None:
+        """Replace window contents with precomputed totals."""
+        self.totals = {member_id: points for member_id, points in totals.items() if points > 0}
+        self.order = sorted((-points, member_id) for member_id, points in self.totals.items())
+
+    def adjust(self, member_id: int, delta: int) -> None:
+        """Change a member's total by ``delta`` and reposition them."""
+        old = self.totals.get(member_id)
+        if old is not None:
+            del self.order[bisect_left(self.order, (-old, member_id))]
+
+        new = (old or 0) + delta
+        if new > 0:
+            self.totals[member_id] = new
+            insort(self.order, (-new, member_id))
+        else:
+            self.totals.pop(member_id, None)
+
+    def position(self, member_id: int) -> int:
+        """1-based position of a member, 0 if they have no points in the window."""
+        points = self.totals.get(member_id)
+        if points is None:
+            return 0
+        return bisect_left(self.order, (-points, member_id)) + 1
+
+    def top(self, limit: int) -> List[Tuple[int, int, int]]:
+        """Leaderboard slice as (member_id, points, position)."""
+        return [
+            (member_id, -negative_points, position)
+            for position, (negative_points, member_id) in enumerate(self.order[:limit], 1)
+        ]
+
+
+class ActivityRankingIndex:
+    """
+    Rolling per-member point totals for a fixed set of day windows.
+
+    Built once from the ``activity`` table and updated incrementally as points are
+    added, so ranking commands for an indexed window never query Postgres.
+    """
+
+    def __init__(self, windows: Iterable[int] = (7, 30)):
+        self.windows: Dict[int, RankingWindow] = {days: RankingWindow(days) for days in sorted(set(windows))}
+        self.max_days = max(self.windows) if self.windows else 0
+
+        # day -> member_id -> points, only for days still inside the widest window
+        self._by_day: Dict[datetime, Dict[int, int]] = {}
+        self._today: Optional[datetime] = None
+        self._ready = False
+
+        # Increments arriving while a load is in progress, replayed afterwards
+        self._loading = False
+        self._replay: List[Tuple[int, int, datetime]] = []
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether the index has been loaded from the database."""
+        return self._ready
+
+    def covers(self, days_back: int) -> bool:
+        """Whether queries for ``days_back`` can be answered from the index."""
+        return self._ready and days_back in self.windows
+
+    async def load(self, session_factory, buffer=None) -> None:
+        """(Re)build the index from the ``activity`` table.
+
+        Points held in the write-behind ``buffer`` are not in the table yet. The
+        buffer is flushed first and kept from flushing during the load; points
+        still pending once the rows are read are applied on top of them.
+        """
+        if not self.windows:
+            return
+        if buffer is None:
+            await self._load(session_factory)
+            return
+        async with buffer.flushed():
+            await self._load(session_factory, buffer)
+
+    async def _load(self, session_factory, buffer=None) -> None:
+        self._loading = True
+        self._replay = []
+        loaded = False
+        try:
+            today = activity_day()
+            cutoff = today - timedelta(days=self.max_days - 1)
+
+            async with session_factory() as session:
+                result = await session.execute(
+                    select(Activity.member_id, Activity.date, func.sum(Activity.points))
+                    .where(Activity.date >= cutoff)
+                    .group_by(Activity.member_id, Activity.date)
+                )
+                rows = result.all()
+
+            by_day: Dict[datetime, Dict[int, int]] = {}
+            for member_id, date, points in rows:
+                day_points = by_day.setdefault(activity_day(date), {})
+                day_points[member_id] = day_points.get(member_id, 0) + (points or 0)
+
+            self._by_day = by_day
+            self._today = today
+            for window in self.windows.values():
+                window_start = today - timedelta(days=window.days - 1)
+                totals: Dict[int, int] = {}
+                for day, day_points in by_day.items():
+                    if day >= window_start:
+                        for member_id, points in day_points.items():
+                            totals[member_id] = totals.get(member_id, 0) + points
+                window.rebuild(totals)
+
+            self._ready = True
+            loaded = True
+            logger.info(
+                f"Ranking index loaded: {len(rows)} rows, "
+                + ", ".join(f"{days}d={len(window.totals)}" for days, window in self.windows.items())
+            )
+        finally:
+            self._loading = False
+            replay, self._replay = self._replay, []
+            if loaded and buffer is not None:
+                # Everything missing from the rows just read, including increments made during the read
+                replay = [(member_id, points, day) for member_id, day, _, points in buffer.pending_increments()]
+            for member_id, points, day in replay:
+                self.add_points(member_id, points, day)
+
+    def add_points(self, member_id: int, points: int, date: Optional[datetime] = None) -> None:
+        """Apply a point increment to every window that contains ``date``."""
+        if not points or not self.windows:
+            return
+
+        day = activity_day(date) if date else activity_day()
+        if self._loading:
+            self._replay.append((member_id, points, day))
+            return
+        if not self._ready:
+            return
+
+        self._roll(activity_day())
+        age = (self._today - day).days
+        if age < 0 or age >= self.max_days:
+            return
+
+        day_points = self._by_day.setdefault(day, {})
+        day_points[member_id] = day_points.get(member_id, 0) + points
+        for window in self.windows.values():
+            if age < window.days:
+                window.adjust(member_id, points)
+
+    def _roll(self, today: datetime) -> None:
+        """Move all windows forward to ``today``, subtracting days that fell out."""
+        if self._today is None or today <= self._today:
+            return
+
+        for window in self.windows.values():
+            old_start = self._today - timedelta(days=window.days - 1)
+            new_start = today - timedelta(days=window.days - 1)
+            for day, day_points in self._by_day.items():
+                if old_start <= day < new_start:
+                    for member_id, points in day_points.items():
+                        window.adjust(member_id, -points)
+
+        oldest = today - timedelta(days=self.max_days - 1)
+        self._by_day = {day: day_points for day, day_points in self._by_day.items() if day >= oldest}
+        self._today = today
+
+    def _window(self, days_back: int) -> RankingWindow:
+        self._roll(activity_day())
+        return self.windows[days_back]
+
+    def get_total_points(self, member_id: int, days_back: int = 7) -> int:
+        """Member's total points in the window."""
+        return self._window(days_back).totals.get(member_id, 0)
+
+    def get_position(self, member_id: int, days_back: int = 7) -> int:
+        """Member's 1-based position in the window, 0 if unranked."""
+        return self._window(days_back).position(member_id)
+
+    def get_tier(self, member_id: int, days_back: int = 7) -> str:
+        """Member's ranking tier in the window."""
+        return tier_for_position(self.get_position(member_id, days_back))
+
+    def get_leaderboard(self, limit: int = 10, days_back: int = 7) -> List[Tuple[int, int, int]]:
+        """Top members as (member_id, points, position)."""
+        return self._window(days_back).top(limit)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Number of ranked members per window."""
+        return {f"{days}d": len(window.totals) for days, window in self.windows.items()}
@@ -6,7 +6,7 @@ maintaining backward compatibility for existing imports.
 """
 
 # Activity models
-from .activity_models import Activity
+from .activity_models import Activity, ActivitySummary
 
 # Base and constants
 from .base import MEMBER_ID, ROLE_ID, Base, utc_now
@@ -46,6 +46,7 @@ __all__ = [
     "MemberRole",
     # Activity models
     "Activity",
+    "ActivitySummary",
     # Role models
     "Role",
     # Channel models
@@ -10,7 +10,7 @@ from typing import TYPE_CHECKING
 from sqlalchemy import BigInteger, DateTime, ForeignKey, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .base import MEMBER_ID, Base
+from .base import MEMBER_ID, Base, utc_now
 
 if TYPE_CHECKING:
     from .member_models import Member
@@ -29,3 +29,18 @@ class Activity(Base):
 
     def __repr__(self) -> str:
         return f"<Activity(member_id={self.member_id}, date={self.date}, type={self.activity_type})>"
+
+
+class ActivitySummary(Base):
+    """Rolling per-member activity totals, maintained on buffer flush and rolled forward nightly"""
+
+    __tablename__ = "activity_summary"
+    member_id: Mapped[int] = mapped_column(BigInteger, ForeignKey(MEMBER_ID), primary_key=True)
+    activity_type: Mapped[str] = mapped_column(String, nullable=False, primary_key=True)
+    points_7d: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    points_30d: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    points_total: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=utc_now)
+
+    def __repr__(self) -> str:
+        return f"<ActivitySummary(member_id={self.member_id}, type={self.activity_type})>"
@@ -56,7 +56,10 @@ try:
         get_activity_leaderboard_with_names,
         get_member_activity_breakdown,
         get_ranking_tier,
+        rebuild_activity_summary,
         reset_daily_activity_points,
+        upsert_activity_points,
+        upsert_activity_summary,
     )
 except ImportError:
     # Fallback to original if adapter not available
@@ -70,7 +73,10 @@ except ImportError:
         get_member_total_points,
         get_ranking_tier,
         get_top_members_by_points,
+        rebuild_activity_summary,
         reset_daily_activity_points,
+        upsert_activity_points,
+        upsert_activity_summary,
     )
 
 __all__ = [
@@ -94,5 +100,8 @@ __all__ = [
     "get_member_total_points",
     "get_ranking_tier",
     "get_top_members_by_points",
+    "rebuild_activity_summary",
     "reset_daily_activity_points",
+    "upsert_activity_points",
+    "upsert_activity_summary",
 ]
@@ -8,20 +8,32 @@ import logging
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Tuple
 
-from sqlalchemy import delete, func, select, update
+from sqlalchemy import case, delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..models import Activity, Member
+from core.performance.member_cache import member_cache
+
+from ..models import Activity, ActivitySummary
 
 logger = logging.getLogger(__name__)
 
+# asyncpg accepts at most 32767 bind parameters per statement; summary rows use 6 each
+UPSERT_CHUNK_SIZE = 1000
+
+# Day windows pre-aggregated in activity_summary, mapped to their column
+SUMMARY_WINDOWS = {7: ActivitySummary.points_7d, 30: ActivitySummary.points_30d}
+
+
+def _day_start(days_back: int) -> datetime:
+    """First activity day (UTC midnight) that belongs to a ``days_back`` window."""
+    today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    return today - timedelta(days=days_back - 1)
+
 
 async def ensure_member_exists(session: AsyncSession, member_id: int) -> None:
     """Ensure member exists in the database."""
-    result = await session.execute(select(Member).where(Member.id == member_id))
-    if not result.scalar():
-        new_member = Member(id=member_id)
-        session.add(new_member)
+    await member_cache.ensure(session, (member_id,))
 
 
 async def add_activity_points(
@@ -45,6 +57,32 @@ async def add_activity_points(
         session.add(activity)
 
 
+async def upsert_activity_points(session: AsyncSession, increments: List[Tuple[int, datetime, str, int]]) -> None:
+    """Add many (member_id, date, activity_type, points) increments with multi-row upserts.
+
+    Missing members are inserted first, and the rolling summary is updated in the same
+    transaction. Rows are chunked to stay under the asyncpg bind parameter limit.
+    """
+    # Sorted keys give a stable lock order between concurrent writers
+    increments = sorted(increments)
+    await member_cache.ensure(session, (member_id for member_id, _, _, _ in increments))
+
+    for i in range(0, len(increments), UPSERT_CHUNK_SIZE):
+        chunk = increments[i : i + UPSERT_CHUNK_SIZE]
+        stmt = insert(Activity).values(
+            [
+                {"member_id": member_id, "date": date, "activity_type": activity_type, "points": points}
+                for member_id, date, activity_type, points in chunk
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Activity.member_id, Activity.date, Activity.activity_type],
+            set_={"points": Activity.points + stmt.excluded.points},
+        )
+        await session.execute(stmt)
+        await upsert_activity_summary(session, chunk)
+
+
 async def get_member_total_points(session: AsyncSession, member_id: int, days_back: int = 7) -> int:
     """Get total points for a member from last N days."""
     cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_back)
@@ -92,22 +130,38 @@ async def get_member_ranking_position(session: AsyncSession, member_id: int, day
 
 
 async def reset_daily_activity_points(session: AsyncSession, activity_type: str = None) -> None:
-    """Reset activity points for today. If activity_type is None, reset all types."""
+    """Reset activity points for today. If activity_type is None, reset all types.
+
+    The reset points are subtracted from the summary, all-time totals included, in the same transaction.
+    """
     today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
 
+    conditions = [Activity.date == today, Activity.points != 0]
     if activity_type:
-        await session.execute(
-            update(Activity)
-            .where(Activity.date == today)
-            .where(Activity.activity_type == activity_type)
-            .values(points=0)
-        )
-    else:
-        await session.execute(update(Activity).where(Activity.date == today).values(points=0))
+        conditions.append(Activity.activity_type == activity_type)
+
+    result = await session.execute(
+        select(Activity.member_id, Activity.date, Activity.activity_type, Activity.points)
+        .where(*conditions)
+        .with_for_update()
+    )
+    removed = [(member_id, date, row_type, -points) for member_id, date, row_type, points in result.all()]
+
+    await session.execute(update(Activity).where(*conditions).values(points=0))
+    await upsert_activity_summary(session, removed)
 
 
 async def get_member_activity_breakdown(session: AsyncSession, member_id: int, days_back: int = 7) -> Dict[str, int]:
     """Get breakdown of points by activity type for a member."""
+    if days_back in SUMMARY_WINDOWS:
+        column = SUMMARY_WINDOWS[days_back]
+        result = await session.execute(
+            select(ActivitySummary.activity_type, column)
+            .where(ActivitySummary.member_id == member_id)
+            .where(column != 0)
+        )
+        return {activity_type: total_points for activity_type, total_points in result.all()}
+
     cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_back)
 
     result = await session.execute(
@@ -132,6 +186,21 @@ async def get_activity_leaderboard_with_names(
     session: AsyncSession, limit: int = 100, days_back: int = 7
 ) -> List[Tuple[int, int, int]]:
     """Get leaderboard with member_id, points, and position."""
+    if days_back in SUMMARY_WINDOWS:
+        total_points = func.sum(SUMMARY_WINDOWS[days_back])
+        result = await session.execute(
+            select(
+                ActivitySummary.member_id,
+                total_points.label("total_points"),
+                func.row_number().over(order_by=total_points.desc()).label("position"),
+            )
+            .group_by(ActivitySummary.member_id)
+            .having(total_points > 0)
+            .order_by(total_points.desc())
+            .limit(limit)
+        )
+        return result.all()
+
     cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_back)
 
     result = await session.execute(
@@ -162,3 +231,86 @@ async def get_ranking_tier(session: AsyncSession, member_id: int, days_back: int
         return "300"
     else:
         return "Unranked"
+
+
+async def upsert_activity_summary(session: AsyncSession, increments: List[Tuple[int, datetime, str, int]]) -> None:
+    """Add (member_id, date, activity_type, points) increments to the rolling summary."""
+    windows_start = {days: _day_start(days) for days in SUMMARY_WINDOWS}
+    totals: Dict[Tuple[int, str], Dict[str, int]] = {}
+
+    for member_id, date, activity_type, points in increments:
+        row = totals.setdefault((member_id, activity_type), {"points_7d": 0, "points_30d": 0, "points_total": 0})
+        row["points_total"] += points
+        if date >= windows_start[7]:
+            row["points_7d"] += points
+        if date >= windows_start[30]:
+            row["points_30d"] += points
+
+    if not totals:
+        return
+
+    now = datetime.now(timezone.utc)
+    rows = [
+        {"member_id": member_id, "activity_type": activity_type, "updated_at": now, **points}
+        for (member_id, activity_type), points in sorted(totals.items())
+    ]
+    stmt = insert(ActivitySummary).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ActivitySummary.member_id, ActivitySummary.activity_type],
+        set_={
+            "points_7d": ActivitySummary.points_7d + stmt.excluded.points_7d,
+            "points_30d": ActivitySummary.points_30d + stmt.excluded.points_30d,
+            "points_total": ActivitySummary.points_total + stmt.excluded.points_total,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+    await session.execute(stmt)
+
+
+async def rebuild_activity_summary(session: AsyncSession) -> int:
+    """Recompute the 7 and 30 day summary windows from the activity table.
+
+    All-time totals are maintained by the writers and only backfilled from the full
+    activity history when the summary is empty; otherwise a total is raised to the
+    member's 30 day points if it fell below them. Returns number of rows written.
+    """
+    backfill = (await session.execute(select(func.count()).select_from(ActivitySummary))).scalar() == 0
+    start_7d = _day_start(7)
+    start_30d = _day_start(30)
+
+    query = select(
+        Activity.member_id,
+        Activity.activity_type,
+        func.sum(case((Activity.date >= start_7d, Activity.points), else_=0)).label("points_7d"),
+        func.sum(case((Activity.date >= start_30d, Activity.points), else_=0)).label("points_30d"),
+        func.sum(Activity.points).label("points_total"),
+        func.now().label("updated_at"),
+    ).group_by(Activity.member_id, Activity.activity_type)
+    if not backfill:
+        query = query.where(Activity.date >= start_30d)
+
+    await session.execute(
+        update(ActivitySummary)
+        .where((ActivitySummary.points_7d != 0) | (ActivitySummary.points_30d != 0))
+        .values(points_7d=0, points_30d=0)
+    )
+
+    stmt = insert(ActivitySummary).from_select(
+        ["member_id", "activity_type", "points_7d", "points_30d", "points_total", "updated_at"], query
+    )
+    update_columns = {
+        "points_7d": stmt.excluded.points_7d,
+        "points_30d": stmt.excluded.points_30d,
+        "updated_at": stmt.excluded.updated_at,
+    }
+    if backfill:
+        update_columns["points_total"] = stmt.excluded.points_total
+    else:
+        # Only the last 30 days were summed, so a total can be corrected upwards but never recomputed
+        update_columns["points_total"] = func.greatest(ActivitySummary.points_total, stmt.excluded.points_30d)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ActivitySummary.member_id, ActivitySummary.activity_type],
+        set_=update_columns,
+    )
+    result = await session.execute(stmt)
+    return result.rowcount
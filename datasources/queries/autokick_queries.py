@@ -6,30 +6,26 @@ import logging
 from datetime import datetime, timezone
 from typing import List
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..models import AutoKick, Member
+from core.performance.autokick_index import autokick_index
+from core.performance.member_cache import member_cache
+from core.performance.query_monitor import track_queries
+
+from ..models import AutoKick
 
 logger = logging.getLogger(__name__)
 
 
+@track_queries
 class AutoKickQueries:
     """Class for AutoKick Queries"""
 
     @staticmethod
     async def ensure_members_exist(session: AsyncSession, owner_id: int, target_id: int) -> None:
         """Ensure both owner and target exist in members table"""
-        # Check if owner exists
-        owner_exists = await session.scalar(select(Member.id).where(Member.id == owner_id))
-        if not owner_exists:
-            await session.merge(Member(id=owner_id))
-
-        # Check if target exists
-        target_exists = await session.scalar(select(Member.id).where(Member.id == target_id))
-        if not target_exists:
-            await session.merge(Member(id=target_id))
-
+        await member_cache.ensure(session, (owner_id, target_id))
         await session.commit()
 
     @staticmethod
@@ -46,6 +42,7 @@ class AutoKickQueries:
         )
         session.add(autokick)
         await session.commit()
+        autokick_index.add(owner_id, target_id)
 
     @staticmethod
     async def remove_autokick(session: AsyncSession, owner_id: int, target_id: int) -> None:
@@ -54,6 +51,7 @@ class AutoKickQueries:
             delete(AutoKick).where((AutoKick.owner_id == owner_id) & (AutoKick.target_id == target_id))
         )
         await session.commit()
+        autokick_index.remove(owner_id, target_id)
 
     @staticmethod
     async def get_all_autokicks(session: AsyncSession) -> List[AutoKick]:
@@ -64,11 +62,11 @@ class AutoKickQueries:
     @staticmethod
     async def get_owner_autokicks(session: AsyncSession, owner_id: int) -> List[AutoKick]:
         """Get all autokicks for a specific owner"""
-        result = await session.execute(select(AutoKick).where(AutoKick.owner_id == owner_id))
+        result = await session.execute(lambda_stmt(lambda: select(AutoKick).where(AutoKick.owner_id == owner_id)))
         return result.scalars().all()
 
     @staticmethod
     async def get_target_autokicks(session: AsyncSession, target_id: int) -> List[AutoKick]:
         """Get all autokicks targeting a specific member"""
-        result = await session.execute(select(AutoKick).where(AutoKick.target_id == target_id))
+        result = await session.execute(lambda_stmt(lambda: select(AutoKick).where(AutoKick.target_id == target_id)))
         return result.scalars().all()
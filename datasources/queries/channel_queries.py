@@ -6,15 +6,18 @@ import logging
 from datetime import datetime, timezone
 from typing import List, Optional
 
-from sqlalchemy import func, select
+from sqlalchemy import func, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.expression import case
 
+from core.performance.query_monitor import track_queries
+
 from ..models import ChannelPermission
 
 logger = logging.getLogger(__name__)
 
 
+@track_queries
 class ChannelPermissionQueries:
     """Class for Channel Permission Queries"""
 
@@ -91,7 +94,9 @@ class ChannelPermissionQueries:
     @staticmethod
     async def get_permissions_for_target(session: AsyncSession, target_id: int) -> List[ChannelPermission]:
         """Get all channel permissions for a specific target (member or role)."""
-        result = await session.execute(select(ChannelPermission).where(ChannelPermission.target_id == target_id))
+        result = await session.execute(
+            lambda_stmt(lambda: select(ChannelPermission).where(ChannelPermission.target_id == target_id))
+        )
         return result.scalars().all()
 
     @staticmethod
@@ -100,23 +105,25 @@ class ChannelPermissionQueries:
     ) -> List[ChannelPermission]:
         """Get channel permissions for a specific member, limited to the most recent ones."""
         result = await session.execute(
-            select(ChannelPermission)
-            .where(ChannelPermission.member_id == member_id)
-            .order_by(
-                case(
-                    (
-                        ChannelPermission.allow_permissions_value.bitwise_and(0x00002000) != 0,
-                        0,
-                    ),  # manage_messages
-                    (
-                        ChannelPermission.target_id == member_id,
-                        0,
-                    ),  # everyone permissions
-                    else_=1,
-                ),
-                ChannelPermission.last_updated_at.desc(),
+            lambda_stmt(
+                lambda: select(ChannelPermission)
+                .where(ChannelPermission.member_id == member_id)
+                .order_by(
+                    case(
+                        (
+                            ChannelPermission.allow_permissions_value.bitwise_and(0x00002000) != 0,
+                            0,
+                        ),  # manage_messages
+                        (
+                            ChannelPermission.target_id == member_id,
+                            0,
+                        ),  # everyone permissions
+                        else_=1,
+                    ),
+                    ChannelPermission.last_updated_at.desc(),
+                )
+                .limit(limit)
             )
-            .limit(limit)
         )
         return result.scalars().all()
 
@@ -10,11 +10,14 @@ from sqlalchemy import and_, asc, case, desc, func, or_, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.performance.query_monitor import track_queries
+
 from ..models import Invite, Member
 
 logger = logging.getLogger(__name__)
 
 
+@track_queries
 class InviteQueries:
     """Class for Invite Queries"""
 
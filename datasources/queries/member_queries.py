@@ -6,14 +6,18 @@ import logging
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.performance.member_cache import member_cache
+from core.performance.query_monitor import track_queries
+
 from ..models import Member
 
 logger = logging.getLogger(__name__)
 
 
+@track_queries
 class MemberQueries:
     """Class for Member Queries"""
 
@@ -28,25 +32,26 @@ class MemberQueries:
         rejoined_at: Optional[datetime] = None,
     ) -> Member:
         """Get a Member by ID, or add a new one if it doesn't exist"""
-        member = await session.get(Member, member_id)
+        member = await session.get(Member, member_id) if member_id in member_cache else None
         if member is None:
-            member = Member(
-                id=member_id,
-                wallet_balance=wallet_balance,
-                first_inviter_id=first_inviter_id,
-                current_inviter_id=current_inviter_id,
-                joined_at=joined_at,
-                rejoined_at=rejoined_at,
+            # Unknown IDs: insert without a prior SELECT; an existing row is loaded instead
+            member = await session.scalar(
+                insert(Member)
+                .values(
+                    id=member_id,
+                    wallet_balance=wallet_balance,
+                    first_inviter_id=first_inviter_id,
+                    current_inviter_id=current_inviter_id,
+                    joined_at=joined_at,
+                    rejoined_at=rejoined_at,
+                )
+                .on_conflict_do_nothing()
+                .returning(Member),
+                execution_options={"populate_existing": True},
             )
-            session.add(member)
-            try:
-                await session.flush()
-            except IntegrityError:
-                await session.rollback()
+            if member is None:
                 member = await session.get(Member, member_id)
-                if member is None:
-                    logger.error(f"Failed to add or retrieve member with ID {member_id}")
-                    raise
+            member_cache.mark_known(session, (member_id,))
 
         # Update fields for existing members
         if current_inviter_id is not None:
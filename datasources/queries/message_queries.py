@@ -8,11 +8,14 @@ from typing import Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.performance.query_monitor import track_queries
+
 from ..models import Message
 
 logger = logging.getLogger(__name__)
 
 
+@track_queries
 class MessageQueries:
     """Class for Message Queries"""
 
@@ -10,11 +10,14 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
+from core.performance.query_monitor import track_queries
+
 from ..models import ModerationLog
 
 logger = logging.getLogger(__name__)
 
 
+@track_queries
 class ModerationLogQueries:
     """Class for Moderation Log Queries"""
 
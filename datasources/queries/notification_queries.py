@@ -8,11 +8,14 @@ from typing import List, Optional, Tuple
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.performance.query_monitor import track_queries
+
 from ..models import NotificationLog
 
 logger = logging.getLogger(__name__)
 
 
+@track_queries
 class NotificationLogQueries:
     """Class for Notification Log Queries"""
 
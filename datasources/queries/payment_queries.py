@@ -9,11 +9,14 @@ from typing import List, Optional
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.performance.query_monitor import track_queries
+
 from ..models import HandledPayment
 
 logger = logging.getLogger(__name__)
 
 
+@track_queries
 class HandledPaymentQueries:
     """Class for Handled Payment Queries"""
 
@@ -6,17 +6,20 @@ import logging
 from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 
-from sqlalchemy import and_, delete, select, text
+from sqlalchemy import and_, delete, lambda_stmt, select, text
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 from sqlalchemy.sql.functions import func
 
+from core.performance.query_monitor import track_queries
+
 from ..models import MemberRole, Role
 
 logger = logging.getLogger(__name__)
 
 
+@track_queries
 class RoleQueries:
     """Class for Role Queries"""
 
@@ -104,27 +107,17 @@ class RoleQueries:
     async def get_member_premium_roles(session: AsyncSession, member_id: int) -> list[tuple[MemberRole, Role]]:
         """Pobiera wszystkie role premium użytkownika, aktywne i wygasłe."""
         try:
-            # Poprawna logika zapytania: pobiera wszystkie role premium użytkownika (aktywne i wygasłe).
-            query = (
-                select(MemberRole, Role)
-                .join(Role, MemberRole.role_id == Role.id)
-                .where((MemberRole.member_id == member_id) & (Role.role_type == "premium"))
-            )
-            logger.info(f"Executing query for member_id {member_id} in get_member_premium_roles: {query}")
-            result = await session.execute(query)
-
-            # Logowanie .first() dla wglądu w pierwszy potencjalny wiersz
-            # Musimy być ostrożni, .first() może skonsumować wynik, więc lepiej wykonać to na nowym zapytaniu lub na kopii
-            # Dla uproszczenia, po prostu zalogujemy i zobaczymy, czy .all() nadal działa.
-            # W idealnym świecie, jeśli .first() konsumuje, należałoby ponownie wykonać zapytanie dla .all().
-            temp_result_for_first = await session.execute(query)  # Wykonaj zapytanie ponownie dla .first()
-            first_row = temp_result_for_first.first()
-            logger.info(f"Query result.first() for member_id {member_id}: {first_row}")
-
-            fetched_roles = result.all()  # Użyj oryginalnego wyniku dla .all()
-            logger.info(
-                f"Fetched roles via result.all() for member_id {member_id} (count: {len(fetched_roles)}): {fetched_roles}"
+            # Pobiera wszystkie role premium użytkownika (aktywne i wygasłe).
+            # Gorąca ścieżka: lambda_stmt nie buduje zapytania ani klucza cache od nowa przy każdym wywołaniu.
+            result = await session.execute(
+                lambda_stmt(
+                    lambda: select(MemberRole, Role)
+                    .join(Role, MemberRole.role_id == Role.id)
+                    .where((MemberRole.member_id == member_id) & (Role.role_type == "premium"))
+                )
             )
+            fetched_roles = result.all()
+            logger.debug(f"Fetched {len(fetched_roles)} premium roles for member_id {member_id}")
             return fetched_roles
         except Exception as e:
             logger.error(
@@ -267,7 +260,9 @@ class RoleQueries:
     async def get_member_role(session: AsyncSession, member_id: int, role_id: int) -> Optional[MemberRole]:
         """Get a specific member role"""
         result = await session.execute(
-            select(MemberRole).where(and_(MemberRole.member_id == member_id, MemberRole.role_id == role_id))
+            lambda_stmt(
+                lambda: select(MemberRole).where(and_(MemberRole.member_id == member_id, MemberRole.role_id == role_id))
+            )
         )
         return result.scalars().first()
 
@@ -0,0 +1,18 @@
+"""Session classes for read-only database access."""
+
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import Session
+
+
+class ReadOnlySession(Session):
+    """
+    Sync session behind ``Zagadka.get_read_db``.
+
+    Read sessions run on an AUTOCOMMIT connection, so a flush would be
+    committed statement by statement; pending changes are rejected instead.
+    """
+
+    def flush(self, objects=None) -> None:
+        if self.new or self.dirty or self.deleted:
+            raise InvalidRequestError("Cannot write in a read-only session; use get_db() instead")
+        super().flush(objects)
@@ -12,47 +12,46 @@ from typing import Any, AsyncGenerator, Optional
 
 import discord
 import yaml
-from discord.ext import commands
+from discord import app_commands
+from discord.ext import commands, tasks
 from dotenv import load_dotenv
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from core.containers.request_scope import RequestScope
 from core.containers.service_container import ServiceContainer
-from core.interfaces.activity_interfaces import IActivityTrackingService
 from core.interfaces.currency_interfaces import ICurrencyService
-from core.interfaces.member_interfaces import IActivityService, IInviteService, IMemberService, IModerationService
-from core.interfaces.messaging_interfaces import IEmbedBuilder, IMessageFormatter, IMessageSender, INotificationService
+from core.interfaces.messaging_interfaces import IEmbedBuilder, IMessageFormatter
 from core.interfaces.permission_interfaces import IPermissionService
-from core.interfaces.premium_interfaces import IPaymentProcessor, IPremiumService
-from core.interfaces.role_interfaces import IRoleService
-from core.interfaces.team_interfaces import ITeamManagementService
-from core.interfaces.voice_interfaces import IVoiceChannelService, IAutoKickService
-from core.repositories.activity_repository import ActivityRepository
-from core.repositories.invite_repository import InviteRepository
-from core.repositories.member_repository import MemberRepository
-from core.repositories.moderation_repository import ModerationRepository
-from core.repositories.premium_repository import PaymentRepository, PremiumRepository
-from core.repositories.role_repository import RoleRepository
-from core.repositories.channel_repository import ChannelRepository
-from core.services.activity_tracking_service import ActivityTrackingService
+from core.performance.autokick_index import autokick_index
+from core.performance.member_cache import member_cache
+from core.performance.n_plus_one import n_plus_one_detector
+from core.performance.pool_monitor import (
+    PoolMonitor,
+    engine_pool_kwargs,
+    load_pool_settings,
+    load_replica_pool_settings,
+)
+from core.performance.query_monitor import query_monitor
+from core.performance.tiered_cache import configure_tiered_cache
+from core.services.activity_buffer import ActivityPointsBuffer
 from core.services.currency_service import CurrencyService
 from core.services.embed_builder_service import EmbedBuilderService
-from core.services.member_service import InviteService, MemberService, ModerationService
 from core.services.message_formatter_service import MessageFormatterService
-from core.services.message_sender_service import MessageSenderService
-from core.services.notification_service import NotificationService
-from core.services.payment_processor_service import PaymentProcessorService
 from core.services.permission_service import PermissionService
-from core.services.premium_service import PremiumService
-from core.services.role_service import RoleService
-from core.services.team_management_service import TeamManagementService
-from core.services.voice_channel_service import VoiceChannelService
-from core.services.autokick_service import AutoKickService
+from core.services.premium_cache import PremiumStatusCache
+from core.services.ranking_index import ActivityRankingIndex
 from datasources.models import Base
+from datasources.sessions import ReadOnlySession
 from utils.health_check import HealthCheckServer
 from utils.premium import PaymentData
+from utils.role_ids import RoleIdIndex
+from utils.voice.event_pipeline import VoiceEventPipeline
 
 intents = discord.Intents.all()
 
+# Singletons registered in the service container at startup
+SESSIONLESS_SERVICES = frozenset({IEmbedBuilder, IMessageFormatter, ICurrencyService, IPermissionService})
+
 
 def load_config() -> dict[str, Any]:
     with open("config.yml", encoding="utf-8") as f:
@@ -88,6 +87,16 @@ def cleanup_zombie_processes() -> None:
         logging.error(f"Unexpected error during zombie process cleanup: {e}")
 
 
+class ScopedCommandTree(app_commands.CommandTree):
+    """Command tree running each application command in an N+1 detection scope."""
+
+    async def _call(self, interaction: discord.Interaction) -> None:
+        if not n_plus_one_detector.enabled:
+            return await super()._call(interaction)
+        with n_plus_one_detector.scope(f"app_command:{(interaction.data or {}).get('name', 'unknown')}"):
+            await super()._call(interaction)
+
+
 class Zagadka(commands.Bot):
     """Bot class."""
 
@@ -107,21 +116,66 @@ class Zagadka(commands.Bot):
 
         self.guild: Optional[discord.Guild] = None
         self.invites: dict[str, discord.Invite] = {}
+        # Config role names resolved to IDs once the guild is available
+        self.role_ids = RoleIdIndex(config)
 
         database_url = self.get_database_url()
 
-        self.engine = create_async_engine(
-            database_url,
-            pool_size=20,
-            max_overflow=40,
-            pool_timeout=30,
-            pool_recycle=1800,
-            pool_pre_ping=True,
-        )
+        # Pool sizing comes from the database config section / DB_* env vars
+        self.pool_settings = load_pool_settings(config)
+        self.engine = create_async_engine(database_url, **engine_pool_kwargs(self.pool_settings))
+        self.pool_monitor = PoolMonitor("primary", warn_threshold_ms=self.pool_settings["checkout_warn_ms"])
+        self.pool_monitor.install(self.engine)
+        # Per-statement timing for every query on this engine (and option engines derived from it)
+        query_monitor.install(self.engine)
+        # Repeated statements per command/event/task (reported only in DEV_MODE or with database.detect_n_plus_one)
+        n_plus_one_detector.configure(config)
+        n_plus_one_detector.install(self.engine)
         self.SessionLocal = async_sessionmaker(self.engine, class_=AsyncSession, expire_on_commit=False)
+        # Known member IDs (loaded in on_ready), so writes skip the "does the member exist" SELECT
+        member_cache.install()
+
+        # Reads run in AUTOCOMMIT (no BEGIN/COMMIT round-trips), on a replica when one is configured
+        read_database_url = self.get_read_database_url()
+        self.read_pool_monitor: Optional[PoolMonitor] = None
+        if read_database_url:
+            self.read_engine = create_async_engine(
+                read_database_url,
+                isolation_level="AUTOCOMMIT",
+                **engine_pool_kwargs(load_replica_pool_settings(config, self.pool_settings)),
+            )
+            self.read_pool_monitor = PoolMonitor("replica", warn_threshold_ms=self.pool_settings["checkout_warn_ms"])
+            self.read_pool_monitor.install(self.read_engine)
+            query_monitor.install(self.read_engine)
+            n_plus_one_detector.install(self.read_engine)
+        else:
+            self.read_engine = self.engine.execution_options(isolation_level="AUTOCOMMIT")
+        self.ReadSessionLocal = async_sessionmaker(
+            self.read_engine,
+            class_=AsyncSession,
+            sync_session_class=ReadOnlySession,
+            expire_on_commit=False,
+            autoflush=False,
+        )
         self.base = Base
         self.payment_data_class = PaymentData
 
+        # Write-behind buffer for activity points (flushed periodically and on close)
+        activity_config = config.get("activity_tracking", {})
+        self.activity_buffer = ActivityPointsBuffer(
+            self.SessionLocal,
+            flush_interval=activity_config.get("buffer_flush_interval", 15),
+            max_pending=activity_config.get("buffer_max_pending", 5000),
+        )
+        # One memory-bounded cache behind every cache API, optionally backed by Redis
+        self.cache = configure_tiered_cache(config.get("cache", {}), redis_url=os.getenv("REDIS_URL"))
+        # Premium status cache shared by all request-scoped premium services
+        self.premium_cache = PremiumStatusCache(max_size=5000, default_ttl=300, backend=self.cache)
+        # Rolling ranking totals, loaded in on_ready and updated as points are added
+        self.ranking_index = ActivityRankingIndex(windows=activity_config.get("ranking_windows", [7, 30]))
+        # Voice state events, coalesced and ordered per member, for the voice and activity cogs
+        self.voice_events = VoiceEventPipeline.from_config(config)
+
         # Initialize service container
         self.service_container = ServiceContainer()
         self._setup_services()
@@ -141,6 +195,7 @@ class Zagadka(commands.Bot):
             intents=intents,
             status=discord.Status.do_not_disturb,
             allowed_mentions=discord.AllowedMentions.all(),
+            tree_cls=ScopedCommandTree,
             **kwargs,
         )
 
@@ -153,6 +208,29 @@ class Zagadka(commands.Bot):
 
         return f"postgresql+asyncpg://{postgres_user}:{postgres_password}@{postgres_host}:{postgres_port}/{postgres_db}"
 
+    def get_read_database_url(self) -> Optional[str]:
+        """URL of the read replica, if POSTGRES_REPLICA_HOST is set."""
+        replica_host = os.environ.get("POSTGRES_REPLICA_HOST")
+        if not replica_host:
+            return None
+
+        postgres_user: str = os.environ.get("POSTGRES_USER", "")
+        postgres_password: str = os.environ.get("POSTGRES_PASSWORD", "")
+        postgres_db: str = os.environ.get("POSTGRES_DB", "")
+        replica_port: str = os.environ.get("POSTGRES_REPLICA_PORT", os.environ.get("POSTGRES_PORT", "5432"))
+
+        return f"postgresql+asyncpg://{postgres_user}:{postgres_password}@{replica_host}:{replica_port}/{postgres_db}"
+
+    @asynccontextmanager
+    async def get_read_db(self) -> AsyncGenerator[AsyncSession, None]:
+        """Session for pure reads: autocommit, no commit on exit, writes rejected."""
+        async with self.ReadSessionLocal() as session:
+            try:
+                yield session
+            except Exception as e:
+                logging.error(f"Read-only database session error: {e}")
+                raise
+
     @asynccontextmanager
     async def get_db(self) -> AsyncGenerator[AsyncSession, None]:
         async with self.SessionLocal() as session:
@@ -164,6 +242,12 @@ class Zagadka(commands.Bot):
                 logging.error(f"Database session error: {e}")
                 raise
 
+    @asynccontextmanager
+    async def get_scope(self) -> AsyncGenerator[RequestScope, None]:
+        """Database session wrapped in a request scope (``scope.premium``, ``scope.members``, ...)."""
+        async with self.get_db() as session:
+            yield RequestScope.for_session(self, session)
+
     @asynccontextmanager
     async def get_unit_of_work(self):
         """Get Unit of Work for comprehensive transaction management with service access."""
@@ -191,178 +275,22 @@ class Zagadka(commands.Bot):
         self.service_container.register_singleton(ICurrencyService, currency_service)
         self.service_container.register_singleton(IPermissionService, permission_service)
 
-        # Note: Repository and service factories are handled in get_service method
-        # since they require session and complex dependency injection
+        # Note: Session-bound repositories and services are built per session by
+        # RequestScope (core/containers/request_scope.py)
 
     async def get_service(self, service_type: type, session: Optional[AsyncSession] = None) -> Any:
         """Get a service instance with optional database session."""
 
         # Services that don't need database session
-        if service_type in [IEmbedBuilder, IMessageFormatter, ICurrencyService, IPermissionService]:
+        if service_type in SESSIONLESS_SERVICES:
             return self.service_container.get_service(service_type)
 
         # Services that need database session
         if session is None:
             raise ValueError(f"Service {service_type.__name__} requires a database session")
 
-        if service_type == IRoleService:
-            # Create repository with session
-            role_repository = RoleRepository(session)
-            # Create unit of work
-            unit_of_work = self.service_container.create_unit_of_work(session)
-            # Create service with dependencies
-            return RoleService(role_repository=role_repository, unit_of_work=unit_of_work)
-
-        elif service_type == IMessageSender:
-            # Create unit of work (needed for BaseService)
-            unit_of_work = self.service_container.create_unit_of_work(session)
-            return MessageSenderService(unit_of_work=unit_of_work)
-
-        elif service_type == INotificationService:
-            # Get dependencies
-            embed_builder = self.service_container.get_service(IEmbedBuilder)
-            unit_of_work = self.service_container.create_unit_of_work(session)
-            message_sender = MessageSenderService(unit_of_work=unit_of_work)
-
-            return NotificationService(
-                embed_builder=embed_builder,
-                message_sender=message_sender,
-                unit_of_work=unit_of_work,
-            )
-
-        elif service_type == IPremiumService:
-            # Create repositories
-            premium_repository = PremiumRepository(session)
-            payment_repository = PaymentRepository(session)
-            unit_of_work = self.service_container.create_unit_of_work(session)
-
-            # Create premium service
-            premium_service = PremiumService(
-                premium_repository=premium_repository,
-                payment_repository=payment_repository,
-                bot=self,
-                unit_of_work=unit_of_work,
-            )
-
-            # Set guild if available
-            if self.guild:
-                premium_service.set_guild(self.guild)
-
-            return premium_service
-
-        elif service_type == IPaymentProcessor:
-            # Create dependencies
-            payment_repository = PaymentRepository(session)
-            unit_of_work = self.service_container.create_unit_of_work(session)
-
-            # Create payment processor
-            payment_processor = PaymentProcessorService(
-                payment_repository=payment_repository,
-                unit_of_work=unit_of_work,
-            )
-
-            # Set premium service to avoid circular dependency
-            premium_service = await self.get_service(IPremiumService, session)
-            payment_processor.set_premium_service(premium_service)
-
-            return payment_processor
-
-        elif service_type == IMemberService:
-            # Create repositories
-            member_repository = MemberRepository(session)
-            activity_repository = ActivityRepository(session)
-            invite_repository = InviteRepository(session)
-            unit_of_work = self.service_container.create_unit_of_work(session)
-
-            return MemberService(
-                member_repository=member_repository,
-                invite_repository=invite_repository,
-                unit_of_work=unit_of_work,
-            )
-
-        elif service_type == IActivityService:
-            # Create repositories
-            activity_repository = ActivityRepository(session)
-            member_repository = MemberRepository(session)
-            unit_of_work = self.service_container.create_unit_of_work(session)
-
-            return ActivityTrackingService(
-                activity_repository=activity_repository,
-                member_repository=member_repository,
-                unit_of_work=unit_of_work,
-            )
-
-        elif service_type == IModerationService:
-            # Create repositories
-            moderation_repository = ModerationRepository(session)
-            member_repository = MemberRepository(session)
-            unit_of_work = self.service_container.create_unit_of_work(session)
-
-            return ModerationService(
-                moderation_repository=moderation_repository,
-                member_repository=member_repository,
-                unit_of_work=unit_of_work,
-            )
-
-        elif service_type == IInviteService:
-            # Create repositories
-            invite_repository = InviteRepository(session)
-            member_repository = MemberRepository(session)
-            unit_of_work = self.service_container.create_unit_of_work(session)
-
-            return InviteService(
-                invite_repository=invite_repository,
-                member_repository=member_repository,
-                unit_of_work=unit_of_work,
-            )
-
-        elif service_type == IActivityTrackingService:
-            # Create unit of work
-            unit_of_work = self.service_container.create_unit_of_work(session)
-            # Create repositories
-            activity_repository = ActivityRepository(session)
-            member_repository = MemberRepository(session)
-            # Create activity tracking service
-            activity_service = ActivityTrackingService(
-                activity_repository=activity_repository,
-                member_repository=member_repository,
-                guild=self.guild if hasattr(self, "guild") else None,
-                unit_of_work=unit_of_work,
-            )
-            return activity_service
-
-        elif service_type == ITeamManagementService:
-            # Create unit of work
-            unit_of_work = self.service_container.create_unit_of_work(session)
-            # Create team management service
-            team_service = TeamManagementService(bot=self, unit_of_work=unit_of_work)
-            return team_service
-
-        elif service_type == IVoiceChannelService:
-            # Create repository with session
-            channel_repository = ChannelRepository(session)
-            # Create unit of work
-            unit_of_work = self.service_container.create_unit_of_work(session)
-            # Create service with dependencies
-            return VoiceChannelService(
-                channel_repository=channel_repository,
-                bot=self,
-                unit_of_work=unit_of_work
-            )
-
-        elif service_type == IAutoKickService:
-            # Create repository with session
-            channel_repository = ChannelRepository(session)
-            # Create unit of work
-            unit_of_work = self.service_container.create_unit_of_work(session)
-            # Create service with dependencies
-            return AutoKickService(
-                channel_repository=channel_repository,
-                unit_of_work=unit_of_work
-            )
-
-        # For other services, use the container
-        return self.service_container.get_service(service_type)
+        # Repositories and services are built once per session
+        return RequestScope.for_session(self, session).get(service_type)
 
     async def close(self) -> None:
         # Stop health check server
@@ -371,9 +299,45 @@ class Zagadka(commands.Bot):
         except Exception as e:
             logging.error(f"Error stopping health check server: {e}")
 
+        try:
+            await self.voice_events.stop()
+        except Exception as e:
+            logging.error(f"Error stopping voice event pipeline: {e}")
+
+        # Write buffered activity points before the engine goes away
+        try:
+            await self.activity_buffer.stop()
+        except Exception as e:
+            logging.error(f"Error flushing activity buffer: {e}")
+
+        await self.cache.close()
+        # A replica has its own pool; otherwise reads share the primary's
+        if self.read_engine.pool is not self.engine.pool:
+            await self.read_engine.dispose()
         await self.engine.dispose()
         await super().close()
 
+    async def _run_event(self, coro, event_name: str, *args: Any, **kwargs: Any) -> None:
+        if not n_plus_one_detector.enabled:
+            return await super()._run_event(coro, event_name, *args, **kwargs)
+        with n_plus_one_detector.scope(f"event:{event_name}"):
+            await super()._run_event(coro, event_name, *args, **kwargs)
+
+    async def invoke(self, ctx: commands.Context, /) -> None:
+        if not n_plus_one_detector.enabled or ctx.command is None:
+            return await super().invoke(ctx)
+        with n_plus_one_detector.scope(f"command:{ctx.command.qualified_name}"):
+            await super().invoke(ctx)
+
+    async def add_cog(self, cog: commands.Cog, /, **kwargs: Any) -> None:
+        await super().add_cog(cog, **kwargs)
+        if n_plus_one_detector.enabled:
+            # Every iteration of the cog's task loops becomes its own detection scope
+            for name, attribute in vars(type(cog)).items():
+                if isinstance(attribute, tasks.Loop):
+                    loop = getattr(cog, name)
+                    loop.coro = n_plus_one_detector.wrap(loop.coro, f"task:{type(cog).__name__}.{name}")
+
     async def load_cogs(self) -> None:
         """Load all cogs"""
         logging.info("Loading cogs...")
@@ -421,6 +385,11 @@ class Zagadka(commands.Bot):
 
     async def setup_hook(self) -> None:
         """Setup hook."""
+        self.activity_buffer.start()
+        self.add_listener(self.voice_events.submit, "on_voice_state_update")
+        self.voice_events.start()
+        await self.cache.start()
+
         if not self.test:
             await self.load_cogs()
 
@@ -458,6 +427,30 @@ class Zagadka(commands.Bot):
 
         logging.info("Database create_all completed")
 
+        if not self.ranking_index.is_ready:
+            # Bring the rolling summary up to date after downtime, then build the in-memory ranking
+            try:
+                await self.activity_buffer.rebuild_summary()
+            except Exception as e:
+                logging.error(f"Failed to rebuild activity summary: {e}")
+
+            try:
+                await self.ranking_index.load(self.SessionLocal, buffer=self.activity_buffer)
+            except Exception as e:
+                logging.error(f"Failed to load ranking index: {e}")
+
+        if not member_cache.is_loaded:
+            try:
+                await member_cache.load(self.ReadSessionLocal)
+            except Exception as e:
+                logging.error(f"Failed to load member cache: {e}")
+
+        if not autokick_index.is_loaded:
+            try:
+                await autokick_index.load(self.SessionLocal)
+            except Exception as e:
+                logging.error(f"Failed to load autokick index: {e}")
+
         await self.change_presence(activity=discord.Activity(type=discord.ActivityType.playing, name="zaGadka bot"))
         logging.info("Event change_presence completed")
 
@@ -481,6 +474,9 @@ class Zagadka(commands.Bot):
                 logging.info("Found guild: %s", guild.name)
                 self.guild = guild
 
+        if self.guild is not None:
+            self.role_ids.resolve(self.guild)
+
         if not self.test:
             await self.tree.sync(guild=discord.Object(id=self.guild_id))
             logging.info("Slash commands synchronized")
@@ -506,6 +502,21 @@ class Zagadka(commands.Bot):
 
         logging.info("Ready")
 
+    async def on_guild_role_create(self, role: discord.Role) -> None:
+        """Keep role ID sets in sync with the guild's roles"""
+        if role.guild == self.guild:
+            self.role_ids.resolve(self.guild)
+
+    async def on_guild_role_delete(self, role: discord.Role) -> None:
+        """Keep role ID sets in sync with the guild's roles"""
+        if role.guild == self.guild:
+            self.role_ids.resolve(self.guild)
+
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role) -> None:
+        """Keep role ID sets in sync when a role is renamed"""
+        if after.guild == self.guild and before.name != after.name:
+            self.role_ids.resolve(self.guild)
+
     async def on_command_error(self, ctx, error):
         """Handle command errors with detailed logging."""
         from utils.error_logger import error_logger
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Benchmark: cache eviction cost, previous sort-based LRU vs the tiered cache's OrderedDict LRU."""
+
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from core.performance.tiered_cache import TieredCache  # noqa: E402
+from core.services.cache_service import CacheService  # noqa: E402
+
+SIZES = (10_000, 100_000)
+INSERTS = 2_000
+
+
+class SortingCache:
+    """The previous eviction: plain dict, sort everything by last access and drop 10% when full."""
+
+    def __init__(self, max_size: int, default_ttl: int):
+        self._cache = {}
+        self._max_size = max_size
+        self._default_ttl = default_ttl
+
+    async def set(self, namespace: str, key: str, value) -> None:
+        cache_key = f"{namespace}:{key}"
+        self._cache.pop(cache_key, None)
+        if len(self._cache) >= self._max_size:
+            sorted_entries = sorted(self._cache.items(), key=lambda x: x[1][1])
+            for old_key, _ in sorted_entries[: max(1, len(self._cache) // 10)]:
+                del self._cache[old_key]
+        self._cache[cache_key] = (value, time.time(), time.time() + self._default_ttl)
+
+    def close(self) -> None:
+        pass
+
+
+class TieredCacheService(CacheService):
+    """``CacheService`` over a private tiered cache capped at ``max_size`` entries."""
+
+    def __init__(self, max_size: int, default_ttl: int):
+        super().__init__(default_ttl=default_ttl, backend=TieredCache(max_entries=max_size, default_ttl=default_ttl))
+
+    def close(self) -> None:
+        self.backend.stop_cleanup()
+
+
+async def measure(cache_class, size):
+    """Fill a cache to capacity, then time inserts that force eviction."""
+    cache = cache_class(max_size=size, default_ttl=300)
+    for i in range(size):
+        await cache.set("bench", str(i), i)
+
+    worst = 0.0
+    started = time.perf_counter()
+    for i in range(size, size + INSERTS):
+        t0 = time.perf_counter()
+        await cache.set("bench", str(i), i)
+        worst = max(worst, time.perf_counter() - t0)
+    total = time.perf_counter() - started
+
+    cache.close()
+    return total / INSERTS * 1e6, worst * 1e3
+
+
+async def main():
+    print(f"{'entries':>8}  {'impl':<8}{'avg set':>12}{'worst set':>12}")
+    for size in SIZES:
+        for label, cache_class in (("sorted", SortingCache), ("tiered", TieredCacheService)):
+            avg_us, worst_ms = await measure(cache_class, size)
+            print(f"{size:>8}  {label:<8}{avg_us:>9.1f} µs{worst_ms:>9.2f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
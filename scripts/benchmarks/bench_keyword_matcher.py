@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: per-member cost of promotion keyword scanning."""
+
+import os
+import sys
+import timeit
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from utils.keyword_matcher import shared_matcher  # noqa: E402
+
+PROMOTION_KEYWORDS = ("zagadka", ".gg/zagadka", "discord.gg/zagadka")
+ANTIPROMO_MARKER = ".gg/"
+ITERATIONS = 20000
+
+
+def make_member(name, details=None, state=None):
+    """Fake member with a game activity and a custom status."""
+    return SimpleNamespace(
+        activities=[
+            SimpleNamespace(name="Counter-Strike 2", details=details, state=state),
+            SimpleNamespace(name=name, details=None, state=name),
+        ]
+    )
+
+
+MEMBERS = {
+    "no match": make_member("chilling with friends", "Competitive", "In a match"),
+    "promoter": make_member("join discord.gg/zagadka"),
+    "other server": make_member("join discord.gg/elsewhere"),
+}
+
+
+def substring_scan(member):
+    """Previous approach: every keyword tested against every field of every activity."""
+    promotes = False
+    antipromo = False
+    for activity in member.activities:
+        for field in ("name", "details", "state"):
+            value = getattr(activity, field, None)
+            if value and any(keyword in value.lower() for keyword in PROMOTION_KEYWORDS):
+                promotes = True
+        if activity.name and ".gg/" in activity.name.lower():
+            if not any(keyword in activity.name.lower() for keyword in PROMOTION_KEYWORDS):
+                antipromo = True
+    return promotes, antipromo
+
+
+def compiled_scan(member, matcher=shared_matcher(*PROMOTION_KEYWORDS, ANTIPROMO_MARKER)):
+    """New approach: one pass of the combined pattern over all fields."""
+    matches = matcher.scan_activities(member.activities)
+    promotes = any(match.keyword != ANTIPROMO_MARKER for match in matches)
+    names = {}
+    for match in matches:
+        if match.field == "name":
+            names.setdefault(id(match.activity), set()).add(match.keyword)
+    return promotes, any(keywords == {ANTIPROMO_MARKER} for keywords in names.values())
+
+
+def main():
+    print(f"{'case':<14}{'substring':>14}{'compiled':>14}")
+    for label, member in MEMBERS.items():
+        assert substring_scan(member) == compiled_scan(member), label
+        old = timeit.timeit(lambda: substring_scan(member), number=ITERATIONS) / ITERATIONS * 1e6
+        new = timeit.timeit(lambda: compiled_scan(member), number=ITERATIONS) / ITERATIONS * 1e6
+        print(f"{label:<14}{old:>11.2f} µs{new:>11.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Benchmark: statement build cost (select vs lambda_stmt) and compiled/prepared statement cache hits of hot queries.
+
+The second part needs PostgreSQL (POSTGRES_* environment variables, as for the bot) and exits
+with status 1 if a hot statement misses SQLAlchemy's compiled cache or asyncpg's prepared
+statement cache once warmed up.
+"""
+
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+import yaml  # noqa: E402
+from sqlalchemy import event, lambda_stmt, select, util  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine  # noqa: E402
+
+from core.performance.pool_monitor import engine_pool_kwargs, load_pool_settings  # noqa: E402
+from core.performance.query_monitor import QueryTimingMonitor  # noqa: E402
+from core.repositories.channel_repository import ChannelRepository  # noqa: E402
+from core.repositories.member_repository import AutoKickRepository, MemberRepository  # noqa: E402
+from datasources.models import Activity, Base, Member  # noqa: E402
+from datasources.queries import ChannelPermissionQueries, MemberQueries, RoleQueries  # noqa: E402
+
+BUILDS = 20_000
+ROUNDS = 200
+MEMBER_ID = 1
+
+
+def bench_statement_build():
+    """Python-side cost of producing an executable statement plus its cache key."""
+
+    def plain(member_id):
+        return select(Member).where(Member.id == member_id)
+
+    def lambda_based(member_id):
+        return lambda_stmt(lambda: select(Member).where(Member.id == member_id))
+
+    print(f"{'statement build':<28}{'per call':>12}")
+    for label, build in (("select()", plain), ("lambda_stmt()", lambda_based)):
+        started = time.perf_counter()
+        for i in range(BUILDS):
+            build(i)._generate_cache_key()
+        print(f"{label:<28}{(time.perf_counter() - started) / BUILDS * 1e6:>9.1f} µs")
+
+
+async def hot_statements(session: AsyncSession, i: int):
+    """The statements the request path runs most often."""
+    today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    await session.get(Activity, (MEMBER_ID + i, today, "voice"))
+    await ChannelRepository(session).get_autokick_entry(MEMBER_ID, MEMBER_ID + i)
+    await MemberQueries.get_voice_bypass_status(session, MEMBER_ID + i)
+    await MemberRepository(session).get_voice_bypass_status(MEMBER_ID + i)
+    await AutoKickRepository(session).get_autokick(MEMBER_ID, MEMBER_ID + i)
+    await RoleQueries.get_member_premium_roles(session, MEMBER_ID + i)
+    await ChannelPermissionQueries.get_permissions_for_member(session, MEMBER_ID + i)
+
+
+async def bench_database(settings, label):
+    """Run the hot statements on one connection; count compiled-cache hits and asyncpg prepares."""
+    prepares = [0]
+
+    class CountingLRUCache(util.LRUCache):
+        """asyncpg adapter's prepared statement cache; an insert means a statement was prepared."""
+
+        def __setitem__(self, key, value):
+            prepares[0] += 1
+            super().__setitem__(key, value)
+
+    kwargs = engine_pool_kwargs({**settings, "pool_size": 1, "max_overflow": 0})
+    engine = create_async_engine(database_url(), **kwargs)
+
+    @event.listens_for(engine.sync_engine.pool, "connect")
+    def count_prepares(dbapi_connection, connection_record):
+        cache = dbapi_connection._prepared_statement_cache
+        if cache is not None:
+            dbapi_connection._prepared_statement_cache = CountingLRUCache(cache.capacity)
+
+    monitor = QueryTimingMonitor()
+    monitor.install(engine)
+    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    # Warm-up: first execution compiles and prepares every statement
+    async with sessionmaker() as session:
+        await hot_statements(session, 0)
+    monitor.reset()
+    prepares[0] = 0
+
+    started = time.perf_counter()
+    for i in range(ROUNDS):
+        async with sessionmaker() as session:
+            await hot_statements(session, i)
+    elapsed = time.perf_counter() - started
+    await engine.dispose()
+
+    stats = monitor.get_stats(limit=50, sort_by="count")
+    print(
+        f"\n{label}: {elapsed / ROUNDS * 1000:.2f} ms per round, {stats['total_queries']} statements, "
+        f"compiled cache hits {stats['compiled_cache_hit_ratio']:.0%}, asyncpg prepares {prepares[0]}"
+    )
+    for statement in stats["statements"]:
+        origin = next(iter(statement["origins"]))
+        hit_ratio = statement["compiled_cache_hit_ratio"]
+        print(f"  {origin:<48}{statement['avg_ms']:>8.2f} ms  compiled hits {hit_ratio:.0%}")
+    return stats, prepares[0]
+
+
+def database_url():
+    user = os.environ.get("POSTGRES_USER", "")
+    password = os.environ.get("POSTGRES_PASSWORD", "")
+    host = os.environ.get("POSTGRES_HOST", "db")
+    port = os.environ.get("POSTGRES_PORT", "5432")
+    db = os.environ.get("POSTGRES_DB", "")
+    return f"postgresql+asyncpg://{user}:{password}@{host}:{port}/{db}"
+
+
+async def main():
+    bench_statement_build()
+
+    with open(os.path.join(os.path.dirname(__file__), "..", "..", "config.yml"), encoding="utf-8") as f:
+        settings = load_pool_settings(yaml.safe_load(f))
+
+    try:
+        stats, prepares = await bench_database(settings, "configured caches")
+        await bench_database({**settings, "query_cache_size": 0, "prepared_statement_cache_size": 0}, "caches off")
+    except (OSError, ConnectionError) as e:
+        print(f"\nPostgreSQL not reachable ({e}); skipped the cache verification")
+        return 0
+
+    if stats["compiled_cache_hit_ratio"] < 1.0 or prepares:
+        print("\nFAIL: hot statements missed the compiled or prepared statement cache after warm-up")
+        return 1
+    print("\nOK: every hot statement hit both caches after warm-up")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -6,6 +6,7 @@ This framework provides:
 - Automatic response validation
 - Mock data setup/teardown
 - Performance metrics
+- Database statement counts and N+1 query detection
 - Error handling testing
 - Permission testing
 - Cooldown testing
@@ -24,10 +25,13 @@ logger = logging.getLogger(__name__)
 class CommandTestFramework:
     """Main framework for testing Discord commands."""
 
-    def __init__(self, bot_container: str = "zgdk-mcp-1"):
+    def __init__(self, bot_container: str = "zgdk-mcp-1", fail_on_n_plus_one: bool = True):
         self.bot_container = bot_container
         self.test_results = []
         self.performance_metrics = {}
+        # Statement counts and N+1 findings reported by the bot for each command run
+        self.query_audits = {}
+        self.fail_on_n_plus_one = fail_on_n_plus_one
 
     async def execute_command(
         self,
@@ -42,10 +46,10 @@ class CommandTestFramework:
         start_time = datetime.now()
 
         # Build command execution string
-        cmd_str = """
+        cmd_str = f"""
 import asyncio
 import json
-from mcp_bot_server import call_tool
+from mcp_bot_server import QUERY_AUDIT_PREFIX, call_tool
 
 async def main():
     # Execute command with context
@@ -70,7 +74,9 @@ async def main():
     }}
 
     for r in result:
-        if hasattr(r, 'type') and hasattr(r, 'text'):
+        if getattr(r, 'text', '').startswith(QUERY_AUDIT_PREFIX):
+            output['queries'] = json.loads(r.text[len(QUERY_AUDIT_PREFIX):])
+        elif hasattr(r, 'type') and hasattr(r, 'text'):
             output['responses'].append({{
                 'type': r.type,
                 'text': r.text
@@ -104,6 +110,8 @@ asyncio.run(main())
             if cmd_key not in self.performance_metrics:
                 self.performance_metrics[cmd_key] = []
             self.performance_metrics[cmd_key].append(execution_time)
+            if "queries" in output:
+                self.query_audits.setdefault(cmd_key, []).append(output["queries"])
 
             return output
 
@@ -196,6 +204,19 @@ asyncio.run(main())
             report.append(f"- **{cmd}**: avg={avg_time:.3f}s, min={min_time:.3f}s, max={max_time:.3f}s")
         report.append("")
 
+        # Database statements per command and N+1 findings
+        report.append("## Query Audit")
+        for cmd, audits in self.query_audits.items():
+            max_statements = max(audit["statements"] for audit in audits)
+            findings = [finding for audit in audits for finding in audit["n_plus_one"]]
+            report.append(f"- **{cmd}**: max statements={max_statements}, N+1 findings={len(findings)}")
+            for finding in findings:
+                report.append(
+                    f"  - {finding['count']}x {finding['origin'] or 'raw SQL'} at {finding['call_site']} "
+                    f"(`{finding['statement'][:120]}`)"
+                )
+        report.append("")
+
         # Test results
         report.append("## Test Results")
         for result in self.test_results:
@@ -249,6 +270,29 @@ class CommandTestCase:
 
             assert found, f"Expected response '{expected_response}' not found"
 
+        if self.framework.fail_on_n_plus_one:
+            self.assert_no_n_plus_one(result)
+
+        return result
+
+    def assert_no_n_plus_one(self, result: Dict[str, Any]):
+        """Assert that the bot reported no repeated statement inside the command."""
+        findings = result.get("queries", {}).get("n_plus_one", [])
+        details = "; ".join(
+            f"{finding['count']}x {finding['origin'] or 'raw SQL'} at {finding['call_site']}" for finding in findings
+        )
+        assert not findings, f"N+1 queries in {result.get('command')}: {details}"
+
+    async def assert_query_budget(self, command: str, args: str = "", max_statements: int = 10, **kwargs):
+        """Assert that a command issues at most ``max_statements`` database statements."""
+        result = await self.assert_command_success(command, args, **kwargs)
+
+        queries = result.get("queries")
+        assert queries is not None, "Bot did not report database statements (command_tester cog too old?)"
+        assert (
+            queries["statements"] <= max_statements
+        ), f"{command} issued {queries['statements']} statements (budget {max_statements})"
+
         return result
 
     async def assert_command_fails(self, command: str, args: str = "", expected_error: Optional[str] = None, **kwargs):
@@ -5,6 +5,7 @@ This server communicates with the bot's HTTP API to execute commands.
 """
 
 import asyncio
+import json
 import logging
 from typing import Any, Dict, List
 
@@ -23,6 +24,9 @@ import os  # noqa: E402
 # Use command_tester API on port 8090 instead of owner_utils
 API_BASE_URL = os.getenv("API_BASE_URL", "http://app:8090")
 
+# Marks the machine-readable query audit returned after a command's text response
+QUERY_AUDIT_PREFIX = "query_audit:"
+
 # Create server instance
 server = Server("discord-bot-tester")
 
@@ -109,8 +113,19 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
                     else:
                         error_text = await resp.text()
                         text = f"❌ API error (status {resp.status}): {error_text}"
-
-                return [TextContent(type="text", text=text)]
+                        data = {}
+
+                queries = data.get("queries")
+                if queries:
+                    text += f"\n\nDatabase statements: {queries['statements']}"
+                    for finding in queries["n_plus_one"]:
+                        origin = finding["origin"] or "raw SQL"
+                        text += f"\n⚠️ N+1: {finding['count']}x {origin} at {finding['call_site']}"
+
+                contents = [TextContent(type="text", text=text)]
+                if queries:
+                    contents.append(TextContent(type="text", text=QUERY_AUDIT_PREFIX + json.dumps(queries)))
+                return contents
 
             elif name == "bot_status":
                 url = f"{API_BASE_URL}/status"
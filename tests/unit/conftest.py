@@ -0,0 +1,30 @@
+"""Fixtures for unit tests of individual modules."""
+import importlib
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+SERVICES_DIR = Path(__file__).resolve().parents[2] / "core" / "services"
+
+
+@pytest.fixture
+def load_service(monkeypatch):
+    """Import a ``core.services`` module without running the package ``__init__``.
+
+    The package re-exports every service, which pulls in the real discord.py;
+    the modules under test only need their own imports.
+    """
+    package = types.ModuleType("core.services")
+    package.__path__ = [str(SERVICES_DIR)]
+    monkeypatch.setitem(sys.modules, "core.services", package)
+
+    def load(name: str, stubs: dict = None):
+        """Import ``core.services.<name>``, first registering ``stubs`` (module name -> module)."""
+        for module_name, module in (stubs or {}).items():
+            monkeypatch.setitem(sys.modules, module_name, module)
+        monkeypatch.delitem(sys.modules, f"core.services.{name}", raising=False)
+        return importlib.import_module(f"core.services.{name}")
+
+    return load
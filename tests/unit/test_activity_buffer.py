@@ -0,0 +1,113 @@
+"""Unit tests for the activity points write-behind buffer."""
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from types import ModuleType
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+DAY = datetime(2026, 1, 5, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def activity_queries():
+    module = ModuleType("datasources.queries.activity_queries")
+    module.upsert_activity_points = AsyncMock()
+    module.rebuild_activity_summary = AsyncMock(return_value=0)
+    return module
+
+
+@pytest.fixture
+def activity_buffer(load_service, activity_queries):
+    return load_service("activity_buffer", stubs={"datasources.queries.activity_queries": activity_queries})
+
+
+def session_factory(sessions):
+    """Session factory recording every session it hands out."""
+
+    @asynccontextmanager
+    async def factory():
+        session = MagicMock()
+        session.commit = AsyncMock()
+        session.rollback = AsyncMock()
+        sessions.append(session)
+        yield session
+
+    return factory
+
+
+@pytest.mark.unit
+class TestActivityPointsBuffer:
+    """Test coalescing, flushing and retrying failed writes."""
+
+    @pytest.mark.unit
+    def test_increments_of_one_key_are_merged(self, activity_buffer, activity_queries):
+        """Points per (member, day, type) are summed and written as one row in one transaction."""
+        sessions = []
+        buffer = activity_buffer.ActivityPointsBuffer(session_factory(sessions))
+        buffer.add(1, "text", 2, DAY)
+        buffer.add(1, "text", 3, DAY)
+        buffer.add(1, "voice", 4, DAY)
+        buffer.add(2, "text", 0, DAY)
+
+        assert buffer.pending_count == 2
+        assert asyncio.run(buffer.flush()) == 2
+        assert buffer.pending_count == 0
+
+        session, increments = activity_queries.upsert_activity_points.await_args.args
+        assert sorted(increments) == [(1, DAY, "text", 5), (1, DAY, "voice", 4)]
+        assert sessions == [session]
+        session.commit.assert_awaited_once()
+        assert asyncio.run(buffer.flush()) == 0
+
+    @pytest.mark.unit
+    def test_failed_flush_keeps_points_for_the_next_one(self, activity_buffer, activity_queries):
+        """A failed write is rolled back and its points merge with those added since."""
+        sessions = []
+        buffer = activity_buffer.ActivityPointsBuffer(session_factory(sessions))
+        activity_queries.upsert_activity_points.side_effect = [RuntimeError("db down"), None]
+        buffer.add(1, "text", 2, DAY)
+
+        assert asyncio.run(buffer.flush()) == 0
+        sessions[0].rollback.assert_awaited_once()
+        buffer.add(1, "text", 3, DAY)
+
+        assert asyncio.run(buffer.flush()) == 1
+        _, increments = activity_queries.upsert_activity_points.await_args.args
+        assert increments == [(1, DAY, "text", 5)]
+        assert buffer.get_stats()["failed_flushes"] == 1
+
+    @pytest.mark.unit
+    def test_flushed_block_holds_back_other_flushes(self, activity_buffer, activity_queries):
+        """Inside ``flushed`` the buffer is empty at first and collects new points until the block exits."""
+        buffer = activity_buffer.ActivityPointsBuffer(session_factory([]))
+        buffer.add(1, "text", 2, DAY)
+
+        async def run():
+            async with buffer.flushed():
+                assert activity_queries.upsert_activity_points.await_count == 1
+                buffer.add(2, "voice", 7, DAY)
+                flush = asyncio.create_task(buffer.flush())
+                await asyncio.sleep(0)
+                assert buffer.pending_increments() == [(2, DAY, "voice", 7)]
+            return await flush
+
+        assert asyncio.run(run()) == 1
+        assert activity_queries.upsert_activity_points.await_count == 2
+
+    @pytest.mark.unit
+    def test_stop_writes_remaining_points(self, activity_buffer, activity_queries):
+        """Stopping cancels the flush loop and writes what is still pending."""
+        buffer = activity_buffer.ActivityPointsBuffer(session_factory([]), flush_interval=60)
+
+        async def run():
+            buffer.start()
+            assert buffer.is_running
+            buffer.add(1, "text", 2, DAY)
+            await buffer.stop()
+
+        asyncio.run(run())
+        assert not buffer.is_running
+        assert buffer.pending_count == 0
+        activity_queries.upsert_activity_points.assert_awaited_once()
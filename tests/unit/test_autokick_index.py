@@ -0,0 +1,128 @@
+"""Unit tests for the in-memory autokick index."""
+import asyncio
+import importlib
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import BigInteger, Integer
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from core.performance.autokick_index import AutoKickIndex
+
+# The package re-exports the index instance under the module's name
+autokick_index_module = importlib.import_module("core.performance.autokick_index")
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class AutoKick(Base):
+    __tablename__ = "autokicks"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    owner_id: Mapped[int] = mapped_column(BigInteger)
+    target_id: Mapped[int] = mapped_column(BigInteger)
+
+
+def session_factory(rows, before_result=None):
+    """Session factory whose query returns ``rows``, running ``before_result`` while the query is in flight."""
+
+    async def execute(statement):
+        if before_result:
+            before_result()
+        result = MagicMock()
+        result.all.return_value = rows
+        return result
+
+    @asynccontextmanager
+    async def factory():
+        session = MagicMock()
+        session.execute = AsyncMock(side_effect=execute)
+        yield session
+
+    return factory
+
+
+@pytest.mark.unit
+class TestAutoKickIndex:
+    """Test lookups, per-owner counts and loading."""
+
+    @pytest.mark.unit
+    def test_add_remove_keep_both_directions_in_step(self):
+        """Counts, listings and join matches follow adds and removes."""
+        index = AutoKickIndex()
+        index.add(1, 100)
+        index.add(1, 200)
+        index.add(2, 100)
+        index.add(2, 100)
+
+        assert len(index) == 3
+        assert index.count_for_owner(1) == 2
+        assert sorted(index.targets_of(1)) == [100, 200]
+        assert (2, 100) in index
+        assert index.matching_owners(100, [2, 3]) == {2}
+        assert index.matching_owners(300, [1, 2]) == set()
+
+        index.remove(1, 100)
+        index.remove(1, 999)
+        assert index.count_for_owner(1) == 1
+        assert index.matching_owners(100, [1, 2]) == {2}
+
+        index.remove(1, 200)
+        assert index.count_for_owner(1) == 0
+        assert index.get_stats()["owners"] == 1
+
+    @pytest.mark.unit
+    def test_load_replays_writes_committed_during_the_load(self, monkeypatch):
+        """Loaded rows replace the index; writes made while the query ran are not lost."""
+        monkeypatch.setattr(autokick_index_module, "_autokick_model", lambda: AutoKick)
+        index = AutoKickIndex()
+        index.add(9, 900)
+
+        def concurrent_writes():
+            index.add(3, 300)
+            index.remove(1, 100)
+
+        factory = session_factory([(1, 100), (2, 100)], before_result=concurrent_writes)
+        assert asyncio.run(index.load(factory)) == 2
+        assert index.is_loaded
+        assert (9, 900) not in index
+        assert index.matching_owners(100, [1, 2]) == {2}
+        assert index.matching_owners(300, [3]) == {3}
+
+    @pytest.mark.unit
+    def test_ensure_loaded_loads_once(self, monkeypatch):
+        """Concurrent first uses share a single load."""
+        monkeypatch.setattr(autokick_index_module, "_autokick_model", lambda: AutoKick)
+        index = AutoKickIndex()
+        loads = []
+        factory = session_factory([(1, 100)], before_result=lambda: loads.append(1))
+
+        async def run():
+            await asyncio.gather(index.ensure_loaded(factory), index.ensure_loaded(factory))
+            await index.ensure_loaded(factory)
+
+        asyncio.run(run())
+        assert loads == [1]
+        assert (1, 100) in index
+
+    @pytest.mark.unit
+    def test_reserve_claims_under_the_limit_once(self):
+        """Concurrent reservations cannot exceed the limit or duplicate an entry; a failed write is undone."""
+        index = AutoKickIndex()
+
+        async def run():
+            return await asyncio.gather(
+                index.reserve(1, 100, limit=2),
+                index.reserve(1, 100, limit=2),
+                index.reserve(1, 200, limit=2),
+                index.reserve(1, 300, limit=2),
+            )
+
+        assert asyncio.run(run()) == ["reserved", "exists", "reserved", "limit"]
+        assert index.count_for_owner(1) == 2
+
+        index.remove(1, 200)
+        assert asyncio.run(index.reserve(1, 300, limit=2)) == "reserved"
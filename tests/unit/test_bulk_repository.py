@@ -0,0 +1,106 @@
+"""Unit tests for the bulk primitives of BaseRepository."""
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import BigInteger, DateTime, delete
+from sqlalchemy.dialects.postgresql import asyncpg
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from core.repositories.base_repository import BaseRepository
+
+
+class Base(DeclarativeBase):
+    """Standalone metadata; datasources.models is stubbed in tests."""
+
+
+class Member(Base):
+    """Single-column primary key, as datasources.models.Member."""
+
+    __tablename__ = "members"
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    wallet_balance: Mapped[int] = mapped_column(BigInteger, default=0)
+
+
+class ChannelPermission(Base):
+    """Composite primary key, as datasources.models.ChannelPermission."""
+
+    __tablename__ = "channel_permissions"
+    member_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    target_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    allow_permissions_value: Mapped[int] = mapped_column(BigInteger, default=0)
+    deny_permissions_value: Mapped[int] = mapped_column(BigInteger, default=0)
+    last_updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+
+
+def compile_pg(stmt) -> str:
+    return str(stmt.compile(dialect=asyncpg.dialect()))
+
+
+@pytest.mark.unit
+class TestBulkStatements:
+    """Test the SQL generated for upserts and key lookups."""
+
+    @pytest.mark.unit
+    def test_upsert_statements(self):
+        """Without update columns conflicts are ignored; update_set can merge with the stored row."""
+        members = BaseRepository(Member, None)
+        sql = compile_pg(members._upsert_statement([{"id": 1}, {"id": 2}], None, None, None))
+        assert sql.endswith("ON CONFLICT (id) DO NOTHING")
+        # The Python-side wallet_balance default is one more bind per row
+        assert sql.count("$") == 4
+
+        permissions = BaseRepository(ChannelPermission, None)
+        row = {
+            "member_id": 1,
+            "target_id": 2,
+            "allow_permissions_value": 8,
+            "deny_permissions_value": 0,
+            "last_updated_at": datetime.now(timezone.utc),
+        }
+        sql = compile_pg(
+            permissions._upsert_statement(
+                [row],
+                ["last_updated_at"],
+                lambda excluded: {
+                    "allow_permissions_value": ChannelPermission.allow_permissions_value.bitwise_or(
+                        excluded.allow_permissions_value
+                    )
+                },
+                None,
+            )
+        )
+        assert "ON CONFLICT (member_id, target_id) DO UPDATE SET" in sql
+        assert "last_updated_at = excluded.last_updated_at" in sql
+        assert (
+            "allow_permissions_value = (channel_permissions.allow_permissions_value | "
+            "excluded.allow_permissions_value)" in sql
+        )
+
+    @pytest.mark.unit
+    def test_chunk_size_counts_defaulted_columns(self):
+        """Binds for column defaults and update_set count against the limit, not just the row's keys."""
+        members = BaseRepository(Member, None)
+        assert members._upsert_chunk_size({"id": 1}, None, None, None) == 32767 // 2
+
+        permissions = BaseRepository(ChannelPermission, None)
+        row = {"member_id": 1, "target_id": 2, "last_updated_at": datetime.now(timezone.utc)}
+        chunk = permissions._upsert_chunk_size(
+            row, None, lambda excluded: {"deny_permissions_value": excluded.deny_permissions_value + 1}, None
+        )
+        assert chunk == (32767 - 1) // 5
+
+    @pytest.mark.unit
+    def test_keys_clause_binds_one_array_per_key_column(self):
+        """Lookups by key keep a single statement shape whatever the number of IDs."""
+        members = BaseRepository(Member, None)
+        few = compile_pg(delete(Member).where(members._keys_clause([1, 2])))
+        many = compile_pg(delete(Member).where(members._keys_clause(list(range(500)))))
+        assert few == many
+        assert "members.id = ANY ($1::BIGINT[])" in few
+
+        permissions = BaseRepository(ChannelPermission, None)
+        compiled = delete(ChannelPermission).where(permissions._keys_clause([(1, 2), (1, 3)])).compile(
+            dialect=asyncpg.dialect()
+        )
+        assert "unnest($1::BIGINT[], $2::BIGINT[])" in str(compiled)
+        assert compiled.params == {"ids_member_id": [1, 1], "ids_target_id": [2, 3]}
@@ -0,0 +1,60 @@
+"""Unit tests for DatabaseOptimizer.cache_result key derivation and counters."""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from core.performance.database_optimizer import DB_RESULTS_NAMESPACE, DatabaseOptimizer
+from core.performance.tiered_cache import TieredCache
+
+
+CACHE = TieredCache()
+
+
+class Repository:
+    """Repository-like class with a cached query."""
+
+    optimizer = DatabaseOptimizer(cache=CACHE)
+
+    def __init__(self):
+        self.calls = 0
+
+    @optimizer.cache_result(ttl_seconds=60)
+    async def get_member(self, session, member, days=7):
+        self.calls += 1
+        return {"id": member.id, "days": days}
+
+
+@pytest.mark.unit
+class TestCacheResult:
+    """Test that cached results are shared across instances and sessions."""
+
+    @pytest.mark.unit
+    def test_key_skips_self_and_session(self):
+        """Different repository instances and sessions hit the same entry."""
+        first, second = Repository(), Repository()
+
+        async def run():
+            await first.get_member(object(), SimpleNamespace(id=5))
+            return await second.get_member(object(), SimpleNamespace(id=5))
+
+        assert asyncio.run(run()) == {"id": 5, "days": 7}
+        assert (first.calls, second.calls) == (1, 0)
+
+    @pytest.mark.unit
+    def test_counters_and_clear(self):
+        """Hits and misses are counted per function and clear_cache drops its entries."""
+        optimizer = Repository.optimizer
+        repository = Repository()
+
+        async def run():
+            for _ in range(3):
+                await repository.get_member(None, SimpleNamespace(id=9), days=30)
+
+        asyncio.run(run())
+        stats = optimizer.get_cache_stats()["functions"][f"{__name__}.Repository.get_member"]
+        assert stats["hits"] >= 2
+        assert repository.calls == 1
+
+        optimizer.clear_cache("Repository.get_member")
+        assert CACHE.keys(DB_RESULTS_NAMESPACE) == []
@@ -0,0 +1,84 @@
+"""Unit tests for the namespaced cache service."""
+import asyncio
+
+import pytest
+
+from core.performance.tiered_cache import TieredCache
+
+
+@pytest.fixture
+def cache_service(load_service):
+    return load_service("cache_service")
+
+
+@pytest.mark.unit
+class TestCacheService:
+    """Test LRU eviction, keyword keys, tags and shared loads through the service API."""
+
+    @pytest.mark.unit
+    def test_evicts_least_recently_used_entry(self, cache_service):
+        """A hit refreshes an entry, so the oldest untouched one is evicted at the entry limit."""
+        cache = cache_service.CacheService(backend=TieredCache(max_entries=3))
+
+        async def run():
+            for key in ("a", "b", "c"):
+                await cache.set("ns", key, key)
+            assert await cache.get("ns", "a") == "a"
+            await cache.set("ns", "d", "d")
+            return [await cache.get("ns", key) for key in ("a", "b", "c", "d")]
+
+        assert asyncio.run(run()) == ["a", None, "c", "d"]
+        stats = cache.get_stats()
+        assert stats["max_size"] == 3
+        assert stats["evictions"] == 1
+
+    @pytest.mark.unit
+    def test_keyword_parameters_are_part_of_the_key(self, cache_service):
+        """Keyword parameters select separate entries regardless of their order."""
+        cache = cache_service.CacheService(backend=TieredCache())
+
+        async def run():
+            await cache.set("ns", "member", "first", guild=1, member=2)
+            await cache.set("ns", "member", "second", guild=1, member=3)
+            return (
+                await cache.get("ns", "member", member=2, guild=1),
+                cache.get_nowait("ns", "member", guild=1, member=3),
+                await cache.delete("ns", "member", guild=1, member=2),
+                await cache.get("ns", "member", guild=1, member=2),
+            )
+
+        assert asyncio.run(run()) == ("first", "second", True, None)
+
+    @pytest.mark.unit
+    def test_tag_and_namespace_invalidation(self, cache_service):
+        """Tagged entries go with their tag, the rest of a namespace with the namespace."""
+        cache = cache_service.CacheService(backend=TieredCache())
+
+        async def run():
+            await cache.set("ns", "tagged", 1, tags={"member:1"})
+            await cache.set("ns", "plain", 2)
+            await cache.set("other", "plain", 3)
+            assert await cache.invalidate_by_tags("member:1") == 1
+            assert await cache.get("ns", "plain") == 2
+            assert await cache.invalidate_namespace("ns") == 1
+            return await cache.get("ns", "plain"), await cache.get("other", "plain")
+
+        assert asyncio.run(run()) == (None, 3)
+
+    @pytest.mark.unit
+    def test_get_or_set_calls_the_factory_once(self, cache_service):
+        """Concurrent misses share one factory call and later calls are hits."""
+        cache = cache_service.CacheService(backend=TieredCache())
+        calls = []
+
+        async def factory():
+            calls.append(1)
+            await asyncio.sleep(0)
+            return "value"
+
+        async def run():
+            results = await asyncio.gather(*(cache.get_or_set("ns", "key", factory) for _ in range(3)))
+            return results + [await cache.get_or_set("ns", "key", factory)]
+
+        assert asyncio.run(run()) == ["value"] * 4
+        assert calls == [1]
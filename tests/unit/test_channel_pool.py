@@ -0,0 +1,111 @@
+"""Unit tests for the pre-warmed voice channel pool."""
+import asyncio
+import sys
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+if not hasattr(sys.modules["discord"], "PermissionOverwrite"):
+    sys.modules["discord"].PermissionOverwrite = MagicMock
+
+from utils.voice.channel_pool import VoiceChannelPool  # noqa: E402
+
+POOLED, UNPOOLED = 10, 20
+
+
+class FakeGuild:
+    """Guild creating channels in memory."""
+
+    def __init__(self):
+        self.channels = {}
+        self.default_role = "everyone"
+        self.bitrate_limit = 96000
+        self.create_voice_channel = AsyncMock(side_effect=self._create)
+
+    def add(self, channel_id, category, members=()):
+        channel = SimpleNamespace(id=channel_id, category=category, members=list(members))
+        self.channels[channel_id] = channel
+        category.voice_channels.append(channel)
+        return channel
+
+    def get_channel(self, channel_id):
+        return self.channels.get(channel_id)
+
+    async def _create(self, name, category, **kwargs):
+        return self.add(100 + len(self.channels), category)
+
+
+def make_pool():
+    bot = SimpleNamespace(
+        config={
+            "channels_create": [],
+            "channels_voice": {"afk": 0},
+            "vc_categories": [POOLED, UNPOOLED],
+            "channel_name_formats": {POOLED: "{emoji} public"},
+            "voice_channel_pool": {"size": 2, "create_interval": 0},
+        }
+    )
+    plan = SimpleNamespace(apply=AsyncMock(return_value=True))
+    permission_manager = SimpleNamespace(
+        clean_channel_plan=MagicMock(return_value=plan),
+        get_mute_role_overwrites=lambda guild: {None: "stream_off"},
+        _get_clean_everyone_permissions=lambda: "clean",
+        _get_default_user_limit=lambda category_id: 99,
+    )
+    return VoiceChannelPool.from_config(bot, permission_manager), plan
+
+
+async def settle(pool):
+    for _ in range(3):
+        await asyncio.gather(*pool._tasks, *pool._refills.values())
+
+
+@pytest.mark.unit
+class TestVoiceChannelPool:
+    """Test adoption, acquisition, refill and release."""
+
+    @pytest.mark.unit
+    def test_only_categories_with_name_format_are_pooled(self):
+        """Categories whose channel names depend on the owner are left to the regular flow."""
+        pool, _ = make_pool()
+        assert pool.sizes == {POOLED: 2}
+        assert pool.manages(POOLED) and not pool.manages(UNPOOLED)
+
+    @pytest.mark.unit
+    def test_acquire_refill_and_release(self):
+        """Empty channels are adopted, taken channels are replaced in the background, extras are deleted."""
+
+        async def run():
+            pool, plan = make_pool()
+            guild = FakeGuild()
+            category = SimpleNamespace(id=POOLED, voice_channels=[])
+            guild.channels[POOLED] = category
+            guild.add(1, category)
+            guild.add(2, category, members=["someone"])
+
+            pool.start(guild)
+            await settle(pool)
+            # The empty channel was reset and one more created; the occupied one was left alone
+            assert plan.apply.await_count == 1
+            assert guild.create_voice_channel.await_count == 1
+            assert guild.create_voice_channel.await_args.kwargs["overwrites"] == {"everyone": "clean"}
+
+            first, second = pool.acquire(category), pool.acquire(category)
+            assert {first.id, second.id} == {1, 103}
+            first.members.append("owner")
+            await settle(pool)
+            assert guild.create_voice_channel.await_count == 3
+            assert pool.get_stats()["ready"] == {POOLED: 2}
+
+            # Pool full: a released channel is deleted by the caller; a foreign category is not handled
+            assert pool.release(second) is False
+            assert pool.release(SimpleNamespace(id=5, category=SimpleNamespace(id=UNPOOLED))) is False
+
+            pool.acquire(category)
+            assert pool.release(second) is True
+            await settle(pool)
+            assert plan.apply.await_count == 2
+            assert pool.get_stats()["acquired"] == 3
+
+        asyncio.run(run())
@@ -0,0 +1,73 @@
+"""Unit tests for the compiled keyword matcher."""
+from types import SimpleNamespace
+
+import pytest
+
+from utils.keyword_matcher import KeywordMatcher, shared_matcher
+
+
+def activity(name=None, details=None, state=None):
+    """Build a minimal activity-like object."""
+    return SimpleNamespace(name=name, details=details, state=state)
+
+
+@pytest.mark.unit
+class TestKeywordMatcher:
+    """Test keyword matching over activity fields."""
+
+    @pytest.mark.unit
+    def test_search_is_case_insensitive(self):
+        """Keywords match regardless of case and are reported lower-cased."""
+        matcher = KeywordMatcher(["Zagadka"])
+        assert matcher.search("Join ZAGADKA now") == "zagadka"
+        assert matcher.contains_any("nothing here") is False
+        assert matcher.search(None) is None
+
+    @pytest.mark.unit
+    def test_longest_keyword_wins(self):
+        """Overlapping keywords report the longest one at a position."""
+        matcher = KeywordMatcher(["zagadka", "discord.gg/zagadka", ".gg/"])
+        assert matcher.search("discord.gg/zagadka") == "discord.gg/zagadka"
+
+    @pytest.mark.unit
+    def test_keywords_are_literal(self):
+        """Regex metacharacters in keywords are escaped."""
+        matcher = KeywordMatcher([".gg/"])
+        assert matcher.contains_any("xgg/") is False
+        assert matcher.contains_any("a.gg/b") is True
+
+    @pytest.mark.unit
+    def test_scan_reports_every_field(self):
+        """All fields of all activities are scanned in one call."""
+        matcher = KeywordMatcher(["zagadka", ".gg/"])
+        game = activity(name="Game", details="zagadka lobby", state="discord.gg/other")
+        status = activity(name="Zagadka")
+
+        matches = matcher.scan_activities([game, status])
+
+        assert [(m.activity, m.field, m.keyword) for m in matches] == [
+            (game, "details", "zagadka"),
+            (game, "state", ".gg/"),
+            (status, "name", "zagadka"),
+        ]
+        assert matches[-1].content == "Zagadka"
+
+    @pytest.mark.unit
+    def test_scan_skips_missing_and_non_text_fields(self):
+        """Missing, empty and non-string attributes are ignored."""
+        matcher = KeywordMatcher(["zagadka"])
+        assert matcher.scan_activities(None) == []
+        assert matcher.scan_activities([object(), activity(name=123, state="")]) == []
+
+    @pytest.mark.unit
+    def test_empty_keyword_list_never_matches(self):
+        """A matcher without keywords matches nothing."""
+        matcher = KeywordMatcher([])
+        assert matcher.search("zagadka") is None
+        assert matcher.scan_activities([activity(name="zagadka")]) == []
+
+    @pytest.mark.unit
+    def test_shared_matcher_is_reused(self):
+        """The same keyword set returns the same compiled matcher."""
+        assert shared_matcher("a", "b") is shared_matcher("a", "b")
+        assert shared_matcher("a", "b") is not shared_matcher("a")
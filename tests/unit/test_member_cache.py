@@ -0,0 +1,58 @@
+"""Unit tests for the member existence cache."""
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from core.performance.member_cache import MemberExistenceCache
+
+
+@pytest.mark.unit
+class TestMemberExistenceCache:
+    """Test lookups and the commit/rollback bookkeeping."""
+
+    @pytest.mark.unit
+    def test_ids_become_known_only_when_the_transaction_commits(self):
+        """Inserted IDs are pending until commit and forgotten on rollback or savepoint rollback."""
+        cache = MemberExistenceCache()
+        cache.install()
+        engine = create_engine("sqlite://")
+
+        with Session(engine) as session:
+            session.execute(text("SELECT 1"))
+            cache.mark_known(session, (1, 2))
+            assert 1 not in cache
+            session.commit()
+        assert 1 in cache and 2 in cache
+
+        with Session(engine) as session:
+            session.execute(text("SELECT 1"))
+            cache.mark_known(session, (3,))
+            session.rollback()
+            session.commit()
+        assert 3 not in cache
+
+        with Session(engine) as session:
+            session.execute(text("SELECT 1"))
+            cache.mark_known(session, (4,))
+        assert 4 not in cache
+
+        with Session(engine) as session:
+            session.execute(text("SELECT 1"))
+            savepoint = session.begin_nested()
+            cache.mark_known(session, (5,))
+            savepoint.rollback()
+            session.commit()
+        assert 5 not in cache
+
+    @pytest.mark.unit
+    def test_missing_counts_hits_and_misses(self):
+        """Known IDs are filtered out; unknown ones come back sorted and deduplicated."""
+        cache = MemberExistenceCache()
+        cache._known.update({10, 20})
+
+        assert cache.missing([30, 10, 5, 30, 20]) == [5, 30]
+        stats = cache.get_stats()
+        assert stats["members"] == 2
+        assert stats["hits"] == 2
+        assert stats["misses"] == 2
+        assert stats["hit_ratio"] == 0.5
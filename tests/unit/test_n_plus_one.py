@@ -0,0 +1,88 @@
+"""Unit tests for N+1 query detection."""
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from core.performance.n_plus_one import NPlusOneDetected, NPlusOneDetector
+from core.performance.query_monitor import track_queries
+
+
+@track_queries
+class MemberLookupQueries:
+    """Query class in the style of datasources.queries."""
+
+    @staticmethod
+    async def get_member(connection, member_id):
+        return connection.execute(text("SELECT :id"), {"id": member_id}).fetchall()
+
+
+@pytest.mark.unit
+class TestNPlusOneDetector:
+    """Test scopes, findings and call-site attribution."""
+
+    @pytest.mark.unit
+    def test_reports_repeated_statement_with_origin_and_call_site(self):
+        """A query per member inside a loop is reported once per statement, with where it came from."""
+        engine = create_engine("sqlite://")
+        detector = NPlusOneDetector(threshold=3)
+        detector.enabled = True
+        detector.install(engine)
+
+        async def check_members(connection):
+            for member_id in range(4):
+                await MemberLookupQueries.get_member(connection, member_id)
+            for member_id in range(3):
+                connection.execute(text("SELECT 2 WHERE :id > 0"), {"id": member_id})
+            connection.execute(text("SELECT 1"))
+
+        async def run():
+            with engine.connect() as connection:
+                with detector.scope("event:on_ready") as outer:
+                    with detector.scope("task:RoleCog.check_roles"):
+                        await check_members(connection)
+            return outer
+
+        outer = asyncio.run(run())
+
+        assert outer.statements == 8
+        assert len(outer.findings) == 2
+        tracked, raw = outer.findings
+        assert tracked["scope"] == "task:RoleCog.check_roles"
+        assert tracked["count"] == 4
+        assert tracked["origin"] == "MemberLookupQueries.get_member"
+        assert raw["count"] == 3
+        assert raw["origin"] is None
+        assert raw["call_site"].startswith("tests/unit/test_n_plus_one.py:")
+        assert raw["call_site"].endswith("(check_members)")
+
+        stats = detector.get_stats()
+        assert stats["scopes"] == 1
+        assert stats["findings"] == 2
+        assert stats["offending_scopes"] == {"event:on_ready": {"runs": 1, "max_statements": 8, "n_plus_one": 2}}
+
+    @pytest.mark.unit
+    def test_disabled_scope_and_expectations(self):
+        """Scopes are no-ops while disabled; tests can force them and fail on findings or budgets."""
+        engine = create_engine("sqlite://")
+        detector = NPlusOneDetector(threshold=2)
+        detector.install(engine)
+
+        with engine.connect() as connection:
+            with detector.scope("command:profile") as scope:
+                connection.execute(text("SELECT 1"))
+            assert scope is None
+
+            with pytest.raises(NPlusOneDetected, match="N\\+1 queries detected"):
+                with detector.expect_no_n_plus_one("command:shop"):
+                    connection.execute(text("SELECT 1"))
+                    connection.execute(text("SELECT 1"))
+
+            with pytest.raises(NPlusOneDetected, match="budget 1"):
+                with detector.expect_no_n_plus_one("command:shop", max_statements=1):
+                    connection.execute(text("SELECT 1"))
+                    connection.execute(text("SELECT 2"))
+
+            with detector.expect_no_n_plus_one("command:shop") as scope:
+                connection.execute(text("SELECT 1"))
+            assert scope.statements == 1
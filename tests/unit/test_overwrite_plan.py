@@ -0,0 +1,79 @@
+"""Unit tests for the voice channel overwrite planner."""
+import asyncio
+import sys
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+
+class FakeOverwrite:
+    """Minimal PermissionOverwrite: explicit values only, compared by value (discord is stubbed in tests)."""
+
+    def __init__(self, **values):
+        self._values = {name: value for name, value in values.items() if value is not None}
+
+    def __eq__(self, other):
+        return isinstance(other, FakeOverwrite) and self._values == other._values
+
+
+if not hasattr(sys.modules["discord"], "PermissionOverwrite"):
+    sys.modules["discord"].PermissionOverwrite = FakeOverwrite
+
+from utils.voice import overwrites as overwrites_module  # noqa: E402
+from utils.voice.overwrites import OverwritePlan  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def fake_permission_overwrite(monkeypatch):
+    monkeypatch.setattr(overwrites_module.discord, "PermissionOverwrite", FakeOverwrite)
+
+
+def make_channel(overwrites, user_limit=0):
+    return SimpleNamespace(name="kanał", overwrites=dict(overwrites), user_limit=user_limit, edit=AsyncMock())
+
+
+@pytest.mark.unit
+class TestOverwritePlan:
+    """Test planning, diffing and single-request application."""
+
+    @pytest.mark.unit
+    def test_applies_everything_in_one_edit(self):
+        """A reused channel gets the owner and every stored overwrite in a single edit."""
+        everyone, mute_role, owner = "everyone", "mute", "owner"
+        channel = make_channel(
+            {everyone: FakeOverwrite(), mute_role: FakeOverwrite(stream=False), "old": FakeOverwrite()}
+        )
+
+        plan = OverwritePlan.from_channel(channel, keep=lambda target: target in (everyone, mute_role))
+        plan.set(owner, FakeOverwrite(connect=True, manage_messages=True))
+        for target_id in range(95):
+            plan.set(f"member-{target_id}", FakeOverwrite(connect=target_id % 2 == 0))
+        plan.set(None, FakeOverwrite(connect=True))
+        plan.merge(owner, FakeOverwrite(speak=True, connect=None))
+
+        changed, removed = plan.diff(channel.overwrites)
+        assert len(changed) == 96
+        assert removed == ["old"]
+
+        assert asyncio.run(plan.apply(channel, user_limit=5)) is True
+        channel.edit.assert_awaited_once()
+        fields = channel.edit.await_args.kwargs
+        assert fields["user_limit"] == 5
+        assert fields["overwrites"][owner] == FakeOverwrite(connect=True, manage_messages=True, speak=True)
+        assert fields["overwrites"][mute_role] == FakeOverwrite(stream=False)
+        assert len(fields["overwrites"]) == 98
+
+    @pytest.mark.unit
+    def test_unchanged_channel_sends_nothing(self):
+        """No request is made when overwrites and fields already match."""
+        channel = make_channel({"everyone": FakeOverwrite(), "mute": FakeOverwrite(stream=False)}, user_limit=4)
+
+        plan = OverwritePlan.from_channel(channel, keep=lambda target: target == "mute")
+        plan.set("everyone", FakeOverwrite())
+
+        assert asyncio.run(plan.apply(channel, user_limit=4)) is False
+        channel.edit.assert_not_awaited()
+
+        assert asyncio.run(plan.apply(channel, user_limit=2)) is True
+        assert "overwrites" not in channel.edit.await_args.kwargs
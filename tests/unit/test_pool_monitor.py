@@ -0,0 +1,83 @@
+"""Unit tests for connection pool settings and telemetry."""
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import QueuePool
+
+from core.performance.pool_monitor import (
+    PoolMonitor,
+    TimedCheckoutMixin,
+    load_pool_settings,
+    load_replica_pool_settings,
+)
+
+
+class TimedQueuePool(TimedCheckoutMixin, QueuePool):
+    """Synchronous queue pool with checkout timing."""
+
+
+@pytest.mark.unit
+class TestPoolMonitor:
+    """Test pool settings loading and checkout/pre-ping telemetry."""
+
+    @pytest.mark.unit
+    def test_settings_from_config_and_env(self, monkeypatch):
+        """Config values override defaults and environment variables override config."""
+        monkeypatch.delenv("DB_POOL_SIZE", raising=False)
+        monkeypatch.setenv("DB_MAX_OVERFLOW", "5")
+        settings = load_pool_settings({"database": {"pool_size": 8, "max_overflow": 50}})
+
+        assert settings["pool_size"] == 8
+        assert settings["max_overflow"] == 5
+        assert settings["pool_pre_ping"] is True
+
+    @pytest.mark.unit
+    def test_replica_keeps_its_own_pool_size(self, monkeypatch):
+        """The replica defaults to 10/20 regardless of the primary's sizing; other settings are shared."""
+        monkeypatch.delenv("DB_REPLICA_POOL_SIZE", raising=False)
+        monkeypatch.delenv("DB_REPLICA_MAX_OVERFLOW", raising=False)
+        primary = load_pool_settings({"database": {"pool_size": 20, "max_overflow": 40, "pool_timeout": 12}})
+
+        replica = load_replica_pool_settings({"database": {}}, primary)
+        assert (replica["pool_size"], replica["max_overflow"]) == (10, 20)
+        assert replica["pool_timeout"] == primary["pool_timeout"]
+        assert primary["pool_size"] == 20
+
+        monkeypatch.setenv("DB_REPLICA_POOL_SIZE", "4")
+        replica = load_replica_pool_settings({"database": {"replica": {"max_overflow": 6}}}, primary)
+        assert (replica["pool_size"], replica["max_overflow"]) == (4, 6)
+
+    @pytest.mark.unit
+    def test_records_checkouts_pings_and_gauges(self):
+        """Checkouts land in the histogram, pre-pings are timed and peak usage is tracked."""
+        engine = create_engine("sqlite://", poolclass=TimedQueuePool, pool_size=2, max_overflow=1, pool_pre_ping=True)
+        monitor = PoolMonitor("test", warn_threshold_ms=10_000)
+        monitor.install(engine)
+
+        for _ in range(3):
+            with engine.connect() as connection:
+                connection.execute(text("select 1"))
+        first, second = engine.connect(), engine.connect()
+        stats = monitor.get_stats()
+        first.close()
+        second.close()
+
+        assert stats["checkouts"] == 5
+        assert sum(stats["wait_histogram"].values()) == 5
+        assert stats["pings"] >= 2
+        assert stats["checked_out"] == 2
+        assert stats["peak_checked_out"] == 2
+        assert stats["slow_checkouts"] == 0
+
+    @pytest.mark.unit
+    def test_monitor_survives_dispose(self):
+        """A disposed pool is recreated with the same monitor attached."""
+        engine = create_engine("sqlite://", poolclass=TimedQueuePool)
+        monitor = PoolMonitor("test")
+        monitor.install(engine)
+
+        engine.dispose()
+        with engine.connect():
+            pass
+
+        assert engine.pool.monitor is monitor
+        assert monitor.checkouts == 1
@@ -0,0 +1,94 @@
+"""Unit tests for the shared premium status cache."""
+import asyncio
+import importlib
+
+import pytest
+
+from core.performance.tiered_cache import TieredCache
+
+tiered_cache_module = importlib.import_module("core.performance.tiered_cache")
+
+
+@pytest.fixture
+def premium_cache(load_service):
+    return load_service("premium_cache")
+
+
+@pytest.mark.unit
+class TestPremiumStatusCache:
+    """Test TTL, per-member invalidation and the namespace cap."""
+
+    @pytest.mark.unit
+    def test_entries_expire_after_their_ttl(self, premium_cache, monkeypatch):
+        """A cached status is served until its TTL runs out."""
+        cache = premium_cache.PremiumStatusCache(backend=TieredCache())
+        now = tiered_cache_module.time.time()
+        asyncio.run(cache.set("has_premium_role", 1, True, ttl=60))
+
+        assert asyncio.run(cache.get("has_premium_role", 1)) is True
+        monkeypatch.setattr(tiered_cache_module.time, "time", lambda: now + 61)
+        assert asyncio.run(cache.get("has_premium_role", 1)) is None
+
+    @pytest.mark.unit
+    def test_invalidate_member_drops_only_that_member(self, premium_cache):
+        """Every key of the member goes, other members stay; invalidate_all clears the rest."""
+        cache = premium_cache.PremiumStatusCache(backend=TieredCache())
+
+        async def run():
+            await cache.set("has_premium_role", 1, True)
+            await cache.set("member_roles", 1, [{"role_id": 10}])
+            await cache.set("has_premium_role", 2, False)
+            removed = await cache.invalidate_member(1)
+            after_member = [
+                await cache.get("has_premium_role", 1),
+                await cache.get("member_roles", 1),
+                await cache.get("has_premium_role", 2),
+            ]
+            await cache.invalidate_all()
+            return removed, after_member, await cache.get("has_premium_role", 2)
+
+        removed, after_member, after_all = asyncio.run(run())
+        assert removed == 2
+        assert after_member == [None, None, False]
+        assert after_all is None
+
+    @pytest.mark.unit
+    def test_roles_loaded_across_a_sale_are_not_cached(self, premium_cache):
+        """A load that overlaps the member's invalidation answers its caller but is reloaded next time."""
+        cache = premium_cache.PremiumStatusCache(backend=TieredCache())
+        versions = iter([[{"role_id": 10}], []])
+
+        async def run():
+            release = asyncio.Event()
+
+            async def slow_load():
+                await release.wait()
+                return next(versions)
+
+            pending = asyncio.create_task(cache.get_or_load("member_roles", 1, slow_load))
+            await asyncio.sleep(0)
+            await cache.invalidate_member(1)
+            release.set()
+            stale = await pending
+
+            async def load():
+                return next(versions)
+
+            return stale, await cache.get_or_load("member_roles", 1, load)
+
+        assert asyncio.run(run()) == ([{"role_id": 10}], [])
+
+    @pytest.mark.unit
+    def test_namespace_is_capped_in_the_shared_cache(self, premium_cache):
+        """The premium namespace evicts its own entries without touching others."""
+        backend = TieredCache()
+        backend.set_nowait("other", "keep", 1)
+        cache = premium_cache.PremiumStatusCache(max_size=2, backend=backend)
+
+        async def run():
+            for member_id in (1, 2, 3):
+                await cache.set("has_premium_role", member_id, True)
+
+        asyncio.run(run())
+        assert cache.get_stats()["current_size"] == 2
+        assert backend.get_nowait("other", "keep") == 1
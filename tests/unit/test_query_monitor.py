@@ -0,0 +1,78 @@
+"""Unit tests for engine-level query timing."""
+import asyncio
+
+import pytest
+from sqlalchemy import column, create_engine, lambda_stmt, select, table, text
+
+from core.performance.query_monitor import QueryTimingMonitor, fingerprint, track_queries
+
+
+@track_queries
+class ExampleQueries:
+    """Query class in the style of datasources.queries."""
+
+    @staticmethod
+    async def select_value(connection, value):
+        return connection.execute(text(f"SELECT {value}")).fetchall()
+
+
+@pytest.mark.unit
+class TestQueryMonitor:
+    """Test fingerprints, per-statement counters and origin attribution."""
+
+    @pytest.mark.unit
+    def test_fingerprint_normalizes_literals_and_lists(self):
+        """Literals and parameter lists do not create separate fingerprints."""
+        assert fingerprint("SELECT * FROM t WHERE id IN ($1, $2, $3) AND name = 'it''s'  AND n > 10") == (
+            "SELECT * FROM t WHERE id IN (...) AND name = ? AND n > ?"
+        )
+        assert fingerprint("SELECT t1.id FROM t1 WHERE t1.id = $1::BIGINT") == (
+            "SELECT t1.id FROM t1 WHERE t1.id = $1::BIGINT"
+        )
+
+    @pytest.mark.unit
+    def test_groups_statements_and_attributes_origin(self):
+        """Statements differing only in literals share stats; the calling query method is recorded."""
+        engine = create_engine("sqlite://")
+        monitor = QueryTimingMonitor()
+        monitor.install(engine)
+
+        async def run():
+            with engine.connect() as connection:
+                for value in range(5):
+                    await ExampleQueries.select_value(connection, value)
+                connection.execute(text("SELECT 42"))
+
+        asyncio.run(run())
+        stats = monitor.get_stats()
+
+        assert stats["total_queries"] == 6
+        assert stats["fingerprints"] == 1
+        statement = stats["statements"][0]
+        assert statement["count"] == 6
+        assert statement["origins"] == {"ExampleQueries.select_value": 5, "<unknown>": 1}
+        assert 0 <= statement["p50_ms"] <= statement["p99_ms"] <= statement["max_ms"]
+
+        monitor.reset()
+        assert monitor.get_stats()["total_queries"] == 0
+
+    @pytest.mark.unit
+    def test_reports_compiled_cache_hits(self):
+        """Repeated statement shapes, including lambda statements, reuse SQLAlchemy's compiled form."""
+        engine = create_engine("sqlite://")
+        monitor = QueryTimingMonitor()
+        monitor.install(engine)
+        values = table("numbers", column("value"))
+
+        with engine.connect() as connection:
+            connection.exec_driver_sql("CREATE TABLE numbers (value INTEGER)")
+            monitor.reset()
+            for value in range(3):
+                connection.execute(select(values.c.value).where(values.c.value == value))
+                connection.execute(lambda_stmt(lambda: select(values.c.value).where(values.c.value > value)))
+
+        stats = monitor.get_stats()
+        assert stats["total_queries"] == 6
+        assert stats["compiled_cache_hit_ratio"] == pytest.approx(4 / 6)
+        ratios = [statement["compiled_cache_hit_ratio"] for statement in stats["statements"]]
+        assert ratios == pytest.approx([2 / 3, 2 / 3])
@@ -0,0 +1,130 @@
+"""Unit tests for the in-memory activity ranking index."""
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from types import ModuleType
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import BigInteger, DateTime, Integer
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Activity(Base):
+    __tablename__ = "activity"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    member_id: Mapped[int] = mapped_column(BigInteger)
+    date: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    points: Mapped[int] = mapped_column(Integer)
+
+
+@pytest.fixture
+def activity_queries():
+    module = ModuleType("datasources.queries.activity_queries")
+    module.upsert_activity_points = AsyncMock()
+    module.rebuild_activity_summary = AsyncMock(return_value=0)
+    return module
+
+
+@pytest.fixture
+def activity_buffer(load_service, activity_queries):
+    return load_service("activity_buffer", stubs={"datasources.queries.activity_queries": activity_queries})
+
+
+@pytest.fixture
+def ranking(load_service, activity_buffer, monkeypatch):
+    module = load_service("ranking_index")
+    monkeypatch.setattr(module, "Activity", Activity)
+    return module
+
+
+def session_factory(rows, before_result=None):
+    """Session factory whose query returns ``rows``, awaiting ``before_result`` while the query is in flight."""
+
+    async def execute(statement):
+        if before_result:
+            await before_result()
+        result = MagicMock()
+        result.all.return_value = rows
+        return result
+
+    @asynccontextmanager
+    async def factory():
+        session = MagicMock()
+        session.execute = AsyncMock(side_effect=execute)
+        session.commit = AsyncMock()
+        session.rollback = AsyncMock()
+        yield session
+
+    return factory
+
+
+@pytest.mark.unit
+class TestRankingIndex:
+    """Test ordering, ties, rolling windows and buffered reloads."""
+
+    @pytest.mark.unit
+    def test_window_orders_by_points_then_member_id(self, ranking):
+        """Ties are broken by member ID; adjusting a member moves them to their new place."""
+        window = ranking.RankingWindow(7)
+        window.rebuild({3: 50, 1: 50, 2: 80, 4: 0})
+
+        assert window.top(10) == [(2, 80, 1), (1, 50, 2), (3, 50, 3)]
+        assert window.position(4) == 0
+
+        window.adjust(3, 30)
+        assert window.top(2) == [(2, 80, 1), (3, 80, 2)]
+        assert window.position(1) == 3
+
+        window.adjust(2, -80)
+        assert window.position(2) == 0
+        assert window.top(10) == [(3, 80, 1), (1, 50, 2)]
+
+    @pytest.mark.unit
+    def test_points_count_only_in_windows_containing_their_day(self, ranking):
+        """An increment ten days old counts for 30 days but not for 7; tiers follow positions."""
+        index = ranking.ActivityRankingIndex(windows=(7, 30))
+        asyncio.run(index.load(session_factory([])))
+        today = ranking.activity_day()
+
+        index.add_points(1, 10, today)
+        index.add_points(2, 25, today - timedelta(days=10))
+
+        assert index.get_leaderboard(days_back=7) == [(1, 10, 1)]
+        assert index.get_leaderboard(days_back=30) == [(2, 25, 1), (1, 10, 2)]
+        assert index.get_tier(2, days_back=30) == "100"
+        assert index.get_tier(2, days_back=7) == ranking.UNRANKED
+
+    @pytest.mark.unit
+    def test_buffered_load_counts_every_point_once(self, ranking, activity_buffer, activity_queries):
+        """Buffered points are flushed first; points added during the load are applied once, after it."""
+        today = ranking.activity_day()
+        factory = session_factory([])
+        buffer = activity_buffer.ActivityPointsBuffer(factory)
+        index = ranking.ActivityRankingIndex(windows=(7,))
+
+        async def run():
+            flushes = []
+            buffer.add(1, "text", 5)
+
+            async def during_query():
+                # The tracking service feeds the buffer and the index together
+                buffer.add(2, "text", 7)
+                index.add_points(2, 7)
+                flushes.append(asyncio.create_task(buffer.flush()))
+                await asyncio.sleep(0)
+
+            # Member 1's points were flushed before the query, so the rows include them
+            await index.load(session_factory([(1, today, 5)], before_result=during_query), buffer=buffer)
+            assert activity_queries.upsert_activity_points.await_count == 1
+            await asyncio.gather(*flushes)
+
+        asyncio.run(run())
+        assert index.get_leaderboard() == [(2, 7, 1), (1, 5, 2)]
+        assert activity_queries.upsert_activity_points.await_count == 2
+        assert buffer.pending_count == 0
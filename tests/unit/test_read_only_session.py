@@ -0,0 +1,71 @@
+"""Unit tests for the read-only session used by get_read_db."""
+import importlib.util
+from pathlib import Path
+
+import pytest
+from sqlalchemy import Integer, String, create_engine, select
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, sessionmaker
+
+# ``datasources`` is stubbed for the test run, so load the module from its file
+SESSIONS_PATH = Path(__file__).resolve().parents[2] / "datasources" / "sessions.py"
+spec = importlib.util.spec_from_file_location("datasources_sessions", SESSIONS_PATH)
+sessions = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(sessions)
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Note(Base):
+    __tablename__ = "notes"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    text: Mapped[str] = mapped_column(String)
+
+
+@pytest.fixture
+def read_session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(Note.__table__.insert(), [{"id": 1, "text": "first"}])
+
+    factory = sessionmaker(engine, class_=sessions.ReadOnlySession, autoflush=False, expire_on_commit=False)
+    with factory() as session:
+        yield session
+    engine.dispose()
+
+
+@pytest.mark.unit
+class TestReadOnlySession:
+    """Test that reads work and every kind of pending write is rejected."""
+
+    @pytest.mark.unit
+    def test_reads_and_empty_flushes_pass(self, read_session):
+        """Queries run and flushing with nothing pending is a no-op."""
+        assert read_session.scalars(select(Note.text)).all() == ["first"]
+        read_session.flush()
+
+    @pytest.mark.unit
+    def test_new_objects_are_rejected(self, read_session):
+        """Adding an object fails at flush time."""
+        read_session.add(Note(id=2, text="second"))
+        with pytest.raises(InvalidRequestError, match="read-only"):
+            read_session.flush()
+
+    @pytest.mark.unit
+    def test_changes_and_deletes_are_rejected(self, read_session):
+        """Modifying or deleting a loaded row fails the flush and leaves the table as it was."""
+        note = read_session.get(Note, 1)
+        note.text = "changed"
+        with pytest.raises(InvalidRequestError, match="read-only"):
+            read_session.flush()
+
+        read_session.rollback()
+        read_session.delete(read_session.get(Note, 1))
+        with pytest.raises(InvalidRequestError, match="read-only"):
+            read_session.commit()
+        read_session.rollback()
+        assert read_session.scalars(select(Note.text)).all() == ["first"]
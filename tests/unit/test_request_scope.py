@@ -0,0 +1,128 @@
+"""Unit tests for the per-session request scope."""
+import importlib
+import sys
+from types import ModuleType, SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+# Modules imported by request_scope; the services pull in the real discord.py
+SERVICE_MODULES = [
+    "core.containers.unit_of_work",
+    "core.interfaces.activity_interfaces",
+    "core.interfaces.member_interfaces",
+    "core.interfaces.messaging_interfaces",
+    "core.interfaces.premium_interfaces",
+    "core.interfaces.role_interfaces",
+    "core.interfaces.team_interfaces",
+    "core.interfaces.voice_interfaces",
+    "core.services.activity_tracking_service",
+    "core.services.autokick_service",
+    "core.services.member_service",
+    "core.services.message_sender_service",
+    "core.services.notification_service",
+    "core.services.payment_processor_service",
+    "core.services.premium_service",
+    "core.services.role_service",
+    "core.services.team_management_service",
+    "core.services.voice_channel_service",
+]
+REPOSITORIES = {
+    "core.repositories.activity_repository": ["ActivityRepository"],
+    "core.repositories.channel_repository": ["ChannelRepository"],
+    "core.repositories.invite_repository": ["InviteRepository"],
+    "core.repositories.member_repository": ["MemberRepository"],
+    "core.repositories.moderation_repository": ["ModerationRepository"],
+    "core.repositories.premium_repository": ["PaymentRepository", "PremiumRepository"],
+    "core.repositories.role_repository": ["RoleRepository"],
+}
+
+
+class Repository:
+    def __init__(self, session):
+        self.session = session
+
+
+@pytest.fixture
+def request_scope(monkeypatch):
+    for name in SERVICE_MODULES:
+        monkeypatch.setitem(sys.modules, name, MagicMock())
+    for name, classes in REPOSITORIES.items():
+        module = ModuleType(name)
+        for class_name in classes:
+            setattr(module, class_name, type(class_name, (Repository,), {}))
+        monkeypatch.setitem(sys.modules, name, module)
+    monkeypatch.delitem(sys.modules, "core.containers.request_scope", raising=False)
+    return importlib.import_module("core.containers.request_scope")
+
+
+def make_bot(request_scope):
+    """Bot whose container builds a unit of work holding one repository of each kind."""
+
+    def create_unit_of_work(session):
+        return SimpleNamespace(
+            members=request_scope.MemberRepository(session),
+            activities=request_scope.ActivityRepository(session),
+            invites=request_scope.InviteRepository(session),
+            moderation=request_scope.ModerationRepository(session),
+            roles=request_scope.RoleRepository(session),
+        )
+
+    container = MagicMock()
+    container.create_unit_of_work.side_effect = create_unit_of_work
+    return SimpleNamespace(service_container=container, guild=None, activity_buffer=None, ranking_index=None)
+
+
+def make_session():
+    return SimpleNamespace(info={})
+
+
+@pytest.mark.unit
+class TestRequestScope:
+    """Test that each session gets one scope and each service is built once per scope."""
+
+    @pytest.mark.unit
+    def test_scope_is_attached_to_its_session(self, request_scope):
+        """The same session returns the same scope; another session or bot gets a new one."""
+        bot = make_bot(request_scope)
+        session = make_session()
+        scope = request_scope.RequestScope.for_session(bot, session)
+
+        assert request_scope.RequestScope.for_session(bot, session) is scope
+        assert request_scope.RequestScope.for_session(bot, make_session()) is not scope
+        assert request_scope.RequestScope.for_session(make_bot(request_scope), session) is not scope
+
+    @pytest.mark.unit
+    def test_services_and_unit_of_work_are_built_once(self, request_scope):
+        """Services share one unit of work, and a service needed by another is not built twice."""
+        bot = make_bot(request_scope)
+        scope = request_scope.RequestScope(bot, make_session())
+
+        payments = scope.payments
+        assert scope.payments is payments
+        assert scope.premium is scope.premium
+        payments.set_premium_service.assert_called_once_with(scope.premium)
+        assert scope.roles is scope.get(request_scope.IRoleService)
+        bot.service_container.create_unit_of_work.assert_called_once()
+
+    @pytest.mark.unit
+    def test_repositories_are_shared_with_the_unit_of_work(self, request_scope):
+        """Repositories the unit of work created are reused; others are created once for the session."""
+        session = make_session()
+        scope = request_scope.RequestScope(make_bot(request_scope), session)
+        members = scope.unit_of_work.members
+
+        assert scope.repository(request_scope.MemberRepository) is members
+        premium = scope.repository(request_scope.PremiumRepository)
+        assert premium.session is session
+        assert scope.repository(request_scope.PremiumRepository) is premium
+
+    @pytest.mark.unit
+    def test_session_less_services_come_from_the_container(self, request_scope):
+        """Services without a factory are looked up in the bot's container once per scope."""
+        bot = make_bot(request_scope)
+        scope = request_scope.RequestScope(bot, make_session())
+        embed_builder_type = request_scope.IEmbedBuilder
+
+        assert scope.get(embed_builder_type) is scope.get(embed_builder_type)
+        bot.service_container.get_service.assert_called_once_with(embed_builder_type)
@@ -0,0 +1,81 @@
+"""Unit tests for config-derived role ID sets."""
+from types import SimpleNamespace
+
+import pytest
+
+from utils.role_ids import RoleIdIndex
+
+CONFIG = {
+    "mute_roles": [
+        {"id": 11, "name": "⌀", "description": "send_messages_off"},
+        {"id": 12, "name": "♺", "description": "points_off"},
+    ],
+    "premium_roles": [
+        {"name": "zG50"},
+        {"name": "zG500", "auto_kick": 20},
+    ],
+}
+
+
+def role(role_id, name):
+    """Build a minimal role-like object."""
+    return SimpleNamespace(id=role_id, name=name)
+
+
+def member(*roles):
+    """Build a member-like object exposing roles and get_role."""
+    by_id = {r.id: r for r in roles}
+    return SimpleNamespace(roles=list(roles), get_role=by_id.get)
+
+
+GUILD = SimpleNamespace(roles=[role(12, "♺"), role(50, "zG50"), role(500, "zG500"), role(7, "other")])
+
+
+@pytest.mark.unit
+class TestRoleIdIndex:
+    """Test role ID resolution and membership checks."""
+
+    @pytest.mark.unit
+    def test_points_off_from_config_ids(self):
+        """points_off is resolved from config IDs even before guild resolution."""
+        index = RoleIdIndex(CONFIG)
+        assert index.points_off_ids == frozenset({12})
+        assert index.has_points_off(member(role(12, "renamed"))) is True
+        assert index.has_points_off(member(role(11, "⌀"))) is False
+
+    @pytest.mark.unit
+    def test_points_off_falls_back_to_default_name(self):
+        """Without a config entry, the default role name is used."""
+        index = RoleIdIndex({})
+        assert index.has_points_off(member(role(99, "♺"))) is True
+
+        index.resolve(SimpleNamespace(roles=[role(99, "♺")]))
+        assert index.points_off_ids == frozenset({99})
+
+    @pytest.mark.unit
+    def test_premium_resolved_by_guild_role_names(self):
+        """Premium role names are mapped to guild role IDs."""
+        index = RoleIdIndex(CONFIG)
+        index.resolve(GUILD)
+
+        assert index.premium_ids == frozenset({50, 500})
+        assert index.has_premium(member(role(500, "zG500"))) is True
+        assert index.has_premium(member(role(7, "other"))) is False
+        assert [c["name"] for c in index.premium_roles_of(member(role(500, "zG500")))] == ["zG500"]
+
+    @pytest.mark.unit
+    def test_checks_by_name_before_resolution(self):
+        """Before a guild is resolved, checks fall back to role names."""
+        index = RoleIdIndex(CONFIG)
+        assert index.has_premium(member(role(1, "zG50"))) is True
+        assert index.has_any_named(member(role(1, "zG50")), ["zG500"]) is False
+
+    @pytest.mark.unit
+    def test_ids_for_names_is_cached_and_reset_on_resolve(self):
+        """Name lookups are cached until the next resolve."""
+        index = RoleIdIndex(CONFIG)
+        index.resolve(GUILD)
+        assert index.ids_for_names(["zG50", "zG500"]) is index.ids_for_names(["zG500", "zG50"])
+
+        index.resolve(SimpleNamespace(roles=[role(51, "zG50")]))
+        assert index.ids_for_names(["zG50"]) == frozenset({51})
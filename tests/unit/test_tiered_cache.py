@@ -0,0 +1,186 @@
+"""Unit tests for the size-bounded tiered cache."""
+import asyncio
+
+import pytest
+
+from core.performance.tiered_cache import ENTRY_OVERHEAD_BYTES, RedisTier, TieredCache, estimate_size
+
+
+@pytest.mark.unit
+class TestTieredCache:
+    """Test namespaces, size-based eviction, tags and single-flight loading."""
+
+    @pytest.mark.unit
+    def test_namespaces_are_separate(self):
+        """The same key in two namespaces holds two values."""
+        cache = TieredCache()
+        cache.set_nowait("a", "key", 1)
+        cache.set_nowait("b", "key", 2)
+
+        assert cache.get_nowait("a", "key") == 1
+        assert cache.get_nowait("b", "key") == 2
+        assert cache.invalidate_namespace_nowait("a") == 1
+        assert cache.get_nowait("a", "key") is None
+        assert cache.get_nowait("b", "key") == 2
+
+    @pytest.mark.unit
+    def test_evicts_least_recently_used_by_size(self):
+        """Large values push out the least recently used entries once the byte budget is exceeded."""
+        value = "x" * 1000
+        entry_size = estimate_size(value) + ENTRY_OVERHEAD_BYTES
+        cache = TieredCache(max_bytes=entry_size * 3)
+
+        for key in ("a", "b", "c"):
+            cache.set_nowait("ns", key, value)
+        cache.get_nowait("ns", "a")
+        cache.set_nowait("ns", "d", value)
+
+        assert cache.keys("ns") == ["c", "a", "d"]
+        assert cache.get_stats()["bytes"] <= cache.max_bytes
+        assert cache.get_stats()["evictions"] == 1
+
+    @pytest.mark.unit
+    def test_namespace_limit(self):
+        """A namespace limit evicts only within that namespace."""
+        cache = TieredCache()
+        cache.set_namespace_limit("small", 2)
+        cache.set_nowait("other", "keep", 0)
+        for i in range(5):
+            cache.set_nowait("small", str(i), i)
+
+        assert cache.keys("small") == ["3", "4"]
+        assert cache.get_nowait("other", "keep") == 0
+        assert cache.namespace_stats("small")["evictions"] == 3
+
+    @pytest.mark.unit
+    def test_namespace_limit_applies_to_existing_entries(self):
+        """A limit set on a populated namespace keeps its most recently used keys."""
+        cache = TieredCache()
+        for key in ("a", "b", "c"):
+            cache.set_nowait("ns", key, key)
+        cache.get_nowait("ns", "a")
+        cache.set_namespace_limit("ns", 2)
+
+        assert cache.keys("ns") == ["c", "a"]
+        assert cache.namespace_stats("ns")["current_size"] == 2
+
+    @pytest.mark.unit
+    def test_tags_span_namespaces(self):
+        """Tag invalidation removes entries across namespaces and keeps byte accounting exact."""
+        cache = TieredCache()
+        cache.set_nowait("a", "1", [1, 2, 3], tags={"member:1"})
+        cache.set_nowait("b", "1", {"x": 1}, tags={"member:1"})
+        cache.set_nowait("b", "2", "keep", tags={"member:2"})
+
+        assert cache.invalidate_tags_nowait("member:1") == 2
+        assert len(cache) == 1
+        assert cache.get_stats()["bytes"] == cache.namespace_stats("b")["bytes"]
+
+    @pytest.mark.unit
+    def test_expired_entries_are_misses(self):
+        """Expired entries are dropped on read and by remove_expired."""
+        cache = TieredCache()
+        cache.set_nowait("ns", "old", 1, expires_at=1.0)
+        cache.set_nowait("ns", "also_old", 2, expires_at=1.0)
+
+        assert cache.get_nowait("ns", "old") is None
+        assert cache.remove_expired() == 1
+        assert len(cache) == 0
+
+    @pytest.mark.unit
+    def test_get_or_set_loads_once(self):
+        """Concurrent misses share one loader call."""
+        cache = TieredCache()
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "value"
+
+        async def run():
+            results = await asyncio.gather(*(cache.get_or_set("ns", "key", load) for _ in range(10)))
+            cache.stop_cleanup()
+            return results
+
+        assert asyncio.run(run()) == ["value"] * 10
+        assert calls == 1
+        assert cache.get_stats()["coalesced_loads"] == 9
+
+    @pytest.mark.unit
+    def test_invalidation_discards_only_matching_inflight_loads(self):
+        """A load overlapping an invalidation of its key, tag or namespace is not stored; other loads are."""
+        cache = TieredCache()
+
+        async def run():
+            release = asyncio.Event()
+
+            async def load(value):
+                await release.wait()
+                return value
+
+            loads = {
+                name: asyncio.create_task(cache.get_or_set(namespace, "key", lambda v=name: load(v), tags=tags))
+                for name, namespace, tags in (
+                    ("deleted", "a", None),
+                    ("tagged", "b", {"member:1"}),
+                    ("namespace", "c", None),
+                    ("untouched", "d", {"member:2"}),
+                )
+            }
+            await asyncio.sleep(0)
+            cache.delete_nowait("a", "key")
+            cache.invalidate_tags_nowait("member:1")
+            cache.invalidate_namespace_nowait("c")
+            cache.invalidate_namespace_nowait("other")
+            release.set()
+            results = {name: await task for name, task in loads.items()}
+            cache.stop_cleanup()
+            return results
+
+        assert asyncio.run(run()) == {name: name for name in ("deleted", "tagged", "namespace", "untouched")}
+        assert [cache.get_nowait(namespace, "key") for namespace in "abcd"] == [None, None, None, "untouched"]
+        assert cache.get_stats()["inflight_loads"] == 0
+
+    @pytest.mark.unit
+    def test_waiters_share_a_failed_load(self):
+        """Concurrent callers see the loader's exception; the next call loads again."""
+        cache = TieredCache()
+        calls = 0
+
+        async def failing():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        async def run():
+            results = await asyncio.gather(
+                *(cache.get_or_set("ns", "key", failing) for _ in range(3)), return_exceptions=True
+            )
+            again = await cache.get_or_set("ns", "key", lambda: "loaded")
+            cache.stop_cleanup()
+            return results, again
+
+        results, again = asyncio.run(run())
+        assert all(isinstance(result, ValueError) for result in results)
+        assert calls == 1
+        assert again == "loaded"
+
+    @pytest.mark.unit
+    def test_estimate_size_grows_with_content(self):
+        """Size estimates reflect nested content, not just the container."""
+        small = [{"id": i} for i in range(10)]
+        large = [{"id": i, "name": "x" * 100} for i in range(1000)]
+        assert estimate_size(large) > 50 * estimate_size(small)
+
+    @pytest.mark.unit
+    def test_l2_mirrors_only_plain_data_namespaces(self):
+        """Configured namespaces outside the allowlist are never pickled into Redis."""
+        tier = RedisTier("redis://localhost", ["premium", "queries"])
+        tier._client = object()
+
+        assert tier.namespaces == frozenset({"premium"})
+        assert tier.handles("premium")
+        assert not tier.handles("queries")
@@ -0,0 +1,117 @@
+"""Unit tests for the per-member voice event pipeline."""
+import asyncio
+import sys
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+if not hasattr(sys.modules["discord"], "PermissionOverwrite"):
+    sys.modules["discord"].PermissionOverwrite = MagicMock
+
+from utils.voice.event_pipeline import VoiceEventPipeline  # noqa: E402
+
+
+def state(channel):
+    return SimpleNamespace(channel=channel)
+
+
+def member(member_id):
+    return SimpleNamespace(id=member_id)
+
+
+async def settle(pipeline, rounds=20):
+    """Let timers fire and workers finish."""
+    for _ in range(rounds):
+        await asyncio.sleep(0.01)
+        if not pipeline._pending and not pipeline._busy:
+            return
+
+
+@pytest.mark.unit
+class TestVoiceEventPipeline:
+    """Test coalescing, per-member ordering and handler isolation."""
+
+    @pytest.mark.unit
+    def test_burst_is_coalesced_into_one_update(self):
+        """Join, leave, join within the window reaches handlers as one move with every channel left."""
+        pipeline = VoiceEventPipeline(window=0.02, workers=2)
+        updates = []
+
+        async def handler(update):
+            updates.append(update)
+
+        async def run():
+            pipeline.subscribe(handler)
+            pipeline.start()
+            alice = member(1)
+            await pipeline.submit(alice, state("A"), state("create"))
+            await pipeline.submit(alice, state("create"), state(None))
+            await pipeline.submit(alice, state(None), state("B"))
+            await settle(pipeline)
+            await pipeline.stop()
+
+        asyncio.run(run())
+        assert len(updates) == 1
+        update = updates[0]
+        assert (update.before.channel, update.after.channel) == ("A", "B")
+        assert update.channels_left == ["A", "create"]
+        assert update.events == 3
+        assert pipeline.get_stats()["coalesced"] == 2
+
+    @pytest.mark.unit
+    def test_updates_of_one_member_never_overlap(self):
+        """Events arriving while a member's update runs are handed out only after it finished."""
+        pipeline = VoiceEventPipeline(window=0, workers=4)
+        running = set()
+        overlaps = []
+        seen = []
+
+        async def handler(update):
+            if update.member.id in running:
+                overlaps.append(update.member.id)
+            running.add(update.member.id)
+            await asyncio.sleep(0.01)
+            seen.append((update.member.id, update.after.channel))
+            running.discard(update.member.id)
+
+        async def run():
+            pipeline.subscribe(handler)
+            pipeline.start()
+            alice, bob = member(1), member(2)
+            await pipeline.submit(alice, state(None), state("A"))
+            await pipeline.submit(bob, state(None), state("X"))
+            await asyncio.sleep(0)
+            await pipeline.submit(alice, state("A"), state("B"))
+            await pipeline.submit(alice, state("B"), state("C"))
+            await settle(pipeline)
+            await pipeline.stop()
+
+        asyncio.run(run())
+        assert overlaps == []
+        assert [channel for member_id, channel in seen if member_id == 1] == ["A", "C"]
+        assert (2, "X") in seen
+
+    @pytest.mark.unit
+    def test_failing_handler_does_not_stop_the_others(self):
+        """A handler error is counted and later handlers still run."""
+        pipeline = VoiceEventPipeline(window=0, workers=1)
+        calls = []
+
+        async def failing(update):
+            raise RuntimeError("boom")
+
+        async def recording(update):
+            calls.append(update.member.id)
+
+        async def run():
+            pipeline.subscribe(failing)
+            pipeline.subscribe(recording)
+            pipeline.start()
+            await pipeline.submit(member(1), state(None), state("A"))
+            await settle(pipeline)
+            await pipeline.stop()
+
+        asyncio.run(run())
+        assert calls == [1]
+        assert pipeline.get_stats()["handler_errors"] == 1
@@ -0,0 +1,104 @@
+"""Unit tests for the per-owner voice permission snapshot cache."""
+import asyncio
+
+import pytest
+
+from core.performance.voice_permission_cache import VoicePermissionCache
+
+
+@pytest.mark.unit
+class TestVoicePermissionCache:
+    """Test hits, in-flight deduplication, invalidation and eviction."""
+
+    @pytest.mark.unit
+    def test_concurrent_misses_share_one_load(self):
+        """Concurrent lookups of the same owner run the loader once; later lookups are hits."""
+        cache = VoicePermissionCache()
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            await asyncio.sleep(0)
+            return ((10, "overwrite"),)
+
+        async def run():
+            first, second = await asyncio.gather(cache.get_or_load(1, loader), cache.get_or_load(1, loader))
+            third = await cache.get_or_load(1, loader)
+            return first, second, third
+
+        first, second, third = asyncio.run(run())
+        assert first is second is third
+        assert len(calls) == 1
+        assert cache.get_stats()["hits"] == 1
+
+    @pytest.mark.unit
+    def test_invalidation_during_load_is_not_hidden(self):
+        """A load that overlaps an invalidation answers its caller but is not cached."""
+        cache = VoicePermissionCache()
+        versions = iter(["old", "new"])
+
+        async def run():
+            started = asyncio.Event()
+            release = asyncio.Event()
+
+            async def slow_loader():
+                started.set()
+                await release.wait()
+                return next(versions)
+
+            pending = asyncio.create_task(cache.get_or_load(1, slow_loader))
+            await started.wait()
+            cache.invalidate(1)
+            release.set()
+            stale = await pending
+
+            async def loader():
+                return next(versions)
+
+            return stale, await cache.get_or_load(1, loader)
+
+        assert asyncio.run(run()) == ("old", "new")
+
+    @pytest.mark.unit
+    def test_invalidate_and_lru_eviction(self):
+        """Invalidated owners reload; the least recently used owner is evicted past the limit."""
+        cache = VoicePermissionCache(max_owners=2)
+        loads = []
+
+        def loader_for(owner_id):
+            async def loader():
+                loads.append(owner_id)
+                return owner_id
+
+            return loader
+
+        async def run():
+            await cache.get_or_load(1, loader_for(1))
+            await cache.get_or_load(2, loader_for(2))
+            await cache.get_or_load(1, loader_for(1))
+            await cache.get_or_load(3, loader_for(3))
+            assert 2 not in cache and 1 in cache and 3 in cache
+
+            cache.invalidate(1)
+            await cache.get_or_load(1, loader_for(1))
+
+        asyncio.run(run())
+        assert loads == [1, 2, 3, 1]
+
+    @pytest.mark.unit
+    def test_prefetch_fills_the_cache(self):
+        """A prefetched snapshot is served without running the caller's loader."""
+        cache = VoicePermissionCache()
+
+        async def loader():
+            return "prefetched"
+
+        async def unused_loader():
+            raise AssertionError("loader should not run")
+
+        async def run():
+            cache.prefetch(1, loader)
+            await asyncio.sleep(0)
+            return await cache.get_or_load(1, unused_loader)
+
+        assert asyncio.run(run()) == "prefetched"
@@ -5,8 +5,18 @@ from typing import Optional
 
 from aiohttp import web
 
+from core.performance.autokick_index import autokick_index
+from core.performance.database_optimizer import db_optimizer
+from core.performance.member_cache import member_cache
+from core.performance.n_plus_one import n_plus_one_detector
+from core.performance.query_monitor import query_monitor
+from core.performance.voice_permission_cache import voice_permission_cache
+
 logger = logging.getLogger(__name__)
 
+# Upper bound for the number of query fingerprints returned by /stats
+MAX_STATS_LIMIT = 200
+
 
 class HealthCheckServer:
     """Simple HTTP server for health checks."""
@@ -24,6 +34,7 @@ class HealthCheckServer:
         self.app.router.add_get("/health", self.health_check)
         self.app.router.add_get("/ready", self.readiness_check)
         self.app.router.add_get("/startup", self.startup_check)
+        self.app.router.add_get("/stats", self.stats)
 
     async def health_check(self, request):
         """Liveness probe - checks if bot process is alive."""
@@ -75,6 +86,39 @@ class HealthCheckServer:
             logger.error(f"Startup check failed: {e}")
             return web.Response(text=str(e), status=503)
 
+    async def stats(self, request):
+        """Internal cache and buffer statistics as JSON."""
+        try:
+            limit = min(max(int(request.query.get("limit", 20)), 1), MAX_STATS_LIMIT)
+        except ValueError:
+            return web.Response(text="limit must be an integer", status=400)
+
+        try:
+            stats = {}
+            if hasattr(self.bot, "cache"):
+                stats["cache"] = self.bot.cache.get_stats()
+            stats["db_results"] = db_optimizer.get_cache_stats()
+            stats["queries"] = query_monitor.get_stats(limit=limit, sort_by=request.query.get("sort", "total_ms"))
+            stats["member_cache"] = member_cache.get_stats()
+            stats["voice_permissions"] = voice_permission_cache.get_stats()
+            stats["autokicks"] = autokick_index.get_stats()
+            if n_plus_one_detector.enabled:
+                stats["n_plus_one"] = n_plus_one_detector.get_stats()
+            if hasattr(self.bot, "voice_events"):
+                stats["voice_events"] = self.bot.voice_events.get_stats()
+            if hasattr(self.bot, "pool_monitor"):
+                stats["db_pool"] = self.bot.pool_monitor.get_stats()
+            if getattr(self.bot, "read_pool_monitor", None) is not None:
+                stats["db_read_pool"] = self.bot.read_pool_monitor.get_stats()
+            if hasattr(self.bot, "premium_cache"):
+                stats["premium_cache"] = self.bot.premium_cache.get_stats()
+            if hasattr(self.bot, "activity_buffer"):
+                stats["activity_buffer"] = self.bot.activity_buffer.get_stats()
+            return web.json_response(stats)
+        except Exception as e:
+            logger.error(f"Stats endpoint failed: {e}")
+            return web.Response(text=str(e), status=500)
+
     async def start(self):
         """Start the health check server."""
         try:
@@ -0,0 +1,69 @@
+"""Compiled multi-keyword matcher for scanning Discord activity text."""
+
+import re
+from functools import lru_cache
+from typing import Iterable, List, NamedTuple, Optional, Sequence
+
+# Activity attributes that can carry user-written text, in scan order
+ACTIVITY_FIELDS = ("name", "details", "state")
+
+
+class KeywordMatch(NamedTuple):
+    """A keyword found in one activity field."""
+
+    activity: object
+    field: str
+    keyword: str
+    content: str
+
+
+class KeywordMatcher:
+    """
+    Case-insensitive matcher built once from a keyword list.
+
+    All keywords are compiled into a single alternation (longest first), so a
+    text is scanned once regardless of how many keywords are configured.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        # Deduplicate while keeping order; matching is case-insensitive
+        self.keywords = tuple(dict.fromkeys(keyword.lower() for keyword in keywords if keyword))
+        alternatives = sorted(self.keywords, key=len, reverse=True)
+        # Text is lower-cased before matching; cheaper than a re.IGNORECASE pattern
+        self._pattern = re.compile("|".join(map(re.escape, alternatives))) if alternatives else None
+
+    def search(self, text: Optional[str]) -> Optional[str]:
+        """Return the first keyword found in ``text`` (lower-cased), or None."""
+        if not text or self._pattern is None:
+            return None
+        match = self._pattern.search(text.lower())
+        return match.group(0) if match else None
+
+    def contains_any(self, text: Optional[str]) -> bool:
+        """Check whether ``text`` contains any keyword."""
+        return self.search(text) is not None
+
+    def scan_activities(self, activities: Optional[Sequence]) -> List[KeywordMatch]:
+        """Find every keyword in the name, details and state of all activities, one regex pass per field."""
+        if not activities or self._pattern is None:
+            return []
+
+        search = self._pattern.search
+        matches = []
+        for activity in activities:
+            for field in ACTIVITY_FIELDS:
+                value = getattr(activity, field, None)
+                if not value or not isinstance(value, str):
+                    continue
+                lowered = value.lower()
+                # Most statuses match nothing; only collect all matches after a hit
+                if search(lowered):
+                    for match in self._pattern.finditer(lowered):
+                        matches.append(KeywordMatch(activity, field, match.group(0), value))
+        return matches
+
+
+@lru_cache(maxsize=32)
+def shared_matcher(*keywords: str) -> KeywordMatcher:
+    """Matcher for ``keywords``, compiled on first use and reused by every caller."""
+    return KeywordMatcher(keywords)
@@ -12,10 +12,14 @@ from discord.ext import commands
 
 from core.repositories import InviteRepository
 from datasources.queries import MemberQueries
+from utils.keyword_matcher import shared_matcher
 from utils.message_sender import MessageSender
 
 logger = logging.getLogger(__name__)
 
+# Invite that must be in a member's status for alternative bypass access
+INVITE_STATUS_MATCHER = shared_matcher("discord.gg/zagadka")
+
 
 class CommandTier(IntEnum):
     """Enum representing command access tiers."""
@@ -66,7 +70,7 @@ class PremiumChecker:
     async def has_active_bypass(self, ctx: commands.Context) -> bool:
         """Check if user has active T (bypass)."""
         try:
-            async with self.bot.get_db() as session:
+            async with self.bot.get_read_db() as session:
                 bypass_until = await MemberQueries.get_voice_bypass_status(session, ctx.author.id)
                 return bypass_until is not None and bypass_until > datetime.now(timezone.utc)
         except Exception as e:
@@ -79,39 +83,15 @@ class PremiumChecker:
 
     def has_discord_invite_in_status(self, ctx: commands.Context) -> bool:
         """Check if user has 'discord.gg/zagadka' in their status."""
-        target_text = "discord.gg/zagadka"
-
-        # Check activities (games, spotify, etc.)
-        if ctx.author.activities:
-            for activity in ctx.author.activities:
-                # Check activity name
-                if hasattr(activity, "name") and activity.name and target_text in activity.name.lower():
-                    return True
-                # Check activity details
-                if hasattr(activity, "details") and activity.details and target_text in activity.details.lower():
-                    return True
-                # Check activity state
-                if hasattr(activity, "state") and activity.state and target_text in activity.state.lower():
-                    return True
-                # Check custom status (discord.CustomActivity)
-                if isinstance(activity, discord.CustomActivity):
-                    if activity.name and target_text in activity.name.lower():
-                        return True
+        # Check activities (games, spotify, custom status, etc.)
+        if INVITE_STATUS_MATCHER.scan_activities(ctx.author.activities):
+            return True
 
         # Try through guild member as well
         try:
             guild_member = ctx.guild.get_member(ctx.author.id)
-            if guild_member and guild_member.activities:
-                for activity in guild_member.activities:
-                    if hasattr(activity, "name") and activity.name and target_text in activity.name.lower():
-                        return True
-                    if hasattr(activity, "details") and activity.details and target_text in activity.details.lower():
-                        return True
-                    if hasattr(activity, "state") and activity.state and target_text in activity.state.lower():
-                        return True
-                    if isinstance(activity, discord.CustomActivity):
-                        if activity.name and target_text in activity.name.lower():
-                            return True
+            if guild_member and INVITE_STATUS_MATCHER.scan_activities(guild_member.activities):
+                return True
         except Exception:
             pass
 
@@ -134,7 +114,7 @@ class PremiumChecker:
                 return False
 
             # Check invite count (with validation like legacy system)
-            async with self.bot.get_db() as session:
+            async with self.bot.get_read_db() as session:
                 invite_repo = InviteRepository(session)
                 invite_count = await invite_repo.get_member_valid_invite_count(ctx.author.id, ctx.guild, min_days=7)
                 logger.debug(f"User {ctx.author.id} has {invite_count} valid invites")
@@ -148,7 +128,7 @@ class PremiumChecker:
         has_booster = self.has_booster_roles(ctx)
         has_status = self.has_discord_invite_in_status(ctx)
 
-        async with self.bot.get_db() as session:
+        async with self.bot.get_read_db() as session:
             invite_repo = InviteRepository(session)
             invite_count = await invite_repo.get_member_valid_invite_count(ctx.author.id, ctx.guild, min_days=7)
 
@@ -220,14 +200,10 @@ class PremiumChecker:
             bool: True if user has the required tier or higher
         """
         min_level = self.PREMIUM_ROLE_LEVELS.get(min_tier, 0)
-        user_roles = [role.name for role in ctx.author.roles]
 
         # Check if user has any premium role at or above the required level
-        for role_name, level in self.PREMIUM_ROLE_LEVELS.items():
-            if level >= min_level and role_name in user_roles:
-                return True
-
-        return False
+        role_names = [role_name for role_name, level in self.PREMIUM_ROLE_LEVELS.items() if level >= min_level]
+        return self.bot.role_ids.has_any_named(ctx.author, role_names)
 
     @staticmethod
     def requires_premium_tier(command_name: str):
@@ -0,0 +1,109 @@
+"""Config-derived role ID sets for fast role membership checks."""
+
+import logging
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# Used when config has no mute role described as points_off
+DEFAULT_POINTS_OFF_ROLE_NAME = "♺"
+
+
+class RoleIdIndex:
+    """
+    Role IDs resolved once from config and the guild's role list.
+
+    Hot paths check membership by role ID via ``member.get_role`` instead of
+    scanning config and comparing role names on every event. Call ``resolve``
+    at startup, after a config reload and when guild roles change.
+    """
+
+    def __init__(self, config: dict):
+        self.config = config
+        self._resolved = False
+        self._ids_by_name: Dict[str, Set[int]] = {}
+        self._names_cache: Dict[FrozenSet[str], FrozenSet[int]] = {}
+        self._premium_by_id: Dict[int, dict] = {}
+        self.points_off_ids: FrozenSet[int] = frozenset()
+        self.premium_ids: FrozenSet[int] = frozenset()
+        self._resolve_points_off()
+
+    @property
+    def is_resolved(self) -> bool:
+        """Whether role names have been resolved against a guild."""
+        return self._resolved
+
+    def resolve(self, guild=None, config: Optional[dict] = None) -> None:
+        """Rebuild all role ID sets from config and, if given, the guild's roles."""
+        if config is not None:
+            self.config = config
+
+        self._names_cache = {}
+        self._ids_by_name = {}
+        if guild is not None:
+            for role in guild.roles:
+                self._ids_by_name.setdefault(role.name, set()).add(role.id)
+
+        self._resolve_points_off()
+
+        self._premium_by_id = {}
+        for role_config in self.config.get("premium_roles", []):
+            for role_id in self._ids_by_name.get(role_config["name"], ()):
+                self._premium_by_id[role_id] = role_config
+        self.premium_ids = frozenset(self._premium_by_id)
+
+        self._resolved = guild is not None
+        logger.info(f"Resolved role IDs: points_off={len(self.points_off_ids)}, premium={len(self.premium_ids)}")
+
+    def _resolve_points_off(self) -> None:
+        ids = {
+            role_config["id"]
+            for role_config in self.config.get("mute_roles", [])
+            if role_config.get("description") == "points_off" and role_config.get("id")
+        }
+        if not ids:
+            # Fallback to the hardcoded role name if config has no points_off entry
+            ids = self._ids_by_name.get(DEFAULT_POINTS_OFF_ROLE_NAME, set())
+        self.points_off_ids = frozenset(ids)
+
+    def ids_for_names(self, names: Iterable[str]) -> FrozenSet[int]:
+        """IDs of guild roles with any of the given names, cached per name set."""
+        key = frozenset(names)
+        ids = self._names_cache.get(key)
+        if ids is None:
+            ids = frozenset(role_id for name in key for role_id in self._ids_by_name.get(name, ()))
+            self._names_cache[key] = ids
+        return ids
+
+    @staticmethod
+    def has_any(member, role_ids: Iterable[int]) -> bool:
+        """Check whether the member has any of the given role IDs."""
+        return any(member.get_role(role_id) is not None for role_id in role_ids)
+
+    def has_points_off(self, member) -> bool:
+        """Check whether the member has the points_off role."""
+        if not self.points_off_ids and not self._resolved:
+            return any(role.name == DEFAULT_POINTS_OFF_ROLE_NAME for role in member.roles)
+        return self.has_any(member, self.points_off_ids)
+
+    def has_any_named(self, member, names: Iterable[str]) -> bool:
+        """Check whether the member has a role with any of the given names."""
+        if not self._resolved:
+            names = set(names)
+            return any(role.name in names for role in member.roles)
+        return self.has_any(member, self.ids_for_names(names))
+
+    def premium_roles_of(self, member) -> List[dict]:
+        """Config entries of all premium roles the member has."""
+        if not self._resolved:
+            names = {role.name for role in member.roles}
+            return [role_config for role_config in self.config.get("premium_roles", []) if role_config["name"] in names]
+        return [
+            role_config for role_id, role_config in self._premium_by_id.items() if member.get_role(role_id) is not None
+        ]
+
+    def has_premium(self, member) -> bool:
+        """Check whether the member has any premium role."""
+        if not self._resolved:
+            return bool(self.premium_roles_of(member))
+        return self.has_any(member, self.premium_ids)
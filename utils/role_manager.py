@@ -13,6 +13,7 @@ import discord
 from discord import AllowedMentions
 
 from core.repositories import NotificationRepository, RoleRepository
+from core.services.premium_cache import get_premium_cache
 
 logger = logging.getLogger(__name__)
 
@@ -100,6 +101,8 @@ class RoleManager:
 
         # Lista powiadomień do wysłania po commit
         notifications_to_send = []
+        # Użytkownicy, których role usunięto z bazy (do unieważnienia cache premium po commit)
+        changed_member_ids = set()
 
         try:
             # Zapamiętaj poprzedni stan pominiętych członków dla tego klucza
@@ -171,6 +174,7 @@ class RoleManager:
                             stats["non_existent_members"] += 1
                             stats["skipped_member_ids"].add(member_role.member_id)
                             await role_repo.delete_member_role(member_role.member_id, member_role.role_id)
+                            changed_member_ids.add(member_role.member_id)
                             removed_count += 1  # Count DB removal as an action
                             stats["removed_count"] += 1
 
@@ -214,6 +218,7 @@ class RoleManager:
                         stats["non_existent_roles"] += 1
                         stats["skipped_role_ids"].add(member_role.role_id)
                         await role_repo.delete_member_role(member_role.member_id, member_role.role_id)
+                        changed_member_ids.add(member_role.member_id)
                         removed_count += 1  # Count DB removal
                         stats["removed_count"] += 1
                         continue
@@ -224,6 +229,7 @@ class RoleManager:
                         )
                         stats["roles_not_assigned"] += 1
                         await role_repo.delete_member_role(member_role.member_id, member_role.role_id)
+                        changed_member_ids.add(member_role.member_id)
                         removed_count += 1  # Count DB removal
                         stats["removed_count"] += 1
 
@@ -298,6 +304,7 @@ class RoleManager:
                                 await role_repo.delete_member_role(
                                     member_role_db_entry.member_id, member_role_db_entry.role_id
                                 )
+                                changed_member_ids.add(member_role_db_entry.member_id)
                                 removed_count += 1
                                 stats["removed_count"] += 1
                                 logger.debug(
@@ -418,6 +425,11 @@ class RoleManager:
 
                 await session.commit()
 
+                # Usunięte role nie mogą zostać w cache premium (np. przy sprzedaży roli)
+                premium_cache = get_premium_cache(self.bot)
+                for member_id in changed_member_ids:
+                    await premium_cache.invalidate_member(member_id)
+
                 # Wyślij powiadomienia DOPIERO PO commit
                 for notification_data in notifications_to_send:
                     try:
@@ -2,6 +2,9 @@
 
 from .autokick import AutoKickManager
 from .channel import ChannelModManager, VoiceChannelManager
+from .channel_pool import VoiceChannelPool
+from .event_pipeline import VoiceEventPipeline, VoiceUpdate
+from .overwrites import OverwritePlan
 from .permissions import BasePermissionCommand, PermissionChecker, VoicePermissionManager
 
 __all__ = [
@@ -11,4 +14,8 @@ __all__ = [
     "VoiceChannelManager",
     "ChannelModManager",
     "AutoKickManager",
+    "OverwritePlan",
+    "VoiceChannelPool",
+    "VoiceEventPipeline",
+    "VoiceUpdate",
 ]
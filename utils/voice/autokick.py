@@ -3,10 +3,9 @@
 import logging
 
 import discord
-from sqlalchemy import select
 
+from core.performance.autokick_index import autokick_index
 from core.repositories import AutoKickRepository
-from datasources.models import AutoKick
 from utils.message_sender import MessageSender
 
 logger = logging.getLogger(__name__)
@@ -18,54 +17,28 @@ class AutoKickManager:
     def __init__(self, bot):
         self.bot = bot
         self.message_sender = MessageSender()
-        # Cache structure: {target_id: set(owner_ids)}
-        self._autokick_cache = {}
-        self._cache_initialized = False
+        # Shared by every manager instance; the repository keeps it in step with the database
+        self.index = autokick_index
         self.logger = logging.getLogger(__name__)
 
     async def _initialize_cache(self):
-        """Initialize the cache with data from database"""
-        if self._cache_initialized:
-            return
-
+        """Load the autokick index on first use if startup has not loaded it yet"""
         try:
-            async with self.bot.get_db() as session:
-                # Get all autokicks using SQLAlchemy ORM
-                result = await session.execute(select(AutoKick.target_id, AutoKick.owner_id))
-                rows = result.all()
-
-                # Clear existing cache
-                self._autokick_cache.clear()
-
-                # Build the cache
-                for target_id, owner_id in rows:
-                    if target_id not in self._autokick_cache:
-                        self._autokick_cache[target_id] = set()
-                    self._autokick_cache[target_id].add(owner_id)
-                    self.logger.info(f"Added autokick: target={target_id}, owner={owner_id}")
-
-                self.logger.info(f"Cache initialized with {len(rows)} entries")
-                self._cache_initialized = True
+            await self.index.ensure_loaded(self.bot.get_db)
         except Exception as e:
             self.logger.error(f"Failed to initialize cache: {str(e)}")
-            self._cache_initialized = False
             raise
 
     async def _reset_cache(self):
-        """Force reset the cache"""
-        self._cache_initialized = False
-        self._autokick_cache.clear()
-        await self._initialize_cache()
+        """Force reload the index from the database"""
+        await self.index.load(self.bot.get_db)
 
     async def get_autokick_limit(self, member: discord.Member) -> int:
         """Get the autokick limit for a member based on their premium roles."""
-        max_autokicks = 0
-        for role_config in self.bot.config["premium_roles"]:
-            if "auto_kick" in role_config:
-                role = discord.utils.get(member.roles, name=role_config["name"])
-                if role:
-                    max_autokicks = max(max_autokicks, role_config["auto_kick"])
-        return max_autokicks
+        return max(
+            (role_config.get("auto_kick", 0) for role_config in self.bot.role_ids.premium_roles_of(member)),
+            default=0,
+        )
 
     async def add_autokick(self, ctx, target: discord.Member):
         """Add a member to autokick list."""
@@ -77,31 +50,29 @@ class AutoKickManager:
                 await self.message_sender.send_no_autokick_permission(ctx, self.bot.config["channels"]["premium_info"])
                 return
 
-            # Check cache for existing autokicks count
-            owner_autokicks_count = sum(1 for owners in self._autokick_cache.values() if ctx.author.id in owners)
+            # Check and claim in one step, so concurrent "+" requests cannot both pass the limit
+            reservation = await self.index.reserve(ctx.author.id, target.id, max_autokicks)
 
-            if owner_autokicks_count >= max_autokicks:
+            if reservation == "limit":
                 await self.message_sender.send_autokick_limit_reached(
                     ctx, max_autokicks, self.bot.config["channels"]["premium_info"]
                 )
                 return
 
-            # Check if autokick already exists
-            if target.id in self._autokick_cache and ctx.author.id in self._autokick_cache[target.id]:
+            if reservation == "exists":
                 await self.message_sender.send_autokick_already_exists(ctx, target)
                 return
 
-            # Update cache
-            if target.id not in self._autokick_cache:
-                self._autokick_cache[target.id] = set()
-            self._autokick_cache[target.id].add(ctx.author.id)
-
-            # Update database
-            async with self.bot.get_db() as session:
-                autokick_repo = AutoKickRepository(session)
-                await autokick_repo.add_autokick(ctx.author.id, target.id)
-                self.logger.info(f"Added autokick: owner={ctx.author.id}, target={target.id}")
-                await self.message_sender.send_autokick_added(ctx, target)
+            # Update database; the reservation is dropped if the write fails
+            try:
+                async with self.bot.get_db() as session:
+                    autokick_repo = AutoKickRepository(session)
+                    await autokick_repo.add_autokick(ctx.author.id, target.id)
+            except Exception:
+                self.index.remove(ctx.author.id, target.id)
+                raise
+            self.logger.info(f"Added autokick: owner={ctx.author.id}, target={target.id}")
+            await self.message_sender.send_autokick_added(ctx, target)
         except Exception as e:
             self.logger.error(f"Error in add_autokick: {str(e)}")
             await self._reset_cache()
@@ -112,17 +83,12 @@ class AutoKickManager:
         try:
             await self._initialize_cache()
 
-            # Check cache first
-            if target.id not in self._autokick_cache or ctx.author.id not in self._autokick_cache[target.id]:
+            # Check index first
+            if (ctx.author.id, target.id) not in self.index:
                 await self.message_sender.send_autokick_not_found(ctx, target)
                 return
 
-            # Update cache
-            self._autokick_cache[target.id].remove(ctx.author.id)
-            if not self._autokick_cache[target.id]:
-                del self._autokick_cache[target.id]
-
-            # Update database
+            # Update database (the repository updates the index after commit)
             async with self.bot.get_db() as session:
                 autokick_repo = AutoKickRepository(session)
                 await autokick_repo.remove_autokick(ctx.author.id, target.id)
@@ -138,7 +104,7 @@ class AutoKickManager:
         await self._initialize_cache()
 
         # Get all targets that this user has autokick on
-        user_autokicks = [target_id for target_id, owners in self._autokick_cache.items() if ctx.author.id in owners]
+        user_autokicks = self.index.targets_of(ctx.author.id)
 
         if not user_autokicks:
             await self.message_sender.send_autokick_list_empty(ctx)
@@ -155,30 +121,9 @@ class AutoKickManager:
         try:
             await self._initialize_cache()
 
-            # self.logger.info(f"Checking autokick for member {member.id} in channel {channel.id}")
-            # self.logger.info(
-            #     f"Current cache state for member {member.id}: {self._autokick_cache.get(member.id, set())}"
-            # )
-
-            if member.id not in self._autokick_cache:
-                # self.logger.info(f"Member {member.id} not in autokick cache")
-                return False, set()
-
-            # Check if any channel members have autokick on this member
-            channel_member_ids = {m.id for m in channel.members}
-            # self.logger.info(f"Channel {channel.id} members: {channel_member_ids}")
-
-            owner_ids = self._autokick_cache[member.id]
-            # self.logger.info(f"Owners who have autokick on member {member.id}: {owner_ids}")
-
-            # Check intersection between channel members and owners who have autokick
-            matching_owners = owner_ids.intersection(channel_member_ids)
-            if matching_owners:
-                # self.logger.info(f"Found matching owners in channel: {matching_owners}")
-                return True, matching_owners
-
-            # self.logger.info(f"No matching owners found for member {member.id}")
-            return False, set()
+            # Owners present in the channel who have autokick on this member
+            matching_owners = self.index.matching_owners(member.id, (m.id for m in channel.members))
+            return bool(matching_owners), matching_owners
         except Exception as e:
             self.logger.error(f"Error in check_autokick: {str(e)}")
             # Try to recover by resetting cache
@@ -0,0 +1,197 @@
+"""Pool of clean, empty voice channels kept ready per category."""
+
+import asyncio
+import logging
+import random
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Set
+
+import discord
+
+logger = logging.getLogger(__name__)
+
+
+class VoiceChannelPool:
+    """
+    Keeps ``size`` empty, reset voice channels per configured category.
+
+    Joining a create channel takes a ready channel from the pool instead of
+    waiting for ``guild.create_voice_channel``. The pool refills in the
+    background, one channel every ``create_interval`` seconds, and channels
+    released after their last member left are reset off the event path.
+
+    Only categories with a ``channel_name_formats`` entry are pooled: their
+    channel names do not depend on the owner, so a ready channel never needs
+    a rename (Discord allows two per channel every ten minutes).
+    """
+
+    def __init__(self, bot, permission_manager, sizes: Dict[int, int], create_interval: float = 1.0):
+        self.bot = bot
+        self.permission_manager = permission_manager
+        self.sizes = sizes
+        self.create_interval = create_interval
+        self.guild: Optional[discord.Guild] = None
+
+        # Channel IDs ready to be assigned, oldest first, and channels being reset
+        self._ready: Dict[int, Deque[int]] = {category_id: deque() for category_id in sizes}
+        self._resetting: Dict[int, Set[int]] = {category_id: set() for category_id in sizes}
+        self._refills: Dict[int, asyncio.Task] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+        self.stats = {
+            "acquired": 0,
+            "misses": 0,
+            "created": 0,
+            "released": 0,
+            "create_failures": 0,
+            "reset_failures": 0,
+        }
+
+    @classmethod
+    def from_config(cls, bot, permission_manager) -> "VoiceChannelPool":
+        """Pool sizes from the ``voice_channel_pool`` config section (size 0 disables a category)."""
+        section = bot.config.get("voice_channel_pool", {}) or {}
+        formats = bot.config.get("channel_name_formats", {}) or {}
+        default_size = int(section.get("size", 0))
+        overrides = section.get("sizes", {}) or {}
+
+        sizes = {}
+        for category_id in bot.config.get("vc_categories", []):
+            if category_id not in formats and str(category_id) not in formats:
+                continue
+            size = int(overrides.get(category_id, overrides.get(str(category_id), default_size)))
+            if size > 0:
+                sizes[category_id] = size
+        return cls(bot, permission_manager, sizes, float(section.get("create_interval", 1.0)))
+
+    def manages(self, category_id: Optional[int]) -> bool:
+        return category_id in self.sizes
+
+    def start(self, guild: discord.Guild) -> None:
+        """Adopt the empty channels already in pooled categories, then fill every category up to its size."""
+        self.guild = guild
+        for category_id in self.sizes:
+            category = guild.get_channel(category_id)
+            if category is None:
+                logger.warning(f"Pooled voice category {category_id} not found")
+                continue
+            for channel in category.voice_channels:
+                if self._is_free(channel):
+                    self._begin_reset(channel, category_id)
+            self._schedule_refill(category_id)
+        logger.info(f"Voice channel pool started for {len(self.sizes)} categories")
+
+    def stop(self) -> None:
+        for task in list(self._tasks) + list(self._refills.values()):
+            task.cancel()
+
+    def acquire(self, category) -> Optional[discord.VoiceChannel]:
+        """A ready channel of the category, or ``None`` if the pool is empty (the caller creates one)."""
+        ready = self._ready.get(category.id)
+        if ready is None or self.guild is None:
+            return None
+
+        channel = None
+        while ready:
+            candidate = self.guild.get_channel(ready.popleft())
+            # Deleted meanwhile or someone joined it directly: no longer free
+            if candidate is not None and not candidate.members:
+                channel = candidate
+                break
+
+        self.stats["acquired" if channel else "misses"] += 1
+        self._schedule_refill(category.id)
+        return channel
+
+    def release(self, channel) -> bool:
+        """Take back a channel whose last member left; ``False`` means the pool is full and the caller deletes it."""
+        category_id = channel.category.id if channel.category else None
+        if not self.manages(category_id):
+            return False
+        if channel.id in self._ready[category_id] or channel.id in self._resetting[category_id]:
+            return True
+        if self._available(category_id) >= self.sizes[category_id]:
+            return False
+
+        self.stats["released"] += 1
+        self._begin_reset(channel, category_id)
+        return True
+
+    def _available(self, category_id: int) -> int:
+        return len(self._ready[category_id]) + len(self._resetting[category_id])
+
+    def _is_free(self, channel) -> bool:
+        return (
+            not channel.members
+            and channel.id not in self.bot.config["channels_create"]
+            and channel.id != self.bot.config["channels_voice"]["afk"]
+        )
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _begin_reset(self, channel, category_id: int) -> None:
+        self._resetting[category_id].add(channel.id)
+        self._spawn(self._reset(channel, category_id))
+
+    async def _reset(self, channel, category_id: int) -> None:
+        """Clean overwrites and the default user limit in one edit, then hand the channel back to the pool."""
+        try:
+            plan = self.permission_manager.clean_channel_plan(channel)
+            await plan.apply(channel, user_limit=self.permission_manager._get_default_user_limit(category_id))
+            if not channel.members:
+                self._ready[category_id].append(channel.id)
+        except Exception as e:
+            self.stats["reset_failures"] += 1
+            logger.error(f"Failed to reset pooled voice channel {channel.id}: {e}")
+        finally:
+            self._resetting[category_id].discard(channel.id)
+
+    def _schedule_refill(self, category_id: int) -> None:
+        task = self._refills.get(category_id)
+        if task is None or task.done():
+            self._refills[category_id] = asyncio.create_task(self._refill(category_id))
+
+    async def _refill(self, category_id: int) -> None:
+        """Create channels one at a time until the category is back at its size."""
+        category = self.guild.get_channel(category_id) if self.guild else None
+        if category is None:
+            return
+
+        while self._available(category_id) < self.sizes[category_id]:
+            try:
+                channel = await self._create(category)
+            except Exception as e:
+                # Retried on the next acquire
+                self.stats["create_failures"] += 1
+                logger.error(f"Failed to create pooled voice channel in category {category_id}: {e}")
+                return
+            self.stats["created"] += 1
+            self._ready[category_id].append(channel.id)
+            # Spread creations out instead of bursting REST calls when many channels are taken at once
+            await asyncio.sleep(self.create_interval)
+
+    async def _create(self, category) -> discord.VoiceChannel:
+        formats = self.bot.config.get("channel_name_formats", {})
+        name_format = formats.get(category.id) or formats.get(str(category.id))
+        name = name_format.format(emoji=random.choice(self.bot.config.get("channel_emojis", ["🎮"])))
+
+        overwrites = self.permission_manager.get_mute_role_overwrites(self.guild)
+        overwrites[self.guild.default_role] = self.permission_manager._get_clean_everyone_permissions()
+        return await self.guild.create_voice_channel(
+            name,
+            category=category,
+            bitrate=self.guild.bitrate_limit,
+            user_limit=self.permission_manager._get_default_user_limit(category.id),
+            overwrites={target: overwrite for target, overwrite in overwrites.items() if target is not None},
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters and the number of ready channels per category."""
+        return {
+            **self.stats,
+            "ready": {category_id: len(ready) for category_id, ready in self._ready.items()},
+            "resetting": sum(len(channels) for channels in self._resetting.values()),
+        }
@@ -0,0 +1,180 @@
+"""Per-member coalescing and ordering of voice state events."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+import discord
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class VoiceUpdate:
+    """Net voice state change of one member over a burst of events."""
+
+    member: discord.Member
+    # State before the burst's first event and after its last one
+    before: discord.VoiceState
+    after: discord.VoiceState
+    # Every channel the member left during the burst, in order, without duplicates
+    channels_left: List[Any] = field(default_factory=list)
+    events: int = 1
+
+    def __post_init__(self):
+        self._record_leave(self.before, self.after)
+
+    @property
+    def channel_changed(self) -> bool:
+        return self.before.channel != self.after.channel
+
+    def add(self, before: discord.VoiceState, after: discord.VoiceState) -> None:
+        """Fold a later event of the same member into the update."""
+        self.after = after
+        self.events += 1
+        self._record_leave(before, after)
+
+    def _record_leave(self, before: discord.VoiceState, after: discord.VoiceState) -> None:
+        if before.channel is not None and before.channel != after.channel and before.channel not in self.channels_left:
+            self.channels_left.append(before.channel)
+
+
+VoiceUpdateHandler = Callable[[VoiceUpdate], Awaitable[None]]
+
+
+class VoiceEventPipeline:
+    """
+    Feeds ``on_voice_state_update`` to subscribers one member at a time.
+
+    Events of a member arriving within ``window`` seconds of the first are
+    merged into one ``VoiceUpdate`` (a join, leave, join burst becomes a
+    single move), and a member's next update is not handed out before the
+    previous one finished. Updates are processed by ``workers`` tasks, so
+    peak-hour channel hopping cannot start unbounded create/cleanup work.
+    """
+
+    def __init__(self, window: float = 0.3, workers: int = 4):
+        self.window = window
+        self.worker_count = workers
+        self._handlers: List[VoiceUpdateHandler] = []
+
+        # Bursts still collecting events, members queued or being processed, and pending window timers
+        self._pending: Dict[int, VoiceUpdate] = {}
+        self._busy: Set[int] = set()
+        self._timers: Dict[int, asyncio.TimerHandle] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+
+        self.stats = {
+            "events": 0,
+            "updates": 0,
+            "coalesced": 0,
+            "handler_errors": 0,
+        }
+
+    @classmethod
+    def from_config(cls, config: dict) -> "VoiceEventPipeline":
+        section = config.get("voice_events", {}) or {}
+        return cls(window=float(section.get("window", 0.3)), workers=int(section.get("workers", 4)))
+
+    @property
+    def is_running(self) -> bool:
+        return any(not worker.done() for worker in self._workers)
+
+    def subscribe(self, handler: VoiceUpdateHandler) -> None:
+        """Register a coroutine called with every ``VoiceUpdate`` (in subscription order)."""
+        if handler not in self._handlers:
+            self._handlers.append(handler)
+
+    def unsubscribe(self, handler: VoiceUpdateHandler) -> None:
+        if handler in self._handlers:
+            self._handlers.remove(handler)
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+        self._ensure_queue()
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.worker_count)]
+        logger.info(f"Voice event pipeline started: {self.worker_count} workers, {self.window}s window")
+
+    async def stop(self) -> None:
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def submit(self, member: discord.Member, before: discord.VoiceState, after: discord.VoiceState) -> None:
+        """``on_voice_state_update`` listener: record the event, never waits for processing."""
+        self.stats["events"] += 1
+        update = self._pending.get(member.id)
+        if update is not None:
+            update.add(before, after)
+            self.stats["coalesced"] += 1
+            return
+
+        self._pending[member.id] = VoiceUpdate(member, before, after)
+        # A member being processed is re-queued by the worker once it finishes
+        if member.id not in self._busy:
+            self._schedule(member.id)
+
+    def _ensure_queue(self) -> asyncio.Queue:
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        return self._queue
+
+    def _schedule(self, member_id: int) -> None:
+        if member_id in self._timers:
+            return
+        if self.window <= 0:
+            self._enqueue(member_id)
+            return
+        self._timers[member_id] = asyncio.get_running_loop().call_later(self.window, self._enqueue, member_id)
+
+    def _enqueue(self, member_id: int) -> None:
+        self._timers.pop(member_id, None)
+        if member_id in self._busy or member_id not in self._pending:
+            return
+        self._busy.add(member_id)
+        self._ensure_queue().put_nowait(member_id)
+
+    async def _worker(self) -> None:
+        queue = self._ensure_queue()
+        while True:
+            member_id = await queue.get()
+            try:
+                update = self._pending.pop(member_id, None)
+                if update is not None:
+                    await self._dispatch(update)
+            finally:
+                self._busy.discard(member_id)
+                # Events that arrived while the update was processed already waited; hand them out right away
+                if member_id in self._pending:
+                    self._enqueue(member_id)
+                queue.task_done()
+
+    async def _dispatch(self, update: VoiceUpdate) -> None:
+        self.stats["updates"] += 1
+        for handler in list(self._handlers):
+            try:
+                await handler(update)
+            except Exception as e:
+                self.stats["handler_errors"] += 1
+                logger.error(
+                    f"Voice update handler {handler.__qualname__} failed for member {update.member.id}: {e}",
+                    exc_info=True,
+                )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters plus the number of members waiting or being processed."""
+        return {
+            **self.stats,
+            "pending": len(self._pending),
+            "busy": len(self._busy),
+            "workers": self.worker_count,
+        }
@@ -0,0 +1,87 @@
+"""Plan a voice channel's final permission overwrites and apply them with a single API call."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+import discord
+
+logger = logging.getLogger(__name__)
+
+
+def combine_overwrites(
+    base: discord.PermissionOverwrite, extra: discord.PermissionOverwrite
+) -> discord.PermissionOverwrite:
+    """``base`` with every explicitly set value of ``extra`` applied on top."""
+    values = dict(base._values)
+    values.update({name: value for name, value in extra._values.items() if value is not None})
+    return discord.PermissionOverwrite(**values)
+
+
+class OverwritePlan:
+    """
+    Desired final overwrite map of one channel.
+
+    Every ``channel.set_permissions`` is a separate rate-limited REST request;
+    the plan is built in memory, diffed against ``channel.overwrites`` and sent
+    as one ``channel.edit(overwrites=...)`` only if something changed.
+    """
+
+    def __init__(self, overwrites: Optional[Mapping[Any, discord.PermissionOverwrite]] = None):
+        self.overwrites: Dict[Any, discord.PermissionOverwrite] = {}
+        for target, overwrite in (overwrites or {}).items():
+            self.set(target, overwrite)
+
+    @classmethod
+    def from_channel(cls, channel, keep: Optional[Callable[[Any], bool]] = None) -> "OverwritePlan":
+        """Start from the channel's current overwrites, or only those matching ``keep``."""
+        overwrites = channel.overwrites
+        return cls({target: overwrite for target, overwrite in overwrites.items() if keep is None or keep(target)})
+
+    def __contains__(self, target) -> bool:
+        return target in self.overwrites
+
+    def __len__(self) -> int:
+        return len(self.overwrites)
+
+    def set(self, target, overwrite: discord.PermissionOverwrite) -> None:
+        """Replace the target's overwrite (targets that did not resolve, i.e. ``None``, are ignored)."""
+        if target is not None:
+            self.overwrites[target] = overwrite
+
+    def merge(self, target, overwrite: discord.PermissionOverwrite) -> None:
+        """Apply the explicitly set values of ``overwrite`` on top of the target's planned overwrite."""
+        if target is None:
+            return
+        current = self.overwrites.get(target)
+        self.overwrites[target] = overwrite if current is None else combine_overwrites(current, overwrite)
+
+    def remove(self, target) -> None:
+        self.overwrites.pop(target, None)
+
+    def diff(
+        self, current: Mapping[Any, discord.PermissionOverwrite]
+    ) -> Tuple[Dict[Any, discord.PermissionOverwrite], List[Any]]:
+        """Targets whose overwrite would be added or changed, and targets that would be removed."""
+        changed = {
+            target: overwrite for target, overwrite in self.overwrites.items() if current.get(target) != overwrite
+        }
+        removed = [target for target in current if target not in self.overwrites]
+        return changed, removed
+
+    async def apply(self, channel, reason: Optional[str] = None, **edit_kwargs) -> bool:
+        """Send the plan (plus other channel fields, e.g. ``user_limit``) in one edit; returns whether one was sent."""
+        changed, removed = self.diff(channel.overwrites)
+        fields = {name: value for name, value in edit_kwargs.items() if getattr(channel, name, None) != value}
+        if not changed and not removed and not fields:
+            return False
+
+        if changed or removed:
+            fields["overwrites"] = self.overwrites
+        await channel.edit(reason=reason, **fields)
+        logger.info(
+            f"Applied overwrites to {channel.name} in one request: "
+            f"{len(changed)} changed, {len(removed)} removed, fields: {sorted(fields)}"
+        )
+        return True
@@ -1,15 +1,17 @@
 """Voice channel permission management utilities."""
 
 import logging
-from typing import Literal, Optional
+from typing import Literal, Optional, Tuple
 
 import discord
 from discord import PermissionOverwrite
 from discord.ext import commands
 
+from core.performance.voice_permission_cache import voice_permission_cache
 from core.repositories.channel_repository import ChannelRepository
 from utils.channel_permissions import ChannelPermissionManager
 from utils.message_sender import MessageSender
+from utils.voice.overwrites import OverwritePlan
 
 logger = logging.getLogger(__name__)
 
@@ -79,23 +81,8 @@ class BasePermissionCommand:
                 return
 
             permission_value = permission_value or "+"  # domyślnie dodajemy do listy
-            
-            # Try using new adapter if available
-            if hasattr(cog, 'voice_adapter'):
-                try:
-                    success = await cog.voice_adapter.autokick(ctx, target, permission_value)
-                    if success:
-                        # Send appropriate message
-                        if permission_value == "+":
-                            await cog.message_sender.send_autokick_added(ctx, target)
-                        else:
-                            await cog.message_sender.send_autokick_removed(ctx, target)
-                        self.logger.info(f"Used new adapter for autokick: {permission_value} {target}")
-                        return
-                except Exception as e:
-                    self.logger.warning(f"Failed to use voice adapter: {e}")
-            
-            # Fallback to old method
+
+            # Lista autokick właściciela; join sprawdza ją w indeksie w pamięci
             if permission_value == "+":
                 await cog.autokick_manager.add_autokick(ctx, target)
             elif permission_value == "-":
@@ -412,25 +399,37 @@ class VoicePermissionManager:
         Returns:
             dict: A dictionary of permission overwrites
         """
-        # Initialize mute roles dictionary
-        mute_roles = {role["description"]: guild.get_role(role["id"]) for role in self.bot.config["mute_roles"]}
-
         # Set up permission overwrites
+        overwrites = self.get_mute_role_overwrites(guild)
+        overwrites[owner] = PermissionOverwrite(
+            view_channel=True,
+            connect=True,
+            speak=True,
+            priority_speaker=True,
+            manage_messages=True,
+        )
+        return overwrites
+
+    def get_mute_role_overwrites(self, guild: discord.Guild) -> dict:
+        """Overwrites of the mute roles, present on every voice channel whoever owns it."""
+        mute_roles = {role["description"]: guild.get_role(role["id"]) for role in self.bot.config["mute_roles"]}
         return {
             mute_roles["stream_off"]: PermissionOverwrite(stream=False),
             mute_roles["send_messages_off"]: PermissionOverwrite(send_messages=False),
             mute_roles["attach_files_off"]: PermissionOverwrite(
                 attach_files=False, embed_links=False, external_emojis=False
             ),
-            owner: PermissionOverwrite(
-                view_channel=True,
-                connect=True,
-                speak=True,
-                priority_speaker=True,
-                manage_messages=True,
-            ),
         }
 
+    def clean_channel_plan(self, channel: discord.VoiceChannel) -> OverwritePlan:
+        """Overwrites of an ownerless channel: its mute role overwrites and clean @everyone."""
+        mute_role_ids = {role["id"] for role in self.bot.config["mute_roles"]}
+        plan = OverwritePlan.from_channel(
+            channel, keep=lambda target: isinstance(target, discord.Role) and target.id in mute_role_ids
+        )
+        plan.set(channel.guild.default_role, self._get_clean_everyone_permissions())
+        return plan
+
     def _get_clean_everyone_permissions(self) -> PermissionOverwrite:
         """Get clean/default permissions for @everyone role in max/public channels."""
         return PermissionOverwrite(
@@ -705,15 +704,16 @@ class VoicePermissionManager:
             channel: The voice channel to sync permissions to
             is_public: If True, don't sync permissions from database (for public channels)
         """
+        # Limit, @everyone i uprawnienia z bazy trafiają na kanał jednym wywołaniem API
+        plan = OverwritePlan.from_channel(channel)
+        edit_fields = {}
+
         # Ustaw domyślny limit użytkowników
         if channel.category:
             user_limit = self._get_default_user_limit(channel.category.id)
             if user_limit > 0:
                 self.logger.info(f"Setting user limit to {user_limit} for channel in category {channel.category.id}")
-                try:
-                    await channel.edit(user_limit=user_limit)
-                except Exception as e:
-                    self.logger.error(f"Failed to set user limit: {str(e)}", exc_info=True)
+                edit_fields["user_limit"] = user_limit
 
         # Sprawdź czy kanał jest w kategorii gdzie @everyone ma mieć czyste permisje
         clean_perms_category = channel.category and channel.category.id in self.bot.config.get(
@@ -721,48 +721,56 @@ class VoicePermissionManager:
         )
         if clean_perms_category:
             # Ustaw czyste permisje dla @everyone
-            clean_perms = self._get_clean_everyone_permissions()
-            try:
-                await channel.set_permissions(channel.guild.default_role, overwrite=clean_perms)
-                self.logger.info(f"Set clean permissions for @everyone in channel {channel.name}")
-            except Exception as e:
-                self.logger.error(f"Failed to set clean permissions: {str(e)}", exc_info=True)
+            plan.set(channel.guild.default_role, self._get_clean_everyone_permissions())
 
         # Dla kanałów publicznych nie synchronizujemy uprawnień z bazy
-        if is_public:
-            return
-
-        # Dla kanałów prywatnych synchronizujemy uprawnienia z bazy
-        async with self.bot.get_db() as session:
-            channel_repo = ChannelRepository(session)
-            # Pobierz wszystkie uprawnienia z bazy dla tego właściciela
-            db_permissions = await channel_repo.get_permissions_for_member(ctx.author.id)
-
-            # Dla każdego uprawnienia w bazie
-            for perm in db_permissions:
+        if not is_public:
+            # Wszystkie uprawnienia właściciela z bazy (snapshot z cache)
+            for target_id, overwrite in await self.get_owner_overwrites(ctx.author.id):
                 # Pomijamy uprawnienia dla roli @everyone dla kanałów z czystymi permisjami
-                if perm.target_id == channel.guild.id and clean_perms_category:
+                if target_id == channel.guild.id and clean_perms_category:
                     self.logger.info(
                         f"Skipping @everyone permissions from DB for channel {channel.name} in clean perms category"
                     )
                     continue
 
-                target = ctx.guild.get_member(perm.target_id)
-                if target:
-                    # Konwertuj bity uprawnień na obiekt PermissionOverwrite
-                    allow_perms = discord.Permissions(perm.allow_permissions_value)
-                    deny_perms = discord.Permissions(perm.deny_permissions_value)
+                plan.set(ctx.guild.get_member(target_id), overwrite)
 
-                    overwrite = discord.PermissionOverwrite()
-                    for perm_name, value in allow_perms:
-                        if value:
-                            setattr(overwrite, perm_name, True)
-                    for perm_name, value in deny_perms:
-                        if value:
-                            setattr(overwrite, perm_name, False)
+        try:
+            await plan.apply(channel, **edit_fields)
+        except Exception as e:
+            self.logger.error(f"Failed to sync permissions for channel {channel.name}: {str(e)}", exc_info=True)
+
+    async def get_owner_overwrites(self, owner_id: int) -> Tuple[Tuple[int, PermissionOverwrite], ...]:
+        """
+        The owner's stored overwrites as ``(target_id, overwrite)`` pairs.
 
-                    # Ustaw uprawnienia na kanale
-                    await channel.set_permissions(target, overwrite=overwrite)
+        Served from the per-owner snapshot cache; the overwrites are shared
+        between callers and must not be modified.
+        """
+        return await voice_permission_cache.get_or_load(owner_id, lambda: self._load_owner_overwrites(owner_id))
+
+    def prefetch_owner_overwrites(self, owner_id: int) -> None:
+        """Start loading the owner's overwrites in the background, e.g. as soon as they join a create channel."""
+        voice_permission_cache.prefetch(owner_id, lambda: self._load_owner_overwrites(owner_id))
+
+    async def _load_owner_overwrites(self, owner_id: int) -> Tuple[Tuple[int, PermissionOverwrite], ...]:
+        # Primary database: a snapshot read from a lagging replica right after a write would be cached as current
+        async with self.bot.get_db() as session:
+            channel_repo = ChannelRepository(session)
+            member_permissions = await channel_repo.get_permissions_for_member(owner_id, limit=95)
+        self.logger.info(f"Found {len(member_permissions)} permissions in database for member {owner_id}")
+
+        return tuple(
+            (
+                permission.target_id,
+                PermissionOverwrite.from_pair(
+                    discord.Permissions(permission.allow_permissions_value),
+                    discord.Permissions(permission.deny_permissions_value),
+                ),
+            )
+            for permission in member_permissions
+        )
 
     async def add_db_overwrites_to_permissions(
         self,
@@ -781,30 +789,17 @@ class VoicePermissionManager:
             is_clean_perms: Whether this is a channel that should have clean @everyone permissions
 
         Returns:
-            dict: Additional overwrites that couldn't be added to the main dict
+            dict: Additional overwrites that couldn't be added to the main dict (shared, read-only)
         """
         remaining_overwrites = {}
-        async with self.bot.get_db() as session:
-            channel_repo = ChannelRepository(session)
-            member_permissions = await channel_repo.get_permissions_for_member(member_id, limit=95)
-            self.logger.info(f"Found {len(member_permissions)} permissions in database for member {member_id}")
-
-        for permission in member_permissions:
+        for target_id, overwrite in await self.get_owner_overwrites(member_id):
             # Skip @everyone permissions for clean_perms channels
-            if is_clean_perms and permission.target_id == guild.id:
+            if is_clean_perms and target_id == guild.id:
                 self.logger.info("Skipping @everyone permissions from DB for clean perms channel")
                 continue
 
-            allow_permissions = discord.Permissions(permission.allow_permissions_value)
-            deny_permissions = discord.Permissions(permission.deny_permissions_value)
-            overwrite = PermissionOverwrite.from_pair(allow_permissions, deny_permissions)
-            self.logger.info(
-                f"Processing permission for target {permission.target_id}: "
-                f"allow={permission.allow_permissions_value}, deny={permission.deny_permissions_value}"
-            )
-
             # Convert target_id to appropriate Discord object
-            target = guild.get_member(permission.target_id) or guild.get_role(permission.target_id)
+            target = guild.get_member(target_id) or guild.get_role(target_id)
             if target:
                 if target in permission_overwrites:
                     # If target already exists in main permissions, add new permissions to it